@@ -0,0 +1,17 @@
+"""
+Helpers shared by the benchmark scripts, for running the engine from a
+cold start.
+
+"""
+from diplomacy.engine import board, digest
+
+
+def clear_caches():
+    """
+    Empties the engine's module level caches: the boards, what has been
+    worked out from them, such as the legal orders, and the convoy
+    routes.
+
+    """
+    board.clear_caches()
+    digest._convoy_cache.clear()
@@ -0,0 +1,129 @@
+"""
+Stress benchmark for the parts of the resolver that walk the
+dependency graph: `detect_paradox` and the guessing search in
+`resolve`.  Both used to recurse once per order, which capped the size
+of the positions they could handle at Python's recursion limit.
+
+Two kinds of synthetic position are generated, far larger than the
+standard map allows:
+
+  * rings of convoy and support orders that depend on each other in
+    long cycles, for `detect_paradox`.  These are an abstract
+    dependency graph, handed straight to `detect_paradox`; there are
+    no units or map behind them, and they are never resolved, so the
+    full resolver is not exercised on cyclic convoys or supports;
+  * a single rotation of armies around a ring of land territories,
+    every move depending on the next, which the search can only settle
+    by guessing all of them at once.  This is the only workload that
+    runs through `resolve`.
+
+The engine reads the map from `standard`, so the ring territories are
+added to `standard.subregion_groups` and `standard.connectivity` while
+a rotation is resolved, and both are restored to exactly what they
+were afterwards.  Usage, from the top of the repository:
+
+    PYTHONPATH=. python benchmarks/cycles.py [--sizes 250 500 1000 2000]
+
+"""
+from __future__ import print_function
+
+import argparse
+from contextlib import contextmanager
+import sys
+import time
+
+from diplomacy.engine import standard
+from diplomacy.engine.compare import construct_dependencies
+from diplomacy.engine.resolver import detect_paradox, immediate_fails, resolve
+
+
+def paradox_graph(size, ring=50):
+    """
+    The orders and dependencies of convoys and supports in rings of
+    `ring` orders, each depending on the next.  Only the actions are
+    filled in, which is all that `detect_paradox` looks at.
+
+    """
+    orders, dep = {}, {}
+    for i in range(size):
+        T = 'cycle-{0}'.format(i)
+        orders[T] = {'action': 'C' if i % 2 else 'S'}
+        start = i - i % ring
+        dep[T] = ['cycle-{0}'.format(start + (i + 1 - start) % ring)]
+    return orders, dep
+
+
+def ring_territories(size):
+    return ['ring-{0}'.format(i) for i in range(size)]
+
+
+@contextmanager
+def ring_map(size):
+    """Adds a ring of `size` land territories to the map, for the duration of the block."""
+    subregion_groups = dict(standard.subregion_groups)
+    connectivity = dict(standard.connectivity)
+
+    territories = ring_territories(size)
+    try:
+        for i, T in enumerate(territories):
+            standard.subregion_groups[T] = ('{0}.l'.format(T),)
+            standard.connectivity['{0}.l'.format(T)] = (
+                '{0}.l'.format(territories[i - 1]),
+                '{0}.l'.format(territories[(i + 1) % size]),
+            )
+        yield
+    finally:
+        standard.subregion_groups.clear()
+        standard.subregion_groups.update(subregion_groups)
+        standard.connectivity.clear()
+        standard.connectivity.update(connectivity)
+
+
+def rotation(size):
+    """`size` armies, each moving into the territory of the next one round the ring."""
+    territories = ring_territories(size)
+    units = [{'government': 'england', 'u_type': 'A', 'subregion': '{0}.l'.format(T)}
+             for T in territories]
+    orders = {
+        T: {'government': units[i]['government'], 'actor': '{0}.l'.format(T),
+            'action': 'M', 'assist': '',
+            'target': '{0}.l'.format(territories[(i + 1) % size]),
+            'convoy': False}
+        for i, T in enumerate(territories)
+    }
+    return orders, units
+
+
+def timed(func, *args):
+    start = time.time()
+    result = func(*args)
+    return time.time() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[250, 500, 1000, 2000])
+    args = parser.parse_args()
+
+    print("recursion limit: {0}".format(sys.getrecursionlimit()))
+    print("{0:>8} {1:>16} {2:>16} {3:>10}".format(
+        'orders', 'detect_paradox', 'resolve', 'succeeded'))
+
+    for size in args.sizes:
+        orders, dep = paradox_graph(size)
+        paradox_time, paradox = timed(detect_paradox, orders, dep)
+        assert len(paradox) == size // 2
+
+        with ring_map(size):
+            orders, units = rotation(size)
+            dep = construct_dependencies(orders)
+            fails = immediate_fails(orders, units)
+            resolve_time, decisions = timed(
+                resolve, (), orders, dep, fails, detect_paradox(orders, dep), units)
+
+        print("{0:>8} {1:>15.3f}s {2:>15.3f}s {3:>10}".format(
+            size, paradox_time, resolve_time, sum(1 for T, d in decisions if d)))
+
+
+if __name__ == '__main__':
+    main()
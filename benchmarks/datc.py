@@ -0,0 +1,215 @@
+"""
+Adjudication benchmark built from the DATC test cases.
+
+The scenarios are imported from `diplomacy.tests.datc_scenarios`,
+which holds the units, orders and ownership of each DATC test that
+generates a turn as plain data, so no database is needed.  Every
+generated turn in a
+scenario is one step, chained onto the position left by the previous
+one.  Each scenario is then run through `engine.main.generate`
+repeatedly, and timed.  The engine's caches of boards and convoy
+routes are cleared before every run, so that each one starts cold
+instead of reusing the work of the run before it.
+
+For each scenario this reports:
+
+- the best and mean time of a run through all of its steps;
+- the number of memory blocks allocated by a run and still held at
+  its end, from the `tracemalloc` snapshot statistics, and the peak
+  size of the memory traced (Python 3 only);
+- the recursion depth of the adjudicator, the deepest the Python call
+  stack goes below `resolver.resolve` (or `decision.resolve`);
+- the depth and number of guesses of the search in `resolver.resolve`.
+
+Usage, from the top of the repository:
+
+    PYTHONPATH=. python benchmarks/datc.py [--repeat 20] [--json results.json]
+
+"""
+from __future__ import print_function
+
+import argparse
+from contextlib import contextmanager
+import copy
+import json
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from diplomacy.engine import resolver
+from diplomacy.engine.main import ADJUDICATORS, generate
+from diplomacy.tests.datc_scenarios import scenarios
+
+from common import clear_caches
+
+
+class CountingAdjudication(resolver.Adjudication):
+    """Records how deep, and how much, the resolver's search guesses."""
+    depth = assumptions = 0
+
+    def assume(self, T, d):
+        CountingAdjudication.assumptions += 1
+        affected = super(CountingAdjudication, self).assume(T, d)
+        CountingAdjudication.depth = max(CountingAdjudication.depth, len(self.history))
+        return affected
+
+
+@contextmanager
+def counting_search():
+    original = resolver.Adjudication
+    resolver.Adjudication = CountingAdjudication
+    CountingAdjudication.depth = CountingAdjudication.assumptions = 0
+    try:
+        yield CountingAdjudication
+    finally:
+        resolver.Adjudication = original
+
+
+class RecursionDepth(object):
+    """The deepest the call stack has gone below a call of `function`."""
+
+    def __init__(self, function):
+        self.code = function.__code__
+        self.depth = 0
+
+    def profile(self, frame, event, arg):
+        if event != 'call':
+            return
+        depth = 1
+        while frame is not None and frame.f_code is not self.code:
+            frame, depth = frame.f_back, depth + 1
+        if frame is not None:
+            self.depth = max(self.depth, depth)
+
+
+@contextmanager
+def tracking_recursion(function):
+    recursion = RecursionDepth(function)
+    original = sys.getprofile()
+    sys.setprofile(recursion.profile)
+    try:
+        yield recursion
+    finally:
+        sys.setprofile(original)
+
+
+def run(steps, adjudicator):
+    return [generate(turn, orders, units, owns, adjudicator=adjudicator)
+            for turn, orders, units, owns in steps]
+
+
+def allocations(steps, adjudicator):
+    """
+    The number of memory blocks allocated by a run and still held at
+    its end, results included, and the peak size of the memory traced
+    during the run.  Blocks allocated and freed within the run are not
+    counted, as the snapshots only see the blocks that are alive.
+
+    """
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(ignore)
+        results = run(steps, adjudicator)
+        after = tracemalloc.take_snapshot().filter_traces(ignore)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del results
+
+    count = sum(stat.count_diff for stat in after.compare_to(before, 'lineno')
+                if stat.count_diff > 0)
+    return count, peak
+
+
+def measure(scenario, repeat, adjudicator):
+    # generate modifies its arguments, so every run gets its own copy.
+    copies = [copy.deepcopy(scenario.steps) for i in range(repeat + 2)]
+
+    times = []
+    for steps in copies[:repeat]:
+        clear_caches()
+        start = time.time()
+        run(steps, adjudicator)
+        times.append(time.time() - start)
+
+    clear_caches()
+    with counting_search() as counts, tracking_recursion(ADJUDICATORS[adjudicator]) as recursion:
+        run(copies[repeat], adjudicator)
+
+    blocks = peak = None
+    if tracemalloc is not None:
+        clear_caches()
+        blocks, peak = allocations(copies[repeat + 1], adjudicator)
+
+    return {
+        'name': scenario.name,
+        'steps': len(scenario.steps),
+        'best': min(times),
+        'mean': sum(times) / len(times),
+        'allocations': blocks,
+        'peak_alloc_bytes': peak,
+        'recursion_depth': recursion.depth,
+        'search_depth': counts.depth,
+        'search_assumptions': counts.assumptions,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=20,
+                        help="runs of each scenario to time")
+    parser.add_argument('--adjudicator', choices=sorted(ADJUDICATORS), default='search')
+    parser.add_argument('--filter', default='',
+                        help="only run scenarios whose name contains this")
+    parser.add_argument('--json', metavar='FILE',
+                        help="write the results as JSON to this file ('-' for stdout)")
+    args = parser.parse_args()
+
+    results = [measure(s, args.repeat, args.adjudicator)
+               for s in scenarios() if args.filter in s.name]
+    total = {
+        'scenarios': len(results),
+        'steps': sum(r['steps'] for r in results),
+        'best': sum(r['best'] for r in results),
+        'mean': sum(r['mean'] for r in results),
+        'allocations': sum(r['allocations'] or 0 for r in results),
+        'max_recursion_depth': max([r['recursion_depth'] for r in results] or [0]),
+        'max_search_depth': max([r['search_depth'] for r in results] or [0]),
+        'search_assumptions': sum(r['search_assumptions'] for r in results),
+    }
+    report = {'adjudicator': args.adjudicator, 'repeat': args.repeat,
+              'total': total, 'scenarios': results}
+
+    if args.json == '-':
+        print(json.dumps(report, indent=2, sort_keys=True))
+        return
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    row = "{0:<100} {1:>5} {2:>10} {3:>10} {4:>8} {5:>10} {6:>9} {7:>6} {8:>8}"
+    print(row.format('scenario', 'steps', 'best ms', 'mean ms', 'allocs', 'peak KiB',
+                     'recursion', 'depth', 'guesses'))
+    for r in sorted(results, key=lambda r: -r['mean']):
+        print(row.format(
+            r['name'], r['steps'], '{0:.3f}'.format(1000 * r['best']),
+            '{0:.3f}'.format(1000 * r['mean']),
+            '-' if r['allocations'] is None else r['allocations'],
+            '-' if r['peak_alloc_bytes'] is None else r['peak_alloc_bytes'] // 1024,
+            r['recursion_depth'], r['search_depth'], r['search_assumptions']))
+    print(row.format(
+        'total ({0} scenarios)'.format(total['scenarios']), total['steps'],
+        '{0:.3f}'.format(1000 * total['best']), '{0:.3f}'.format(1000 * total['mean']),
+        total['allocations'], '', total['max_recursion_depth'], total['max_search_depth'],
+        total['search_assumptions']))
+    print("(allocs: memory blocks allocated by a run and still held at its end;"
+          " peak KiB: the most memory traced during a run)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""
+Load test for the engine: plays complete games in memory.
+
+Each game starts from `engine.main.initialize_game`.  Every turn, each
+government gives a random order to each of its units, drawn from the
+tree of legal orders (`engine.check.legal_orders`), and the turn is
+generated with `engine.main.generate`.  A game ends when a government
+holds enough supply centers to win, or after `--years` years.
+
+Reported are the turns generated per second, the median and 99th
+percentile time to generate a turn by season, and the slowest
+positions found.  With `--fixtures`, the slowest positions are written
+out as JSON, which can be run again with `--replay`.  Positions that
+make `generate` fail are written out as well.  Usage, from the top of
+the repository:
+
+    PYTHONPATH=. python benchmarks/simulate.py [--games 1000] [--fixtures DIR]
+    PYTHONPATH=. python benchmarks/simulate.py --replay DIR/*.json
+
+"""
+from __future__ import print_function
+
+import argparse
+from collections import defaultdict
+import copy
+import heapq
+import json
+import os
+import random
+import time
+
+from diplomacy.engine import standard
+from diplomacy.engine.check import legal_orders
+from diplomacy.engine.digest import supplycenters
+from diplomacy.engine.main import ADJUDICATORS, initialize_game, generate
+from diplomacy.tests.notation import as_ownership, as_unit
+
+
+VICTORY = 18
+
+
+def random_orders(rng, turn, units, owns):
+    """A random legal order for every actor of every government."""
+    orders = []
+    for government, tree in sorted(legal_orders(units, owns, turn['season']).items()):
+        actors = sorted(a for a in tree if a)
+        if turn['season'] == 'FA':
+            # Builds and disbands are limited in number; leave any
+            # shortfall of disbands to the automatic disbanding.
+            actors = rng.sample(actors, rng.randint(0, len(actors)))
+
+        for actor in actors:
+            action = rng.choice(sorted(tree[actor]))
+            assist = rng.choice(sorted(tree[actor][action]))
+            target = rng.choice(sorted(tree[actor][action][assist]))
+            orders.append({
+                'government': government, 'actor': actor, 'action': action,
+                'assist': assist, 'target': target,
+                'via_convoy': bool(tree[actor][action][assist][target]) and rng.random() < 0.5,
+            })
+    return orders
+
+
+class Simulation(object):
+    def __init__(self, adjudicator, keep):
+        self.adjudicator, self.keep = adjudicator, keep
+        self.latency = defaultdict(list)
+        self.slowest = []  # a heap of (seconds, count, position)
+        self.failures = []
+        self.turns = 0
+
+    def record(self, seconds, position):
+        entry = (seconds, self.turns, position)
+        if len(self.slowest) < self.keep:
+            heapq.heappush(self.slowest, entry)
+        elif seconds > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    def play(self, rng, years):
+        turn, units, owns = initialize_game()
+        units = [as_unit(u) for u in units]
+        owns = [as_ownership(o) for o in owns]
+
+        while turn['year'] < 1900 + years:
+            orders = random_orders(rng, turn, units, owns)
+            position = copy.deepcopy((turn, orders, units, owns))
+
+            start = time.time()
+            try:
+                turn, orders, units, owns = generate(turn, orders, units, owns,
+                                                     adjudicator=self.adjudicator)
+            except Exception as e:
+                self.failures.append((repr(e), position))
+                return
+            seconds = time.time() - start
+
+            self.turns += 1
+            self.latency[position[0]['season']].append(seconds)
+            self.record(seconds, position)
+
+            units = [as_unit(u) for u in units]
+            owns = [as_ownership(o) for o in owns]
+            if max(supplycenters(owns).values() or [0]) >= VICTORY:
+                return
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+
+def write_fixture(path, position, **extra):
+    turn, orders, units, owns = position
+    fixture = dict(extra, turn=turn, orders=orders, units=units, owns=owns)
+    with open(path, 'w') as f:
+        json.dump(fixture, f, indent=2, sort_keys=True)
+
+
+def replay(paths, adjudicator, repeat):
+    print("{0:<60} {1:>6} {2:>12}".format('fixture', 'season', 'best ms'))
+    for path in paths:
+        with open(path) as f:
+            fixture = json.load(f)
+        position = (fixture['turn'], fixture['orders'], fixture['units'], fixture['owns'])
+
+        times = []
+        for i in range(repeat):
+            args = copy.deepcopy(position)
+            start = time.time()
+            generate(*args, adjudicator=adjudicator)
+            times.append(time.time() - start)
+        print("{0:<60} {1:>6} {2:>12.3f}".format(
+            os.path.basename(path), fixture['turn']['season'], 1000 * min(times)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--years', type=int, default=20,
+                        help="the longest a game may last")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--adjudicator', choices=sorted(ADJUDICATORS), default='search')
+    parser.add_argument('--slowest', type=int, default=10,
+                        help="how many of the slowest positions to keep")
+    parser.add_argument('--fixtures', metavar='DIR',
+                        help="write the slowest and failing positions here as JSON")
+    parser.add_argument('--replay', metavar='FIXTURE', nargs='+',
+                        help="time the positions in these fixtures instead")
+    parser.add_argument('--repeat', type=int, default=10,
+                        help="runs of each replayed fixture to time")
+    args = parser.parse_args()
+
+    if args.replay:
+        replay(args.replay, args.adjudicator, args.repeat)
+        return
+
+    rng = random.Random(args.seed)
+    simulation = Simulation(args.adjudicator, args.slowest)
+    start = time.time()
+    for game in range(args.games):
+        simulation.play(rng, args.years)
+    elapsed = time.time() - start
+
+    print("{0} games, {1} turns in {2:.1f}s: {3:.1f} turns/s".format(
+        args.games, simulation.turns, elapsed, simulation.turns / elapsed))
+    print("{0} games stopped by a failure to generate".format(len(simulation.failures)))
+    print()
+    print("{0:>6} {1:>8} {2:>10} {3:>10} {4:>10}".format('season', 'turns', 'p50 ms', 'p99 ms', 'max ms'))
+    for season in standard.seasons:
+        values = simulation.latency.get(season)
+        if values:
+            print("{0:>6} {1:>8} {2:>10.3f} {3:>10.3f} {4:>10.3f}".format(
+                season, len(values), 1000 * percentile(values, 0.5),
+                1000 * percentile(values, 0.99), 1000 * max(values)))
+
+    slowest = sorted(simulation.slowest, reverse=True)
+    print()
+    print("slowest positions:")
+    for rank, (seconds, count, (turn, orders, units, owns)) in enumerate(slowest):
+        print("{0:>3}. {1:>10.3f} ms  {2} {3}, {4} units, {5} orders".format(
+            rank + 1, 1000 * seconds, turn['season'], turn['year'], len(units), len(orders)))
+
+    if args.fixtures:
+        if not os.path.isdir(args.fixtures):
+            os.makedirs(args.fixtures)
+        for rank, (seconds, count, position) in enumerate(slowest):
+            write_fixture(os.path.join(args.fixtures, 'slow-{0:02d}.json'.format(rank + 1)),
+                          position, seconds=seconds, seed=args.seed)
+        for n, (error, position) in enumerate(simulation.failures):
+            write_fixture(os.path.join(args.fixtures, 'failure-{0:02d}.json'.format(n + 1)),
+                          position, error=error, seed=args.seed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+A snapshot of the board for one turn, indexed for the order checks.
+
+The helpers in `check` and `digest` are asked the same questions over
+and over while checking a full set of orders: which unit is in this
+subregion, which territories are occupied, how many builds does each
+government have.  Scanning the `units` and `owns` lists for each of
+these makes checking a turn's orders quadratic, so a `BoardState` is
+built once from those lists and the indexes are shared.
+
+Boards are also cached by position with `snapshot`, so that everything
+asking about the same turn (listing the legal orders, validating the
+submitted ones, normalizing them for adjudication) shares one board.
+What has been worked out from a position, such as its legal orders, is
+kept apart from the board, with `derived`.
+
+"""
+from collections import defaultdict
+
+try:
+    from types import MappingProxyType
+except ImportError:
+    # Python 2 has no read-only view of a dict.
+    MappingProxyType = dict
+
+from .utils import get_territory, has_land, is_supply
+
+
+def frozen(mapping):
+    return MappingProxyType(dict(mapping))
+
+
+def fingerprint(units, owns, season):
+    """The key of a position, the same whatever order its units and ownership are in."""
+    return (
+        season,
+        frozenset(frozenset(u.items()) for u in units),
+        frozenset(frozenset(o.items()) for o in owns),
+    )
+
+
+class BoardState(object):
+    """
+    The units and ownership of a turn, with indexes by subregion, by
+    territory and by government.  Every index is a tuple, a frozenset
+    or a read-only view of a dict, as are the units and ownership, and
+    the attributes of a board cannot be set once it is built; if the
+    units or ownership change, build a new one.
+
+    """
+
+    def __init__(self, units, owns, season, key=None):
+        # Copied, since the engine updates unit dicts in place.
+        units, owns = tuple(frozen(u) for u in units), tuple(frozen(o) for o in owns)
+
+        by_subregion, by_territory = defaultdict(list), defaultdict(list)
+        by_government = defaultdict(list)
+        for u in units:
+            by_subregion[u['subregion']].append(u)
+            by_territory[get_territory(u['subregion'])].append(u)
+            by_government[u['government']].append(u)
+
+        supply_centers = defaultdict(list)
+        for o in owns:
+            if o.get('is_supply', is_supply(o['territory'])):
+                supply_centers[o['government']].append(o['territory'])
+
+        # As in `digest.builds_available`, the supply centers held less
+        # the units in play, per government.
+        builds = dict((g, len(Ts)) for g, Ts in supply_centers.items())
+        for u in units:
+            builds[u['government']] = builds.get(u['government'], 0) - 1
+
+        values = {
+            'key': key if key is not None else fingerprint(units, owns, season),
+            'units': units,
+            'owns': owns,
+            'season': season,
+            'by_subregion': frozen((sr, tuple(us)) for sr, us in by_subregion.items()),
+            'by_territory': frozen((T, tuple(us)) for T, us in by_territory.items()),
+            'by_government': frozen((g, tuple(us)) for g, us in by_government.items()),
+            'ownership': frozen((o['territory'], o) for o in owns),
+            'supply_centers': frozen((g, tuple(Ts)) for g, Ts in supply_centers.items()),
+            'occupied': frozenset(by_territory),
+            'standoffs': frozenset(u.get('standoff_from') for u in units
+                                   if u.get('standoff_from')),
+            'armies': frozenset(u['subregion'] for u in units if u['u_type'] == 'A'),
+            # Fleets out at sea, the only ones that are able to convoy.
+            'convoy_fleets': tuple(u['subregion'] for u in units
+                                   if u['u_type'] == 'F'
+                                   and not has_land(u['subregion'])),
+            'builds': frozen(builds),
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BoardState objects are immutable.")
+
+    def units_at(self, sr_token):
+        return self.by_subregion.get(sr_token, ())
+
+    def units_in(self, t_token):
+        return self.by_territory.get(t_token, ())
+
+    def units_of(self, government):
+        return self.by_government.get(government, ())
+
+
+# Both caches are emptied whenever they grow past this many positions.
+CACHE_SIZE = 256
+
+_snapshots = {}
+_derived = {}
+
+
+def snapshot(units, owns, season):
+    """
+    Returns the `BoardState` for this position, reusing the one built
+    the last time the same units, ownership and season were seen.
+
+    """
+    key = fingerprint(units, owns, season)
+    if key not in _snapshots:
+        if len(_snapshots) >= CACHE_SIZE:
+            _snapshots.clear()
+        _snapshots[key] = BoardState(units, owns, season, key=key)
+
+    return _snapshots[key]
+
+
+def derived(board, name, compute):
+    """
+    Returns what `compute()` works out from the position of `board`,
+    calling it only the first time `name` is asked for at that
+    position.
+
+    """
+    if board.key not in _derived:
+        if len(_derived) >= CACHE_SIZE:
+            _derived.clear()
+        _derived[board.key] = {}
+
+    results = _derived[board.key]
+    if name not in results:
+        results[name] = compute()
+    return results[name]
+
+
+def clear_caches():
+    """Empties the caches of boards, and of what has been worked out from them."""
+    _snapshots.clear()
+    _derived.clear()
@@ -1,35 +1,50 @@
 from . import standard
-from .digest import find_convoys, builds_available
-from .utils import unit_in, get_territory, borders, territory_parts, has_land, is_fleet
+from .board import derived, snapshot
+from .digest import actionable_subregions, find_convoys
+from .utils import get_territory, borders, territory_parts, is_fleet
 
 
-def valid_hold(actor, units, owns, season):
-    if season in ('S', 'F'):
-        if unit_in(actor, units):
+def convoy_networks(board, excluding=None):
+    """
+    The convoy networks of the board, optionally without the fleet at
+    `excluding`, worked out once per board.
+
+    """
+    def networks():
+        fleets = [f for f in board.convoy_fleets if f != excluding]
+        return tuple((frozenset(F), frozenset(L))
+                     for F, L in find_convoys(board.units, fleets))
+
+    return derived(board, ('convoy_networks', excluding), networks)
+
+
+def valid_hold(actor, board):
+    if board.season in ('S', 'F'):
+        if actor in board.by_subregion:
             return {'': {'': False}}
     return {}
 
 
-def valid_move(actor, units, owns, season):
-    if season == 'FA':
+def valid_move(actor, board):
+    if board.season == 'FA':
         return {}
 
-    actor_set = [u for u in units if get_territory(u['subregion']) == get_territory(actor)]
+    actor_set = board.units_in(get_territory(actor))
 
     target = borders(actor)
 
-    if season in ('SR', 'FR'):
+    if board.season in ('SR', 'FR'):
         # only dislodged units retreat
         actor_set = [a for a in actor_set if a['dislodged']]
 
         target = [
             t for t in target
             # only go to empty territories ...
-            if not any(get_territory(e['subregion']) == get_territory(t) for e in units)
+            if get_territory(t) not in board.occupied
             # that weren't the source of a displacing attack ...
             and all(get_territory(t) != a['displaced_from'] for a in actor_set)
             # and that isn't empty because of a standoff.
-            and all(get_territory(t) != u['standoff_from'] for u in units)
+            and get_territory(t) not in board.standoffs
         ]
 
     if len(actor_set) != 1:
@@ -37,14 +52,9 @@ def valid_move(actor, units, owns, season):
 
     convoyable = set()
     # Is the unit a convoyable army?  If so, include places it can convoy to.
-    if season in ('S', 'F') and any(a['u_type'] == 'A' for a in actor_set):
+    if board.season in ('S', 'F') and any(a['u_type'] == 'A' for a in actor_set):
         target = set(target)
-        fleets = [
-            u['subregion'] for u in units
-            if u['u_type'] == 'F'
-            and not has_land(u['subregion'])
-        ]
-        for fset, lset in find_convoys(units, fleets):
+        for fset, lset in convoy_networks(board):
             if actor in lset:
                 target.update(lset)
                 convoyable.update(lset)
@@ -59,11 +69,11 @@ def valid_move(actor, units, owns, season):
     }
 
 
-def valid_support(actor, units, owns, season):
-    if season not in ('S', 'F'):
+def valid_support(actor, board):
+    if board.season not in ('S', 'F'):
         return {}
 
-    if not unit_in(actor, units):
+    if actor not in board.by_subregion:
         return {}
 
     adj = {sr for b in borders(actor)
@@ -72,7 +82,7 @@ def valid_support(actor, units, owns, season):
     # support to hold
     results = {
         a: {'': False} for a in adj
-        if unit_in(a, units)
+        if a in board.by_subregion
     }
 
     # support to attack
@@ -80,25 +90,16 @@ def valid_support(actor, units, owns, season):
         b for a in adj
         for b in borders(a)
         if b != actor
-        and unit_in(b, units)
+        and b in board.by_subregion
     }
     for a in attackers:
         reachable = adj & set(borders(a))
         results.setdefault(a, {}).update((x, False) for x in reachable)
 
     # support to convoyed attack
-    attackers = {
-        u['subregion'] for u in units
-        if u['u_type'] == 'A'
-        and u['subregion'] != actor
-    }
-    fleets = [
-        u['subregion'] for u in units
-        if u['u_type'] == 'F'
-        and not has_land(u['subregion'])
-        and u['subregion'] != actor  # if we are issuing a support, we can't convoy.
-    ]
-    for fset, lset in find_convoys(units, fleets):
+    attackers = board.armies - {actor}
+    # if we are issuing a support, we can't convoy.
+    for fset, lset in convoy_networks(board, excluding=actor):
         for a in attackers:
             if a not in lset:
                 continue
@@ -111,48 +112,37 @@ def valid_support(actor, units, owns, season):
     return results
 
 
-def valid_convoy(actor, units, owns, season):
-    if season not in ('S', 'F'):
+def valid_convoy(actor, board):
+    if board.season not in ('S', 'F'):
         return {}
 
-    if not unit_in(actor, units):
+    if actor not in board.by_subregion:
         return {}
     if not is_fleet(actor):
         return {}
 
-    fleets = [
-        u['subregion'] for u in units
-        if u['u_type'] == 'F'
-        and not has_land(u['subregion'])
-    ]
-
-    for fset, lset in find_convoys(units, fleets):
+    for fset, lset in convoy_networks(board):
         if actor in fset:
-            attackers = {
-                u['subregion'] for u in units
-                if u['u_type'] == 'A'
-                and u['subregion'] in lset
-            }
+            attackers = board.armies & lset
             return {a: {x: False for x in lset - {a}}
                     for a in attackers}
     return {}
 
 
-def valid_build(actor, units, owns, season):
-    if not season == 'FA':
+def valid_build(actor, board):
+    if not board.season == 'FA':
         return {}
 
-    owns_index = {o['territory']: o for o in owns}
-    current_government = owns_index.get(get_territory(actor), {}).get('government')
+    current_government = board.ownership.get(get_territory(actor), {}).get('government')
     home_government, is_supply = '', False
     if get_territory(actor) in standard.starting_state:
         home_government, is_supply, _ = standard.starting_state[get_territory(actor)]
 
     # It has to be a supply center and the current government has to have builds available.
-    if not (is_supply and builds_available(units, owns).get(current_government, 0) > 0):
+    if not (is_supply and board.builds.get(current_government, 0) > 0):
         return {}
     # Only can build if the territory is currently unoccupied.
-    if any(get_territory(u['subregion']) == get_territory(actor) for u in units):
+    if get_territory(actor) in board.occupied:
         return {}
     # And only if the territory is one of this government's "home" territories.
     if current_government == home_government:
@@ -160,28 +150,79 @@ def valid_build(actor, units, owns, season):
     return {}
 
 
-def valid_disband(actor, units, owns, season):
-    if season in ('S', 'F'):
+def valid_disband(actor, board):
+    if board.season in ('S', 'F'):
         return {}
 
-    unit = [u for u in units if get_territory(u['subregion']) == get_territory(actor)]
-    if season in ('SR', 'FR'):
+    unit = board.units_in(get_territory(actor))
+    if board.season in ('SR', 'FR'):
         if not any(u['dislodged'] for u in unit):
             return {}
-    elif builds_available(units, owns).get(unit[0]['government'], 0) >= 0:
+    elif board.builds.get(unit[0]['government'], 0) >= 0:
         return {}
     return {'': {'': False}}
 
 
-def is_legal(order, units, owns, season):
-    builds = builds_available(units, owns)
+VALIDATORS = {'H': valid_hold,
+              'M': valid_move,
+              'S': valid_support,
+              'C': valid_convoy,
+              'B': valid_build,
+              'D': valid_disband}
+
+
+def legal_orders(units, owns, season, board=None):
+    """
+    Returns the complete tree of legal orders for every government,
+    as nested dicts of government, actor, action, assist and target,
+    with the leaves being whether the move must be convoyed.  An empty
+    actor stands for a build yet to be decided upon.  The tree is
+    worked out once per position.
+
+    """
+    board = board or snapshot(units, owns, season)
+    return derived(board, 'legal_orders', lambda: board_legal_orders(board))
+
+
+def board_legal_orders(board):
+    actions = {'S': ('H', 'M', 'S', 'C'),
+               'F': ('H', 'M', 'S', 'C'),
+               'SR': ('M', 'D'),
+               'FR': ('M', 'D')}
+
+    legal = {}
+    actors = actionable_subregions({'season': board.season}, board.units, board.owns,
+                                   board=board)
+    for government in standard.powers:
+        tree = {}
+        if board.season == 'FA':
+            builds = board.builds.get(government, 0)
+            choices = ('B',) if builds > 0 else ('D',)
+            if builds > 0:
+                tree[''] = {'': {'': {'': False}}}
+        else:
+            choices = actions[board.season]
+
+        for a in actors.get(government, ()):
+            for x in choices:
+                result = VALIDATORS[x](a, board)
+                if result:
+                    tree.setdefault(a, {})[x] = result
+        legal[government] = tree
+
+    return legal
+
+
+def is_legal(order, units, owns, season, board=None):
+    board = board or snapshot(units, owns, season)
+    builds = board.builds
 
     if not order['actor']:
         if season != 'FA':
             return False
         unit = ()
     else:
-        unit = [u for u in units if u['subregion'] == order['actor']]
+        unit = board.units_at(order['actor'])
 
     if not order['actor'] or not order['action']:
         return (season == 'FA' and
@@ -202,19 +243,13 @@ def is_legal(order, units, owns, season):
         if unit and unit[0]['government'] != order['government']:
             return False
     elif order['action'] == 'B':
-        if not any(o['territory'] == get_territory(order['actor'])
-                   and o['government'] == order['government']
-                   for o in owns):
+        own = board.ownership.get(get_territory(order['actor']))
+        if not own or own['government'] != order['government']:
             return False
 
-    actions = {'H': valid_hold,
-               'M': valid_move,
-               'S': valid_support,
-               'C': valid_convoy,
-               'B': valid_build,
-               'D': valid_disband}
-    tree = actions[order['action']](order['actor'], units, owns, season)
-    if not tree or order['assist'] not in tree:
+    tree = legal_orders(units, owns, season, board=board).get(order['government'], {})
+    tree = tree.get(order['actor'], {}).get(order['action'], {})
+    if order['assist'] not in tree:
         return False
     tree = tree[order['assist']]
     if order['target'] not in tree:
@@ -1,5 +1,4 @@
 from collections import defaultdict
-from itertools import permutations
 
 from .utils import get_territory, borders
 
@@ -57,14 +56,40 @@ DEPENDENCIES = {('C', 'M'): (attack_us,),
 
 
 def construct_dependencies(orders):
+    """
+    Returns a mapping from each order to the list of orders whose
+    outcome it depends on.  Every dependency relates two orders
+    through either the territory of the first order or the territory
+    it targets, so only the orders assisting or targeting those two
+    territories, or occupying the target, need to be examined.
+
+    """
+    position = {T: i for i, T in enumerate(orders)}
+
+    by_assist, by_target = defaultdict(list), defaultdict(list)
+    for T, o in orders.items():
+        by_assist[get_territory(o['assist'])].append(T)
+        by_target[get_territory(o['target'])].append(T)
+
     dep = defaultdict(list)
-    for (T1, o1), (T2, o2) in permutations(orders.items(), 2):
-        depend = False
-        act1, act2 = o1['action'], o2['action']
-        if (act1, act2) in DEPENDENCIES:
-            depend = any(f(T1, o1, T2, o2) for f in DEPENDENCIES[(act1, act2)])
-
-        if depend:
-            dep[T1].append(T2)
+    for T1, o1 in orders.items():
+        candidates = set(by_assist.get(T1, ()))
+        candidates.update(by_target.get(T1, ()))
+
+        target = get_territory(o1['target'])
+        if target:
+            candidates.update(by_assist.get(target, ()))
+            candidates.update(by_target.get(target, ()))
+            if target in orders:
+                candidates.add(target)
+        candidates.discard(T1)
+
+        for T2 in sorted(candidates, key=position.get):
+            o2 = orders[T2]
+            act1, act2 = o1['action'], o2['action']
+            if (act1, act2) not in DEPENDENCIES:
+                continue
+            if any(f(T1, o1, T2, o2) for f in DEPENDENCIES[(act1, act2)]):
+                dep[T1].append(T2)
 
     return dep
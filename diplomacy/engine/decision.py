@@ -0,0 +1,314 @@
+"""
+Adjudication by decision propagation, after Lucas Kruijswijk's
+algorithm.
+
+Every order carries a decision (whether a move succeeds, whether a
+support is given, whether a holding or convoying unit stays in place),
+and every strength has a minimum and maximum given the decisions made
+so far.  A decision is made as soon as the bounds of the strengths it
+depends on settle it one way or the other, and the bounds that depend
+on it are then tightened again, until nothing further can be
+concluded.  Only the decisions left over, which depend on each other
+in a cycle, are handed to the guessing search in `resolver.resolve`.
+
+"""
+from collections import defaultdict
+
+from .compare import head_to_head
+from .resolver import index_attackers, index_assists, order_path, resolve as search
+from .utils import get_territory
+
+
+class Bounds(object):
+    """The minimum and maximum paths and strengths implied by a set of decisions."""
+
+    def __init__(self, orders, paradox, units, unit_index, attackers, supporters, convoyers,
+                 decided):
+        self.orders, self.paradox, self.units = orders, paradox, units
+        self.unit_index, self.decided = unit_index, decided
+        self.attackers, self.supporters, self.convoyers = attackers, supporters, convoyers
+
+        self.path, self.convoy = {}, {}
+        self.hold_str, self.attack_str = {}, {}
+        self.defend_str, self.prevent_str = {}, {}
+
+        self.update(orders)
+
+    def update(self, territories):
+        """Recalculates the bounds of the orders at `territories`."""
+        for T in territories:
+            order = self.orders[T]
+            if order['action'] == 'M':
+                self.path[T], self.convoy[T] = self.calculate_path(T, order)
+        for T in territories:
+            self.calculate_strengths(T, self.orders[T])
+
+    def depends_on(self, T, order):
+        """
+        The territories of the orders whose decisions the bounds of the
+        order at `T` are calculated from.
+
+        """
+        territories = {T}
+        territories.update(self.supporters.get(T, ()))
+        territories.update(self.convoyers.get(T, ()))
+        if order['action'] == 'M':
+            T2 = get_territory(order['target'])
+            if T2 in self.orders:
+                territories.add(T2)
+                territories.update(self.convoyers.get(T2, ()))
+        return territories
+
+    def can_be(self, T, d):
+        if T in self.decided:
+            return self.decided[T] == d
+        if T in self.paradox and d is True:
+            return False
+        return True
+
+    def must_be(self, T, d):
+        return T in self.decided and self.decided[T] == d
+
+    def calculate_path(self, T, order):
+        # Only successful convoys contribute to a path, so the minimum
+        # counts the convoys known to succeed and the maximum those that
+        # still might.
+        low = {T2: True for T2 in self.convoyers.get(T, ())
+               if self.must_be(T2, True)}
+        high = {T2: True for T2 in self.convoyers.get(T, ())
+                if self.can_be(T2, True)}
+
+        path_min, convoy_min = order_path(T, order, low, self.orders, self.paradox,
+                                          self.units, self.convoyers)
+        path_max, convoy_max = order_path(T, order, high, self.orders, self.paradox,
+                                          self.units, self.convoyers)
+        return (path_min, path_max), (convoy_min, convoy_max)
+
+    def convoyed(self, T):
+        return self.convoy.get(T, (False, False))
+
+    def head_to_head(self, T, order, T2):
+        """
+        Returns a pair of booleans, whether the moves at `T` and `T2` are
+        certainly a head-to-head battle, and whether they might be one.
+
+        """
+        o2 = self.orders[T2]
+        if not head_to_head(T, order, T2, o2):
+            return False, False
+        (c1_min, c1_max), (c2_min, c2_max) = self.convoyed(T), self.convoyed(T2)
+        return not (c1_max or c2_max), not (c1_min or c2_min)
+
+    def moves_away(self, T, order, T2):
+        """
+        Returns a pair of booleans, whether the unit at `T2` certainly
+        moves out of the way of the unit at `T`, and whether it might.
+
+        """
+        o2 = self.orders[T2]
+        if o2['action'] != 'M':
+            return False, False
+        h2h_min, h2h_max = self.head_to_head(T, order, T2)
+        return (self.must_be(T2, True) and not h2h_max,
+                self.can_be(T2, True) and not h2h_min)
+
+    def calculate_strengths(self, T, order):
+        given = [(T2, self.orders[T2]) for T2 in self.supporters.get(T, ())]
+        # supports that are certainly given, and that might be given
+        given_min = [(T2, o2) for T2, o2 in given if self.must_be(T2, True)]
+        given_max = [(T2, o2) for T2, o2 in given if self.can_be(T2, True)]
+
+        hold_min = sum(1 for T2, o2 in given_min if not o2['target'])
+        hold_max = sum(1 for T2, o2 in given_max if not o2['target'])
+
+        if order['action'] != 'M':
+            self.hold_str[T] = (1 + hold_min, 1 + hold_max)
+            self.attack_str[T] = self.defend_str[T] = self.prevent_str[T] = (0, 0)
+            return
+
+        # The area is only left empty if the move succeeds.
+        self.hold_str[T] = (hold_min + (0 if self.can_be(T, True) else 1),
+                            hold_max + (1 if self.can_be(T, False) else 0))
+
+        given_min = [(T2, o2) for T2, o2 in given_min if o2['target']]
+        given_max = [(T2, o2) for T2, o2 in given_max if o2['target']]
+        self.defend_str[T] = (1 + len(given_min), 1 + len(given_max))
+
+        path_min, path_max = self.path[T]
+        T2 = get_territory(order['target'])
+
+        attack, prevent = [path_min, path_max], [path_min, path_max]
+        if T2 in self.orders:
+            away_min, away_max = self.moves_away(T, order, T2)
+            if self.unit_index[T]['government'] == self.unit_index[T2]['government']:
+                # we can't dislodge our own unit, unless it moves away
+                attack = [path_min and away_min, path_max and away_max]
+
+            if self.orders[T2]['action'] == 'M':
+                h2h_min, h2h_max = self.head_to_head(T, order, T2)
+                prevent = [path_min and not (self.can_be(T2, True) and h2h_max),
+                           path_max and not (self.must_be(T2, True) and h2h_min)]
+
+        attack_min = 1 + sum(1 for T3, o3 in given_min if self.support_counts(T3, o3)[0])
+        attack_max = 1 + sum(1 for T3, o3 in given_max if self.support_counts(T3, o3)[1])
+        self.attack_str[T] = (attack_min if attack[0] else 0,
+                              attack_max if attack[1] else 0)
+        self.prevent_str[T] = (1 + len(given_min) if prevent[0] else 0,
+                               1 + len(given_max) if prevent[1] else 0)
+
+    def support_counts(self, T, order):
+        """
+        Returns whether a support to move certainly adds to the attack
+        strength of the unit it supports, and whether it might.
+
+        """
+        T2 = get_territory(order['target'])
+        if T2 not in self.orders:
+            return True, True
+        if self.unit_index[T]['government'] != self.unit_index[T2]['government']:
+            return True, True
+        return self.moves_away(T, order, T2)
+
+
+def decide_move(T, order, bounds, attackers, fails):
+    target = get_territory(order['target'])
+    path_min, path_max = bounds.path[T]
+    attack_min, attack_max = bounds.attack_str[T]
+    hold_min, hold_max = bounds.hold_str.get(target, (0, 0))
+    defend_min, defend_max = bounds.defend_str.get(target, (0, 0))
+    h2h_min, h2h_max = False, False
+    if target in bounds.orders:
+        h2h_min, h2h_max = bounds.head_to_head(T, order, target)
+    competitors = [bounds.prevent_str[T2] for T2 in attackers.get(target, ()) if T2 != T]
+
+    if (T in fails or not path_max
+            or attack_max <= hold_min
+            or (h2h_min and attack_max <= defend_min)
+            or any(attack_max <= prevent_min for prevent_min, prevent_max in competitors)):
+        return False
+    if (path_min
+            and attack_min > hold_max
+            and (not h2h_max or attack_min > defend_max)
+            and all(attack_min > prevent_max for prevent_min, prevent_max in competitors)):
+        return True
+
+
+def decide_support(T, order, bounds, attackers, fails):
+    target = get_territory(order['target'])
+    hold_min, hold_max = bounds.hold_str[T]
+    attacks = [(T2, bounds.attack_str[T2]) for T2 in attackers.get(T, ())]
+
+    # A support is cut by any attack not coming from the territory it
+    # supports into, or by an attack from there that would dislodge it.
+    if (T in fails
+            or any(attack_min > hold_max for T2, (attack_min, attack_max) in attacks
+                   if T2 == target)
+            or any(attack_min > 0 for T2, (attack_min, attack_max) in attacks
+                   if T2 != target)):
+        return False
+    if (all(attack_max <= hold_min for T2, (attack_min, attack_max) in attacks
+            if T2 == target)
+            and all(attack_max == 0 for T2, (attack_min, attack_max) in attacks
+                    if T2 != target)):
+        return True
+
+
+def decide_hold(T, order, bounds, attackers, fails):
+    hold_min, hold_max = bounds.hold_str[T]
+    attacks = [(T2, bounds.attack_str[T2], bounds.prevent_str[T2])
+               for T2 in attackers.get(T, ())]
+
+    if T in fails:
+        return False
+    # Dislodged by an attack that is certainly the strongest, and that
+    # certainly overcomes the hold strength and every competing prevent
+    # strength.
+    if any(attack_min > hold_max
+           and all(attack2[1] < attack_min and prevent2[1] < attack_min
+                   for T3, attack2, prevent2 in attacks if T3 != T2)
+           for T2, (attack_min, attack_max), prevent in attacks):
+        return False
+    # Not dislodged if no attack can overcome both the hold strength
+    # and the prevent strengths of the other attackers.
+    if all(attack_max <= hold_min
+           or any(prevent2[0] >= attack_max for T3, attack2, prevent2 in attacks if T3 != T2)
+           for T2, (attack_min, attack_max), prevent in attacks):
+        return True
+
+
+DECISIONS = {'M': decide_move,
+             'S': decide_support,
+             'H': decide_hold,
+             'C': decide_hold}
+
+
+def reads(T, order, attackers):
+    """The territories of the orders whose bounds the decision at `T` is made from."""
+    if order['action'] == 'M':
+        target = get_territory(order['target'])
+        return {T, target}.union(attackers.get(target, ()))
+    return {T}.union(attackers.get(T, ()))
+
+
+def propagate(state, orders, fails, paradox, units):
+    """
+    Starting from the decisions in `state`, repeatedly make every
+    decision that the current bounds on the strengths settle, until no
+    more can be made.  Returns all of the decisions made.
+
+    After each round only the bounds that depend on the decisions just
+    made are recalculated, and only the decisions that read those
+    bounds are tried again; the others would come out as before.
+
+    """
+    unit_index = {get_territory(u['subregion']): u for u in units}
+    attackers = index_attackers(orders)
+    supporters = index_assists(orders, 'S')
+    convoyers = index_assists(orders, 'C')
+
+    decided = dict(state)
+    bounds = Bounds(orders, paradox, units, unit_index, attackers, supporters, convoyers,
+                    decided)
+
+    # The orders whose bounds change with each decision, and the
+    # decisions that change with the bounds of each order.
+    affected, readers = defaultdict(set), defaultdict(set)
+    for T, order in orders.items():
+        for T2 in bounds.depends_on(T, order):
+            affected[T2].add(T)
+        for T2 in reads(T, order, attackers):
+            readers[T2].add(T)
+
+    pending = set(orders)
+    while True:
+        made = {}
+        for T in pending:
+            if T in decided:
+                continue
+            order = orders[T]
+            d = DECISIONS[order['action']](T, order, bounds, attackers, fails)
+            if d is None:
+                continue
+            # A paradoxical convoy that stays in place is still not
+            # counted as a successful convoy.
+            if d and T in paradox:
+                d = None
+            made[T] = d
+
+        if not made:
+            return decided
+        decided.update(made)
+
+        changed = set().union(*(affected[T] for T in made))
+        bounds.update(changed)
+        pending = set().union(*(readers[T] for T in changed))
+
+
+def resolve(state, orders, dep, fails, paradox, units):
+    decided = tuple(sorted(propagate(state, orders, fails, paradox, units).items()))
+    if len(decided) == len(orders):
+        return decided
+
+    # The remaining decisions depend on each other circularly, and can
+    # only be settled by guessing.
+    return search(decided, orders, dep, fails, paradox, units)
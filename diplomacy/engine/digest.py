@@ -1,8 +1,22 @@
 from collections import defaultdict, Counter
-from itertools import combinations
 
 from . import standard
-from .utils import get_territory, borders, territory_parts, has_land, is_land
+from .board import snapshot
+from .topology import standard_map
+from .utils import territory_parts, has_land
+
+
+# For each sea subregion, the land subregions of the territories bordering it.
+sea_coasts = {
+    standard_map.subregions[sr]: frozenset(
+        standard_map.subregions[part]
+        for b in standard_map.borders[sr]
+        for part in standard_map.parts[standard_map.territory_of[b]]
+        if standard_map.land[part]
+    )
+    for sr in range(len(standard_map.subregions))
+    if standard_map.sea[sr]
+}
 
 
 def find_convoys(units, fleets):
@@ -12,39 +26,63 @@ def find_convoys(units, fleets):
     from that cluster.  This is necessary to determine legal orders.
 
     """
-    fleets = [f for f in fleets if not has_land(f)]
-    index = {f: {f} for f in fleets}
-
-    # Calculate the connected sets of fleets
-    for f1, f2 in combinations(fleets, 2):
-        # If this pair is not adjacent, ignore it
-        if f2 not in borders(f1):
-            continue
-
-        # If the sets for each of these fleets are not already the same set,
-        # merge them and update the index
-        if index[f1] != index[f2]:
-            index[f1] |= index[f2]
-            index.update((x, index[f1]) for x in index[f2])
-
-    groups = {frozenset(S) for S in index.values()}
+    fleets = [standard_map.subregion_id[f] for f in set(fleets)
+              if f in standard_map.subregion_id and not has_land(f)]
+
+    # Calculate the connected sets of fleets, as a union-find forest
+    # over the sea adjacency graph.
+    parent = {f: f for f in fleets}
+
+    def root(f):
+        while parent[f] != f:
+            parent[f] = parent[parent[f]]
+            f = parent[f]
+        return f
+
+    for f1 in fleets:
+        for f2 in standard_map.borders[f1]:
+            if f2 in parent:
+                r1, r2 = root(f1), root(f2)
+                if r1 != r2:
+                    parent[max(r1, r2)] = min(r1, r2)
+
+    groups = defaultdict(set)
+    for f in fleets:
+        groups[root(f)].add(standard_map.subregions[f])
 
     armies = {u['subregion'] for u in units if u['u_type'] == 'A'}
 
     convoyable = []
-    for gset in groups:
-        coasts = {
-            sr for f in gset
-            for b in borders(f)
-            for sr in territory_parts(get_territory(b))
-            if is_land(sr)
-        }
+    for gset in groups.values():
+        coasts = set().union(*(sea_coasts[f] for f in gset))
         if coasts & armies:
-            convoyable.append((set(gset), coasts))
+            convoyable.append((gset, coasts))
 
     return convoyable
 
 
+_convoy_cache = {}
+
+
+def find_convoys_cached(units, fleets):
+    """
+    A memoized `find_convoys`, keyed on the fleets and the armies that
+    could be convoyed.  The same networks are asked for many times
+    while checking orders or adjudicating a turn, so repeated calls
+    only cost the copying of the result.
+
+    """
+    key = (frozenset(fleets),
+           frozenset(u['subregion'] for u in units if u['u_type'] == 'A'))
+    if key not in _convoy_cache:
+        if len(_convoy_cache) > 4096:
+            _convoy_cache.clear()
+        _convoy_cache[key] = [(frozenset(F), frozenset(L))
+                              for F, L in find_convoys(units, fleets)]
+
+    return [(set(F), set(L)) for F, L in _convoy_cache[key]]
+
+
 def supplycenters(owns):
     counts = Counter(o['government'] for o in owns
                      if o['is_supply'])
@@ -61,27 +99,27 @@ def builds_available(units, owns):
     return builds
 
 
-def actionable_subregions(turn, units, owns):
+def actionable_subregions(turn, units, owns, board=None):
     """Returns lists of subregions that would be legal actors this turn,
     indexed by government.  These lists are not constrained by the
     number of builds available during Fall Adjustment turns, merely by
     whether the home supply center would fit the criteria.
 
     """
+    board = board or snapshot(units, owns, turn['season'])
     if turn['season'] in ('S', 'F'):
         return {
-            government: [u['subregion'] for u in units
-                         if u['government'] == government]
+            government: [u['subregion'] for u in board.units_of(government)]
             for government in standard.powers
         }
     elif turn['season'] in ('SR', 'FR'):
         return {
-            government: [u['subregion'] for u in units
-                         if u['dislodged'] and u['government'] == government]
+            government: [u['subregion'] for u in board.units_of(government)
+                         if u['dislodged']]
             for government in standard.powers
         }
     elif turn['season'] == 'FA':
-        builds = builds_available(units, owns)
+        builds = board.builds
         actors_index = {}
         for government in standard.powers:
             if builds.get(government, 0) > 0:
@@ -89,20 +127,37 @@ def actionable_subregions(turn, units, owns):
                 # - we own a supply center
                 # - that is one of our original supply centers
                 # - and that is not occupied by a unit
-                owned_sc = (o['territory'] for o in owns
-                            if o['is_supply'] and o['government'] == government)
-                occupied = {get_territory(u['subregion']) for u in units}
                 actors_index[government] = [
-                    sr for T in owned_sc
+                    sr for T in board.supply_centers.get(government, ())
                     for sr in territory_parts(T)
                     if standard.starting_state[T][0] == government
-                    and T not in occupied
+                    and T not in board.occupied
                 ]
             elif builds.get(government, 0) == 0:
                 actors_index[government] = []
             else:
-                actors_index[government] = [u['subregion'] for u in units
-                                            if u['government'] == government]
+                actors_index[government] = [u['subregion']
+                                            for u in board.units_of(government)]
 
         return actors_index
     return {}
+
+
+def standings(turn, units, owns, board=None):
+    """Returns, for each government, its supply center and unit counts,
+    the builds (or, if negative, disbands) those come to, and whether
+    it has anything to order this turn.
+
+    """
+    board = board or snapshot(units, owns, turn['season'])
+    actors = actionable_subregions(turn, units, owns, board=board)
+
+    return {
+        government: {
+            'supply_centers': len(board.supply_centers.get(government, ())),
+            'units': len(board.units_of(government)),
+            'builds': board.builds.get(government, 0),
+            'actionable': bool(actors.get(government)),
+        }
+        for government in standard.powers
+    }
@@ -1,27 +1,35 @@
 from collections import defaultdict
+from functools import partial
+from multiprocessing import cpu_count
 
-from . import standard
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # Python 2, without the futures backport
+    ProcessPoolExecutor = None
+
+from . import decision, resolver, standard
+from .board import snapshot
 from .check import is_legal
-from .compare import assist, construct_dependencies
+from .compare import construct_dependencies
 from .digest import actionable_subregions, builds_available
-from .resolver import (detect_paradox, immediate_fails, resolve, resolve_retreats,
-                       resolve_adjusts)
-from .utils import (convert, get_territory, borders, territory_parts,
+from .resolver import detect_paradox, immediate_fails, resolve_retreats, resolve_adjusts
+from .utils import (convert, get_territory, borders, territory_parts, lineage_token,
                     has_land, is_land, is_sea, is_army, is_fleet)
 
 
-def normalize_orders(turn, orders, units, owns):
+def normalize_orders(turn, orders, units, owns, board=None):
     """Returns a list of order dicts, taken from the orders previously
     submitted this turn, filtered down by legality and refilled with
     defaults.  This list is exhaustive, no units not covered by the
     list or number of builds in excess will be permitted.
 
     """
-    actors = actionable_subregions(turn, units, owns)
+    board = board or snapshot(units, owns, turn['season'])
+    actors = actionable_subregions(turn, units, owns, board=board)
 
     # Construct the set of default orders.  This will be the fully constrained set.
     if turn['season'] == 'FA':
-        builds = builds_available(units, owns)
+        builds = board.builds
         orders_index = {
             (government, index): {
                 'government': government, 'actor': '',
@@ -47,7 +55,7 @@ def normalize_orders(turn, orders, units, owns):
     # the given order is legal.  Illegal orders are dropped.
     index = {}
     for o in orders:
-        if is_legal(o, units, owns, turn['season']):
+        if is_legal(o, units, owns, turn['season'], board=board):
             i = o['actor']
             if turn['season'] == 'FA':
                 index.setdefault(o['government'], 0)
@@ -63,6 +71,13 @@ def normalize_orders(turn, orders, units, owns):
             orders_index[(o['government'], i)] = o
 
     if turn['season'] in ('S', 'F'):
+        # Index the convoy orders by the territory of the army they assist,
+        # to match them to the moves below.  The resolver builds its own.
+        convoys = defaultdict(list)
+        for (g2, i2), o2 in orders_index.items():
+            if o2['action'] == 'C':
+                convoys[get_territory(o2['assist'])].append((g2, o2))
+
         for (g, i), o in orders_index.items():
             # This block concerns the convoyability of units, so if the unit
             # isn't moving or isn't an army, ignore it.
@@ -71,11 +86,7 @@ def normalize_orders(turn, orders, units, owns):
 
             # Find all of the convoy orders that match the current move,
             # both overall and specifically by this user's government.
-            matching = [
-                (g2, o2) for (g2, i2), o2 in orders_index.items()
-                if o2['action'] == 'C'
-                and assist(get_territory(o['actor']), o, get_territory(o2['actor']), o2)
-            ]
+            matching = convoys.get(get_territory(o['actor']), ())
             gvt_matching = [o2 for g2, o2 in matching if g2 == g]
 
             if o['target'] in borders(o['actor']):
@@ -154,7 +165,7 @@ def update_movements(orders, units):
     return units
 
 
-def update_adjusts(orders, units):
+def update_adjusts(orders, units, number):
     new_units = []
     for u in units:
         T = get_territory(u['subregion'])
@@ -164,7 +175,10 @@ def update_adjusts(orders, units):
         else:
             new_units.append(u)
 
+    # Built units first appear in the next turn, `number`.
     for T, o in orders.items():
+        if o['action'] == 'B':
+            o['lineage'] = lineage_token(number, o['actor'])
         if o['action'] == 'B' and o['result'] == 'S':
             new_units.append({
                 'government': o['government'],
@@ -174,6 +188,7 @@ def update_adjusts(orders, units):
                 'dislodged': False,
                 'displaced_from': '',
                 'standoff_from': '',
+                'lineage': o['lineage'],
             })
 
     return new_units
@@ -248,7 +263,8 @@ def update_autodisbands(orders, units, owns):
                 'actor': u['subregion'],
                 'action': 'D', 'result': 'D',
                 'assist': '', 'target': '',
-                'via_convoy': False, 'convoy': False
+                'via_convoy': False, 'convoy': False,
+                'lineage': u['lineage'],
             }
         else:
             new_units.append(u)
@@ -277,7 +293,14 @@ def increment_turn(turn):
     }
 
 
-def generate(turn, orders, units, owns):
+# The available adjudicators for movement turns.  'search' guesses
+# and checks decisions for every order, 'decision' propagates the
+# decisions that are certain and only guesses within cycles.
+ADJUDICATORS = {'search': resolver.resolve,
+                'decision': decision.resolve}
+
+
+def generate(turn, orders, units, owns, adjudicator='search'):
     orders_index = {
         get_territory(o['actor']): o
         for o in normalize_orders(turn, orders, units, owns)
@@ -288,7 +311,8 @@ def generate(turn, orders, units, owns):
         dependencies = construct_dependencies(orders_index)
         paradox_convoys = detect_paradox(orders_index, dependencies)
         fails = immediate_fails(orders_index, units)
-        decisions = resolve((), orders_index, dependencies, fails, paradox_convoys, units)
+        decisions = ADJUDICATORS[adjudicator](
+            (), orders_index, dependencies, fails, paradox_convoys, units)
     elif turn['season'] in ('SR', 'FR'):
         decisions = resolve_retreats(orders_index)
     else:
@@ -298,7 +322,8 @@ def generate(turn, orders, units, owns):
     for T, d in decisions:
         orders_index[T]['result'] = ('S' if d else 'F')
 
-    # Create clean units with the previous pointer set to the correct place
+    # Create clean units with the previous pointer set to the correct place.
+    # Units from before lineages were kept are given one starting here.
     units = [
         {'government': u['government'],
          'u_type': u['u_type'],
@@ -306,10 +331,20 @@ def generate(turn, orders, units, owns):
          'previous': u['subregion'],
          'dislodged': u['dislodged'],
          'displaced_from': '',
-         'standoff_from': ''}
+         'standoff_from': '',
+         'lineage': u.get('lineage') or lineage_token(turn['number'], u['subregion'])}
         for u in units
     ]
 
+    # Each order is marked with the lineage of the unit it was given to.
+    # Only the dislodged units have orders in a retreat turn.
+    for u in units:
+        if turn['season'] in ('SR', 'FR') and not u['dislodged']:
+            continue
+        order = orders_index.get(get_territory(u['subregion']))
+        if order is not None and order['action'] != 'B':
+            order['lineage'] = u['lineage']
+
     if turn['season'] in ('SR', 'FR'):
         units = update_retreats(orders_index, units)
 
@@ -317,7 +352,7 @@ def generate(turn, orders, units, owns):
         units = update_movements(orders_index, units)
 
     if turn['season'] == 'FA':
-        units = update_adjusts(orders_index, units)
+        units = update_adjusts(orders_index, units, turn['number'] + 1)
         units = update_autodisbands(orders_index, units, owns)
 
     turn = increment_turn(turn)
@@ -328,6 +363,35 @@ def generate(turn, orders, units, owns):
     return turn, orders_index.values(), units, owns
 
 
+def _generate_payload(payload, adjudicator='search'):
+    turn, orders, units, owns = generate(*payload, adjudicator=adjudicator)
+    return turn, list(orders), units, owns
+
+
+def generate_many(payloads, adjudicator='search', workers=None):
+    """Generates the next turn for each of a batch of games.
+
+    Takes an iterable of (turn, orders, units, owns) payloads, as
+    would be passed to `generate`, and returns a list of the results
+    in the same order.  The payloads are spread across a pool of
+    `workers` processes (by default, one per CPU); they and the
+    results are plain data, so nothing else is shared with the
+    workers.  Without `concurrent.futures`, or with a single worker,
+    the batch is generated in this process instead.
+
+    """
+    payloads = list(payloads)
+    work = partial(_generate_payload, adjudicator=adjudicator)
+    workers = min(workers or cpu_count(), len(payloads))
+
+    if ProcessPoolExecutor is None or workers < 2:
+        return [work(payload) for payload in payloads]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(payloads) // (4 * workers))
+        return list(executor.map(work, payloads, chunksize=chunksize))
+
+
 def initialize_game():
     turn = {
         'number': 0,
@@ -335,13 +399,14 @@ def initialize_game():
         'season': standard.seasons[0],
     }
 
-    units = [
-        {'government': government,
-         'u_type': convert[unit[1]],
-         'subregion': standard.inv_subregions[(standard.territories[T], unit[0], unit[1])]}
-        for T, (government, sc, unit) in standard.starting_state.items()
-        if unit
-    ]
+    units = []
+    for T, (government, sc, unit) in standard.starting_state.items():
+        if unit:
+            sr = standard.inv_subregions[(standard.territories[T], unit[0], unit[1])]
+            units.append({'government': government,
+                          'u_type': convert[unit[1]],
+                          'subregion': sr,
+                          'lineage': lineage_token(turn['number'], sr)})
 
     owns = [
         {'territory': T,
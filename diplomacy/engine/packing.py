@@ -0,0 +1,112 @@
+"""
+A compact encoding of a turn's board, for storing in a single column.
+
+The units and ownership of a turn are packed into a short JSON string,
+with powers, territories and subregions replaced by their integer ids:
+powers by their position in sorted order, territories and subregions
+by their ids in `topology.standard_map`.
+
+    {"v": 1,
+     "u": [[power, type, subregion, previous, dislodged, displaced_from,
+            standoff_from, lineage number, lineage subregion], ...],
+     "o": [owner of territory 0, owner of territory 1, ...]}
+
+A unit's type is 0 for an army and 1 for a fleet, and `dislodged` is 0
+or 1.  Its lineage, "<number>:<subregion>", is split into its two
+parts.  An empty `previous`, `displaced_from`, `standoff_from` or
+lineage, and an unowned territory, are -1.  Unpacking gives back the
+same unit and ownership dicts as `Turn.get_units` and
+`Turn.get_ownership`.
+
+"""
+import json
+
+from . import standard
+from .topology import standard_map
+from .utils import lineage_token
+
+
+VERSION = 1
+
+powers = sorted(standard.powers)
+power_id = {p: i for i, p in enumerate(powers)}
+
+unit_types = ('A', 'F')
+unit_type_id = {t: i for i, t in enumerate(unit_types)}
+
+
+def pack(units, owns):
+    """Packs unit and ownership dicts into a string."""
+    subregion_id, territory_id = standard_map.subregion_id, standard_map.territory_id
+
+    def subregion(sr):
+        return subregion_id[sr] if sr else -1
+
+    def territory(T):
+        return territory_id[T] if T else -1
+
+    def lineage(token):
+        if not token:
+            return [-1, -1]
+        number, sr = token.split(':', 1)
+        return [int(number), subregion_id[sr]]
+
+    owners = [-1] * len(standard_map.territories)
+    for o in owns:
+        owners[territory_id[o['territory']]] = power_id[o['government']]
+
+    return json.dumps({
+        'v': VERSION,
+        'u': sorted(
+            [power_id[u['government']],
+             unit_type_id[u['u_type']],
+             subregion_id[u['subregion']],
+             subregion(u.get('previous')),
+             int(bool(u.get('dislodged'))),
+             territory(u.get('displaced_from')),
+             territory(u.get('standoff_from'))] + lineage(u.get('lineage'))
+            for u in units
+        ),
+        'o': owners,
+    }, separators=(',', ':'))
+
+
+def unpack(packed):
+    """Returns the lists of unit and ownership dicts from a packed board."""
+    data = json.loads(packed)
+    if data.get('v') != VERSION:
+        raise ValueError("Unknown packed board version: {0!r}".format(data.get('v')))
+
+    subregions, territories = standard_map.subregions, standard_map.territories
+
+    def subregion(sr):
+        return subregions[sr] if sr >= 0 else u''
+
+    def territory(T):
+        return territories[T] if T >= 0 else u''
+
+    def lineage(number, sr):
+        return lineage_token(number, subregions[sr]) if sr >= 0 else u''
+
+    units = []
+    for u in data['u']:
+        (p, t, sr, previous, dislodged, displaced_from, standoff_from,
+         lineage_number, lineage_subregion) = u
+        units.append({'government': powers[p],
+                      'u_type': unit_types[t],
+                      'subregion': subregions[sr],
+                      'previous': subregion(previous),
+                      'dislodged': bool(dislodged),
+                      'displaced_from': territory(displaced_from),
+                      'standoff_from': territory(standoff_from),
+                      'lineage': lineage(lineage_number, lineage_subregion)})
+
+    owns = [
+        {'territory': territories[T],
+         'government': powers[p],
+         'is_supply': standard_map.supply[T]}
+        for T, p in enumerate(data['o'])
+        if p >= 0
+    ]
+
+    return units, owns
@@ -1,14 +1,16 @@
 from collections import defaultdict
 
-from .compare import assist, head_to_head
-from .digest import find_convoys
+from .compare import head_to_head
+from .digest import find_convoys_cached
 from .utils import get_territory, borders
 
 
 def detect_paradox(orders, dep):
     """
     Implements Tarjan's strongly connected components algorithm to
-    find the paradoxical convoys.
+    find the paradoxical convoys.  The depth-first search keeps its own
+    stack of frames rather than recursing, so that the size of the
+    dependency graph isn't limited by Python's recursion limit.
 
     """
     dep = dict(dep)
@@ -17,47 +19,55 @@ def detect_paradox(orders, dep):
     stack = []
     result = set()
 
-    def visit(node, orders, dep):
-        if node in low:
-            return
-
+    def enter(node, frames):
         index = len(low)
         low[node] = index
-        stack_pos = len(stack)
+        frames.append((node, index, len(stack), iter(dep.get(node, ()))))
         stack.append(node)
 
-        for w in dep.get(node, ()):
-            visit(w, orders, dep)
-            low[node] = min(low[node], low[w])
-
-        if low[node] == index:
-            component = tuple(stack[stack_pos:])
-            del stack[stack_pos:]
-            if len(component) > 1:
-                result.update(c for c in component
-                              if orders[c]['action'] == 'C')
-            for item in component:
-                low[item] = len(orders)
-
-    for node in orders:
-        visit(node, orders, dep)
+    for root in orders:
+        if root in low:
+            continue
+
+        frames = []
+        enter(root, frames)
+        while frames:
+            node, index, stack_pos, children = frames[-1]
+            for w in children:
+                if w not in low:
+                    enter(w, frames)
+                    break
+                low[node] = min(low[node], low[w])
+            else:
+                frames.pop()
+                if low[node] == index:
+                    component = tuple(stack[stack_pos:])
+                    del stack[stack_pos:]
+                    if len(component) > 1:
+                        result.update(c for c in component
+                                      if orders[c]['action'] == 'C')
+                    for item in component:
+                        low[item] = len(orders)
+                if frames:
+                    parent = frames[-1][0]
+                    low[parent] = min(low[parent], low[node])
     return result
 
 
 def immediate_fails(orders, units):
+    convoyers = index_assists(orders, 'C')
     results = set()
     for T, o in orders.items():
         if o['action'] == 'M':
             if o['target'] not in borders(o['actor']):
                 matching = [
-                    o2['actor']
-                    for T2, o2 in orders.items()
-                    if o2['action'] == 'C'
-                    and o2['assist'] == o['actor']
-                    and o2['target'] == o['target']
+                    orders[T2]['actor']
+                    for T2 in convoyers.get(T, ())
+                    if orders[T2]['assist'] == o['actor']
+                    and orders[T2]['target'] == o['target']
                 ]
                 if any(o['actor'] in L and o['target'] in L
-                       for F, L in find_convoys(units, matching)):
+                       for F, L in find_convoys_cached(units, matching)):
                     continue
             else:
                 continue
@@ -76,8 +86,68 @@ def immediate_fails(orders, units):
     return results
 
 
+def index_attackers(orders):
+    """Index the territories of moving units by the territory they move into."""
+    attackers = defaultdict(list)
+    for T, order in orders.items():
+        if order['action'] == 'M':
+            attackers[get_territory(order['target'])].append(T)
+    return attackers
+
+
+def index_assists(orders, action):
+    """Index the territories of support or convoy orders by the unit they assist."""
+    assists = defaultdict(list)
+    for T, order in orders.items():
+        if order['action'] == action:
+            assists[get_territory(order['assist'])].append(T)
+    return assists
+
+
+def order_path(T, order, state, orders, paradox, units, convoyers):
+    """Determine if a single move has a valid path, and if it is convoyed."""
+    path, P = False, False
+
+    # matching successful convoy orders
+    matching = [
+        orders[T2]['actor'] for T2 in convoyers.get(T, ())
+        if state.get(T2)
+        and (order['government'] == orders[T2]['government']
+             or order['convoy'])
+    ]
+    # matching successful and paradoxical convoy orders
+    p_matching = matching + [
+        orders[T2]['actor'] for T2 in convoyers.get(T, ())
+        if T2 in paradox
+        and order['convoy']
+    ]
+
+    if any(order['actor'] in L and order['target'] in L
+           for F, L in find_convoys_cached(units, matching)):
+        # We have a valid convoy path if there is a chain
+        # of successful convoys between our endpoints.
+        path = True
+
+    if (not path and
+        any(order['actor'] in L and order['target'] in L
+            for F, L in find_convoys_cached(units, p_matching))):
+        # But if there is a path when paradoxical convoys
+        # are included, we have a paradox.
+        P = True
+
+    convoy = path
+    if not order['convoy'] and order['target'] in borders(order['actor']):
+        # if we are adjacent to the target, we can have a
+        # path even without a successful convoy, but only
+        # if we don't have a paradox
+        path = not P
+
+    return path, convoy
+
+
 def calculate_paths(state, orders, paradox, units):
     """Determine if moves have a valid path."""
+    convoyers = index_assists(orders, 'C')
 
     # True if this unit is successfully convoyed, False otherwise.
     convoy = defaultdict(lambda: False)
@@ -85,47 +155,48 @@ def calculate_paths(state, orders, paradox, units):
     path = {}
     for T, order in orders.items():
         if order['action'] == 'M':
-            path[T], P = False, False
-
-            # matching successful convoy orders
-            matching = [
-                orders[T2]['actor'] for T2, d2 in state.items()
-                if d2
-                and orders[T2]['action'] == 'C'
-                and assist(T, order, T2, orders[T2])
-                and (order['government'] == orders[T2]['government']
-                     or order['convoy'])
-            ]
-            # matching successful and paradoxical convoy orders
-            p_matching = matching + [
-                orders[T2]['actor'] for T2 in paradox
-                if assist(T, order, T2, orders[T2])
-                and order['convoy']
-            ]
-
-            if any(order['actor'] in L and order['target'] in L
-                   for F, L in find_convoys(units, matching)):
-                # We have a valid convoy path if there is a chain
-                # of successful convoys between our endpoints.
-                path[T] = True
-
-            if (not path[T] and
-                any(order['actor'] in L and order['target'] in L
-                    for F, L in find_convoys(units, p_matching))):
-                # But if there is a path when paradoxical convoys
-                # are included, we have a paradox.
-                P = True
-
-            convoy[T] = path[T]
-            if not order['convoy'] and order['target'] in borders(order['actor']):
-                # if we are adjacent to the target, we can have a
-                # path even without a successful convoy, but only
-                # if we don't have a paradox
-                path[T] = not P
+            path[T], convoy[T] = order_path(T, order, state, orders, paradox, units,
+                                            convoyers)
 
     return path, convoy
 
 
+def base_strengths(T, order, state, orders, unit_index, hold_str, attack_str, defend_str,
+                   prevent_str, path, convoy):
+    """Calculate the base hold, attack, defend, and prevent strengths of one order."""
+    hold_str[T], attack_str[T], defend_str[T], prevent_str[T] = 0, 0, 0, 0
+
+    if order['action'] == 'M':
+        defend_str[T] = 1
+        if path[T]:
+            prevent_str[T], attack_str[T] = 1, 1
+
+            if get_territory(order['target']) in state:
+                T2 = get_territory(order['target'])
+                d2 = state[T2]
+
+                # other unit moves away
+                if (d2
+                    and orders[T2]['action'] == 'M'
+                    and not head_to_head(T, order, T2, orders[T2],
+                                         convoy[T], convoy[T2])):
+                    attack_str[T] = 1
+                # other unit is also ours
+                elif unit_index[T]['government'] == unit_index[T2]['government']:
+                    attack_str[T] = 0
+
+                # prevent strength
+                if d2 and head_to_head(T, order, T2, orders[T2],
+                                       convoy[T], convoy[T2]):
+                    prevent_str[T] = 0
+
+        if T in state:
+            hold_str[T] = 0 if state[T] else 1
+
+    if order['action'] in ('H', 'S', 'C'):
+        hold_str[T] = 1
+
+
 def calculate_base_strengths(state, orders, unit_index, path, convoy):
     """Calculate base hold, attack, and prevent strengths."""
 
@@ -146,37 +217,35 @@ def calculate_base_strengths(state, orders, unit_index, path, convoy):
     prevent_str = defaultdict(int)
 
     for T, order in orders.items():
-        if order['action'] == 'M':
-            defend_str[T] = 1
-            if path[T]:
-                prevent_str[T], attack_str[T] = 1, 1
-
-                if get_territory(order['target']) in state:
-                    T2 = get_territory(order['target'])
-                    d2 = state[T2]
-
-                    # other unit moves away
-                    if (d2
-                        and orders[T2]['action'] == 'M'
-                        and not head_to_head(T, order, T2, orders[T2],
-                                             convoy[T], convoy[T2])):
-                        attack_str[T] = 1
-                    # other unit is also ours
-                    elif unit_index[T]['government'] == unit_index[T2]['government']:
-                        attack_str[T] = 0
-
-                    # prevent strength
-                    if d2 and head_to_head(T, order, T2, orders[T2],
-                                           convoy[T], convoy[T2]):
-                        prevent_str[T] = 0
+        base_strengths(T, order, state, orders, unit_index, hold_str, attack_str, defend_str,
+                       prevent_str, path, convoy)
 
-            if T in state:
-                hold_str[T] = 0 if state[T] else 1
+    return hold_str, attack_str, defend_str, prevent_str
 
-        if order['action'] in ('H', 'S', 'C'):
-            hold_str[T] = 1
 
-    return hold_str, attack_str, defend_str, prevent_str
+def add_support(T, order, state, orders, unit_index, hold_str, attack_str, defend_str,
+                prevent_str, convoy):
+    """Add the strength of a successful support order to the unit it assists."""
+    if not order['target']:
+        hold_str[get_territory(order['assist'])] += 1
+    else:
+        if attack_str[get_territory(order['assist'])]:
+            T2 = get_territory(order['target'])
+            d2 = state.get(T2, False)
+            if T2 not in orders:
+                attack_str[get_territory(order['assist'])] += 1
+            elif (d2
+                  and orders[T2]['action'] == 'M'
+                  and not head_to_head(T, order, T2, orders[T2],
+                                       convoy[T], convoy[T2])):
+                attack_str[get_territory(order['assist'])] += 1
+            # other unit is not ours
+            elif unit_index[T]['government'] != unit_index[T2]['government']:
+                attack_str[get_territory(order['assist'])] += 1
+        if defend_str[get_territory(order['assist'])]:
+            defend_str[get_territory(order['assist'])] += 1
+        if prevent_str[get_territory(order['assist'])]:
+            prevent_str[get_territory(order['assist'])] += 1
 
 
 def calculate_supports(state, orders, unit_index, hold_str, attack_str, defend_str,
@@ -188,30 +257,12 @@ def calculate_supports(state, orders, unit_index, hold_str, attack_str, defend_s
         if not d or order['action'] != 'S':
             continue
 
-        if not order['target']:
-            hold_str[get_territory(order['assist'])] += 1
-        else:
-            if attack_str[get_territory(order['assist'])]:
-                T2 = get_territory(order['target'])
-                d2 = state.get(T2, False)
-                if T2 not in orders:
-                    attack_str[get_territory(order['assist'])] += 1
-                elif (d2
-                      and orders[T2]['action'] == 'M'
-                      and not head_to_head(T, order, T2, orders[T2],
-                                           convoy[T], convoy[T2])):
-                    attack_str[get_territory(order['assist'])] += 1
-                # other unit is not ours
-                elif unit_index[T]['government'] != unit_index[T2]['government']:
-                    attack_str[get_territory(order['assist'])] += 1
-            if defend_str[get_territory(order['assist'])]:
-                defend_str[get_territory(order['assist'])] += 1
-            if prevent_str[get_territory(order['assist'])]:
-                prevent_str[get_territory(order['assist'])] += 1
-
-
-def consistent_move(T, d, orders, fails, hold_str, attack_str, defend_str, prevent_str,
-                    path, convoy):
+        add_support(T, order, state, orders, unit_index, hold_str, attack_str, defend_str,
+                    prevent_str, convoy)
+
+
+def consistent_move(T, d, orders, attackers, fails, hold_str, attack_str, defend_str,
+                    prevent_str, path, convoy):
     order = orders[T]
     target = get_territory(order['target'])
     move = True
@@ -228,9 +279,8 @@ def consistent_move(T, d, orders, fails, hold_str, attack_str, defend_str, preve
         move = False
     # Fail in a competing attack
     if any(attack_str[T] <= prevent_str[T2]
-           for T2, o2 in orders.items()
-           if T != T2 and o2['action'] == 'M'
-           and get_territory(o2['target']) == target):
+           for T2 in attackers.get(target, ())
+           if T != T2):
         move = False
     # Path to move does not exist
     if not path[T]:
@@ -247,12 +297,10 @@ def consistent_move(T, d, orders, fails, hold_str, attack_str, defend_str, preve
     return True
 
 
-def consistent_support(T, d, orders, fails, hold_str, attack_str):
+def consistent_support(T, d, orders, attackers, fails, hold_str, attack_str):
     order = orders[T]
     target = get_territory(order['target'])
-    attackers = set(T2 for T2, o2 in orders.items()
-                    if o2['action'] == 'M'
-                    and get_territory(o2['target']) == T)
+    attackers = attackers.get(T, ())
     # Is the support cut?
     cut = (T in fails
            or (target in attackers
@@ -268,15 +316,13 @@ def consistent_support(T, d, orders, fails, hold_str, attack_str):
     return True
 
 
-def consistent_hold(T, d, orders, fails, hold_str, attack_str, prevent_str):
+def consistent_hold(T, d, orders, attackers, fails, hold_str, attack_str, prevent_str):
     hold = True
     # The order was initially observed to be a failure.
     if T in fails:
         hold = False
 
-    attackers = set(T2 for T2, o2 in orders.items()
-                    if o2['action'] == 'M'
-                    and get_territory(o2['target']) == T)
+    attackers = attackers.get(T, ())
     # Is there enough to dislodge this unit?
     if attackers:
         S, P, A = max((attack_str[T2], prevent_str[T2], T2)
@@ -295,9 +341,27 @@ def consistent_hold(T, d, orders, fails, hold_str, attack_str, prevent_str):
     return True
 
 
+def consistent_order(T, d, orders, attackers, fails, hold_str, attack_str, defend_str,
+                     prevent_str, path, convoy):
+    order = orders[T]
+    if order['action'] == 'M':
+        return consistent_move(T, d, orders, attackers, fails, hold_str, attack_str,
+                               defend_str, prevent_str, path, convoy)
+
+    if order['action'] == 'S':
+        return consistent_support(T, d, orders, attackers, fails, hold_str, attack_str)
+
+    if order['action'] in ('H', 'C'):
+        return consistent_hold(T, d, orders, attackers, fails, hold_str, attack_str,
+                               prevent_str)
+
+    return True
+
+
 def consistent(state, orders, fails, paradox, units):
     state = dict(state)
     unit_index = {get_territory(u['subregion']): u for u in units}
+    attackers = index_attackers(orders)
 
     path, convoy = calculate_paths(state, orders, paradox, units)
     hold_str, attack_str, defend_str, prevent_str = calculate_base_strengths(
@@ -306,57 +370,204 @@ def consistent(state, orders, fails, paradox, units):
                        prevent_str, convoy)
 
     # determine if the strength calculations are consistent with the state
-    for T, d in state.items():
-        order = orders[T]
-        if order['action'] == 'M':
-            if not consistent_move(T, d, orders, fails, hold_str, attack_str, defend_str,
-                                   prevent_str, path, convoy):
-                return False
+    return all(
+        consistent_order(T, d, orders, attackers, fails, hold_str, attack_str, defend_str,
+                         prevent_str, path, convoy)
+        for T, d in state.items()
+    )
 
-        if order['action'] == 'S':
-            if not consistent_support(T, d, orders, fails, hold_str, attack_str):
-                return False
 
-        if order['action'] in ('H', 'C'):
-            if not consistent_hold(T, d, orders, fails, hold_str, attack_str,
-                                   prevent_str):
-                return False
+class Adjudication(object):
+    """
+    The paths and strengths implied by a partial hypothesis of
+    decisions.  Assuming a new decision only recalculates the
+    territories that decision can affect, and each assumption can be
+    undone when the search backtracks.
 
-    return True
+    """
+
+    def __init__(self, orders, fails, paradox, units):
+        self.orders, self.fails, self.paradox, self.units = orders, fails, paradox, units
+        self.unit_index = {get_territory(u['subregion']): u for u in units}
+
+        self.attackers = index_attackers(orders)
+        self.supporters = index_assists(orders, 'S')
+        self.convoyers = index_assists(orders, 'C')
+
+        # The territories of units that are given support to move into a territory.
+        self.supported = defaultdict(set)
+        for T, order in orders.items():
+            if order['action'] == 'S' and order['target']:
+                self.supported[get_territory(order['target'])].add(
+                    get_territory(order['assist']))
+
+        self.state = {}
+        self.history = []
+
+        self.path, self.convoy = defaultdict(lambda: False), defaultdict(lambda: False)
+        self.hold_str, self.attack_str = defaultdict(int), defaultdict(int)
+        self.defend_str, self.prevent_str = defaultdict(int), defaultdict(int)
+
+        for T, order in orders.items():
+            if order['action'] == 'M':
+                self._calculate_path(T)
+        for T in orders:
+            self._calculate_strengths(T)
+
+    @property
+    def decisions(self):
+        return tuple((T, self.state[T]) for T, paths, strengths in self.history)
+
+    def _calculate_path(self, T):
+        self.path[T], self.convoy[T] = order_path(
+            T, self.orders[T], self.state, self.orders, self.paradox, self.units,
+            self.convoyers)
+
+    def _calculate_strengths(self, T):
+        base_strengths(T, self.orders[T], self.state, self.orders, self.unit_index,
+                       self.hold_str, self.attack_str, self.defend_str, self.prevent_str,
+                       self.path, self.convoy)
+        for T2 in self.supporters.get(T, ()):
+            if self.state.get(T2):
+                add_support(T2, self.orders[T2], self.state, self.orders, self.unit_index,
+                            self.hold_str, self.attack_str, self.defend_str,
+                            self.prevent_str, self.convoy)
+
+    def assume(self, T, d):
+        """
+        Add the decision `d` for the order at `T` to the hypothesis.
+        Returns the territories whose consistency may have changed.
+
+        """
+        order = self.orders[T]
+        self.state[T] = d
+
+        # A convoy decision changes the path of the move it assists.
+        paths = set()
+        if order['action'] == 'C':
+            T2 = get_territory(order['assist'])
+            if T2 in self.orders and self.orders[T2]['action'] == 'M':
+                paths.add(T2)
+
+        # Strengths depend on the decision of the unit in the target
+        # territory, on whether that unit was convoyed, and on the
+        # decisions of any supports given.
+        touched = set()
+        for T2 in {T} | paths:
+            touched.add(T2)
+            touched.update(self.attackers.get(T2, ()))
+            touched.update(self.supported.get(T2, ()))
+        if order['action'] == 'S':
+            touched.add(get_territory(order['assist']))
+        touched &= set(self.orders)
+
+        saved_paths = {T2: (self.path[T2], self.convoy[T2]) for T2 in paths}
+        saved_strengths = {
+            T2: (self.hold_str[T2], self.attack_str[T2],
+                 self.defend_str[T2], self.prevent_str[T2])
+            for T2 in touched
+        }
+        self.history.append((T, saved_paths, saved_strengths))
+
+        for T2 in paths:
+            self._calculate_path(T2)
+        for T2 in touched:
+            self._calculate_strengths(T2)
+
+        # The consistency of an order depends on its own strengths, those
+        # of the units attacking it, and those of the units competing for
+        # or occupying its target.
+        affected = set(touched)
+        for T2 in touched:
+            affected.update(self.attackers.get(T2, ()))
+            if self.orders[T2]['action'] == 'M':
+                target = get_territory(self.orders[T2]['target'])
+                if target in self.orders:
+                    affected.add(target)
+                affected.update(self.attackers.get(target, ()))
+        return affected
+
+    def undo(self):
+        """Remove the most recent assumption from the hypothesis."""
+        T, saved_paths, saved_strengths = self.history.pop()
+        del self.state[T]
+
+        for T2, (path, convoy) in saved_paths.items():
+            self.path[T2], self.convoy[T2] = path, convoy
+        for T2, (hold, attack, defend, prevent) in saved_strengths.items():
+            self.hold_str[T2], self.attack_str[T2] = hold, attack
+            self.defend_str[T2], self.prevent_str[T2] = defend, prevent
+
+    def consistent(self, territories):
+        """Check the assumed decisions for the given territories against the strengths."""
+        return all(
+            consistent_order(T, self.state[T], self.orders, self.attackers, self.fails,
+                             self.hold_str, self.attack_str, self.defend_str,
+                             self.prevent_str, self.path, self.convoy)
+            for T in territories
+            if T in self.state
+        )
+
+
+def _resolve(adjudication, dep, dirty):
+    state = adjudication.state
+
+    # A depth-first search over hypotheses, kept on an explicit stack.
+    # Each frame is an order whose decision is being guessed, the
+    # guesses for it not yet tried, and the orders that were in need
+    # of a consistency check before the guess was made.
+    frames = []
+    while True:
+        # Only bother calculating whether the hypothetical solution is
+        # consistent if all orders within it have no remaining
+        # unresolved dependencies.  Orders that weren't affected by any
+        # assumption since the last such check are already known to be
+        # consistent.
+        failed = False
+        if all(all(o in state for o in dep[T]) for T in state):
+            failed = not adjudication.consistent(dirty)
+            if not failed:
+                dirty = set()
+
+        if not failed:
+            # For those orders not already in 'state', find the one with the
+            # fewest remaining dependencies.
+            remaining_deps = [
+                (sum(1 for o in dep[T] if o not in state), T)
+                for T in adjudication.orders
+                if T not in state
+            ]
+            if not remaining_deps:
+                return adjudication.decisions
+            q, T = min(remaining_deps)
+
+            # Unresolved dependencies might be circular, so it isn't
+            # obvious how to resolve them.  Try both ways, with preference
+            # for 'success'.
+            resolutions = (None, False) if T in adjudication.paradox else (True, False)
+            frames.append((T, list(resolutions), dirty))
+
+        # Move on to the next untried guess, backing out of any orders
+        # whose guesses have all been tried.
+        while frames:
+            T, resolutions, before = frames[-1]
+            if T in state:
+                adjudication.undo()
+            if resolutions:
+                dirty = before | adjudication.assume(T, resolutions.pop(0))
+                break
+            frames.pop()
+        else:
+            return None
 
 
 def resolve(state, orders, dep, fails, paradox, units):
-    _state = set(T for T, d in state)
+    adjudication = Adjudication(orders, fails, paradox, units)
+    dirty = set()
+    for T, d in state:
+        dirty |= adjudication.assume(T, d)
 
-    # Only bother calculating whether the hypothetical solution is
-    # consistent if all orders within it have no remaining
-    # unresolved dependencies.
-    if all(all(o in _state for o in dep[T]) for T, d in state):
-        if not consistent(state, orders, fails, paradox, units):
-            return None
-
-    # For those orders not already in 'state', sort from least to
-    # most remaining dependencies.
-    remaining_deps = sorted(
-        (sum(1 for o in dep[T] if o not in _state), T)
-        for T in orders
-        if T not in _state
-    )
-    if not remaining_deps:
-        return state
-    # Go with the order with the fewest remaining deps.
-    q, T = remaining_deps[0]
-
-    # Unresolved dependencies might be circular, so it isn't
-    # obvious how to resolve them.  Try both ways, with preference
-    # for 'success'.
-    resolutions = (None, False) if T in paradox else (True, False)
-    for S in resolutions:
-        result = resolve(state + ((T, S),), orders, dep, fails, paradox, units)
-        if result:
-            return result
-
-    return None
+    return _resolve(adjudication, dep, dirty)
 
 
 def resolve_retreats(orders):
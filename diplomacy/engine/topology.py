@@ -0,0 +1,59 @@
+"""
+The map of `standard`, compiled once into dense integer ids.
+
+Territories and subregions are numbered in sorted token order, facts
+about each are stored in lists indexed by id, and adjacency is stored
+both as tuples of ids and as bitsets, one int per subregion with bit
+`j` set when subregion `j` borders it.
+
+"""
+from . import standard
+
+
+class Topology(object):
+    def __init__(self, subregion_groups, connectivity, starting_state):
+        self.territories = sorted(subregion_groups)
+        self.territory_id = {T: i for i, T in enumerate(self.territories)}
+
+        self.subregions = sorted(sr for srs in subregion_groups.values() for sr in srs)
+        self.subregion_id = {sr: i for i, sr in enumerate(self.subregions)}
+
+        # Per subregion
+        self.territory_of = [self.territory_id[sr.split(u'.')[0]] for sr in self.subregions]
+        self.land = [sr.endswith(u'.l') for sr in self.subregions]
+        self.sea = [sr.endswith(u'.s') for sr in self.subregions]
+        self.borders = [
+            tuple(sorted(self.subregion_id[b] for b in connectivity.get(sr, ())))
+            for sr in self.subregions
+        ]
+        self.adjacency = [sum(1 << b for b in borders) for borders in self.borders]
+
+        # Per territory
+        self.parts = [
+            tuple(sorted(self.subregion_id[sr] for sr in subregion_groups[T]))
+            for T in self.territories
+        ]
+        self.coasts = [tuple(sr for sr in parts if self.sea[sr]) for parts in self.parts]
+        self.has_land = [any(self.land[sr] for sr in parts) for parts in self.parts]
+        self.has_sea = [bool(coasts) for coasts in self.coasts]
+        self.supply = [bool(starting_state.get(T, (None, False, None))[1])
+                       for T in self.territories]
+        self.home = [starting_state.get(T, (None, False, None))[0] for T in self.territories]
+
+        # Token lookups, for the helpers in `utils`
+        self.territory_token = {sr: self.territories[self.territory_of[i]]
+                                for i, sr in enumerate(self.subregions)}
+        self.territory_token.update((T, T) for T in self.territories)
+
+    def adjacent(self, sr1, sr2):
+        return bool(self.adjacency[sr1] >> sr2 & 1)
+
+    def subregion_mask(self, sr_ids):
+        return sum(1 << sr for sr in set(sr_ids))
+
+    def mask_subregions(self, mask):
+        return [sr for sr in range(len(self.subregions)) if mask >> sr & 1]
+
+
+standard_map = Topology(standard.subregion_groups, standard.connectivity,
+                        standard.starting_state)
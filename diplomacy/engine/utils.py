@@ -1,13 +1,25 @@
 from . import standard
+from .topology import standard_map
 
 
 convert = {'L': 'A', 'S': 'F'}
 
+_territory_token = standard_map.territory_token
+
+_land_territories = {T for T, land in zip(standard_map.territories, standard_map.has_land)
+                     if land}
+
+_sea_territories = {T for T, sea in zip(standard_map.territories, standard_map.has_sea)
+                    if sea}
+
 
 def get_territory(sr_token):
     if not sr_token:
         return u''
-    return sr_token.split(u'.')[0]
+    T = _territory_token.get(sr_token)
+    if T is None:
+        return sr_token.split(u'.')[0]
+    return T
 
 
 def territory_parts(t_token):
@@ -53,6 +65,11 @@ def subregion_token(sr_tuple):
     return standard.inv_subregions.get(sr_tuple, u'')
 
 
+def lineage_token(number, subregion):
+    """Identifies a unit by the turn number and subregion it started from."""
+    return u"{0}:{1}".format(number, subregion)
+
+
 def is_supply(sr_token):
     return bool(standard.starting_state.get(sr_token, (None, None, None))[1])
 
@@ -66,11 +83,11 @@ def is_sea(sr_token):
 
 
 def has_land(sr_token):
-    return any(is_land(sr) for sr in territory_parts(get_territory(sr_token)))
+    return get_territory(sr_token) in _land_territories
 
 
 def has_sea(sr_token):
-    return any(is_sea(sr) for sr in territory_parts(get_territory(sr_token)))
+    return get_territory(sr_token) in _sea_territories
 
 
 is_army = is_land
@@ -1,11 +1,11 @@
 from collections import defaultdict
 
-from django.forms import Form, ValidationError, ChoiceField
+from django.forms import Form, ValidationError, ChoiceField, HiddenInput, IntegerField
 from django.forms.models import ModelForm, BaseFormSet
 
 from .engine import standard
 from .engine.check import is_legal
-from .engine.digest import find_convoys, builds_available
+from .engine.digest import find_convoys
 from .engine.utils import get_territory, borders, is_army, is_fleet, subregion_display, unit_display
 from .models import Order
 
@@ -52,6 +52,7 @@ class OrderForm(ModelForm):
 
     def __init__(self, *args, **kwargs):
         self.government = kwargs.pop('government', None)
+        self.turn = kwargs.pop('turn', None)
 
         super(OrderForm, self).__init__(*args, **kwargs)
 
@@ -63,14 +64,12 @@ class OrderForm(ModelForm):
             self.fields[w].widget.attrs['class'] = c
 
     def clean(self):
-        turn = self.government.game.current_turn()
-        units = turn.get_units()
-        owns = turn.get_ownership()
+        turn = self.turn or self.government.game.current_turn()
+        board = turn.get_board()
         actor = self.cleaned_data.get('actor')
         if turn.season == 'FA':
             # Fall Adjustment builds are optional.
-            builds = builds_available(units, owns)
-            if builds.get(self.government.power, 0) > 0 and actor is None:
+            if board.builds.get(self.government.power, 0) > 0 and actor is None:
                 return {}
         else:
             if actor != self.initial['actor']:
@@ -79,22 +78,23 @@ class OrderForm(ModelForm):
         order = self.initial.copy()
         order.update(self.cleaned_data)
         order['government'] = self.government.power
-        if not is_legal(order, units, owns, turn.season):
+        if not is_legal(order, board.units, board.owns, turn.season, board=board):
             raise ValidationError("Illegal order.")
 
         return self.cleaned_data
 
 
 class OrderFormSet(BaseFormSet):
-    def __init__(self, government, data=None, **kwargs):
+    def __init__(self, government, turn=None, data=None, **kwargs):
         self.government = government
-        self.turn = government.game.current_turn()
+        self.turn = turn or government.game.current_turn()
         self.season = self.turn.season
 
         super(OrderFormSet, self).__init__(data=data, **kwargs)
 
     def _construct_form(self, *args, **kwargs):
         kwargs['government'] = self.government
+        kwargs['turn'] = self.turn
         return super(OrderFormSet, self)._construct_form(*args, **kwargs)
 
     def save(self, commit=True):
@@ -204,9 +204,7 @@ class OrderFormSet(BaseFormSet):
             actors.add(actor)
 
         if self.season == 'FA':
-            builds = builds_available(
-                self.turn.get_units(), self.turn.get_ownership()
-            ).get(self.government.power)
+            builds = self.turn.get_board().builds.get(self.government.power)
             if builds >= 0 and len(actors) > builds:
                 raise ValidationError("You may not build more units than"
                                       " you have supply centers.")
@@ -217,4 +215,6 @@ class OrderFormSet(BaseFormSet):
 
 
 class GameMasterForm(Form):
-    pass
+    # The number of the turn the game master was looking at, so that
+    # it is not generated a second time by a repeated submission.
+    turn = IntegerField(required=False, widget=HiddenInput)
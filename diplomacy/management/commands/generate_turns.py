@@ -0,0 +1,270 @@
+from collections import defaultdict
+import json
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Case, DateTimeField, IntegerField, Value, When
+
+from ...engine.check import legal_orders
+from ...engine.digest import actionable_subregions, standings
+from ...engine.main import generate_many
+from ...engine.packing import pack
+from ...engine.utils import is_supply
+from ...models import (CanonicalOrder, Game, Government, Order, OrderPost, Ownership,
+                       Standing, Turn, Unit)
+from ...plugins import governments_ready
+
+
+class Batch(object):
+    """
+    The current turns of a set of games, loaded together with a fixed
+    number of queries however many games there are, and the engine
+    data for each of them.
+
+    """
+
+    def __init__(self, games):
+        self.turns = {
+            t.game_id: t
+            for t in Turn.objects.filter(
+                pk__in=[g.latest_turn_id for g in games if g.latest_turn_id is not None]
+            ).defer('legal_orders')
+        }
+
+        self.governments = defaultdict(list)
+        for gvt in Government.objects.filter(game__in=list(self.turns)):
+            self.governments[gvt.game_id].append(gvt)
+        self.powers = {gvt.pk: gvt.power for gvts in self.governments.values() for gvt in gvts}
+
+        turn_ids = {t.pk: t.game_id for t in self.turns.values()}
+
+        # Turns with a packed board need no Unit or Ownership rows.
+        self.units, self.owns = defaultdict(list), defaultdict(list)
+        unpacked = {}
+        for t in self.turns.values():
+            if t.packed_board:
+                self.units[t.game_id], self.owns[t.game_id] = t.get_units(), t.get_ownership()
+            else:
+                unpacked[t.pk] = t.game_id
+
+        for u in Unit.objects.filter(turn__in=list(unpacked)):
+            self.units[turn_ids[u.turn_id]].append({
+                'government': self.powers[u.government_id],
+                'u_type': u.u_type,
+                'subregion': u.subregion,
+                'previous': u.previous,
+                'dislodged': u.dislodged,
+                'displaced_from': u.displaced_from,
+                'standoff_from': u.standoff_from,
+                'lineage': u.lineage,
+            })
+
+        for o in Ownership.objects.filter(turn__in=list(unpacked)):
+            self.owns[turn_ids[o.turn_id]].append({
+                'territory': o.territory,
+                'government': self.powers[o.government_id],
+                'is_supply': is_supply(o.territory),
+            })
+
+        # As in `Turn.get_orders`, only the latest post of each
+        # government counts.
+        posts = {}
+        for p in OrderPost.objects.filter(turn__in=list(turn_ids)):
+            posts[(p.turn_id, p.government_id)] = p
+
+        self.orders = defaultdict(list)
+        latest_posts = {p.pk: p for p in posts.values()}
+        for o in Order.objects.filter(post__in=list(latest_posts)):
+            post = latest_posts[o.post_id]
+            self.orders[turn_ids[post.turn_id]].append({
+                'government': self.powers[post.government_id],
+                'actor': o.actor,
+                'action': o.action,
+                'assist': o.assist,
+                'target': o.target,
+                'via_convoy': o.via_convoy,
+            })
+
+    def payload(self, game_id):
+        return (self.turns[game_id].as_data(), self.orders[game_id],
+                self.units[game_id], self.owns[game_id])
+
+    def ready(self, game_id, readys=()):
+        """
+        Whether the game is ready to generate, by the same rule as
+        `TurnGeneration.is_ready`, with the governments marked ready
+        through django-turngeneration in `readys`.
+
+        """
+        turn, orders, units, owns = self.payload(game_id)
+        return governments_ready(
+            self.governments[game_id],
+            actionable_subregions(turn, units, owns),
+            readys
+        )
+
+    def save(self, results):
+        """
+        Stores the generated turns for the games in `results`, a dict of
+        game pk to the (turn, orders, units, owns) returned by the engine.
+        Each kind of object is written with one `bulk_create`.
+
+        """
+        packed = getattr(settings, 'DIPLOMACY_PACKED_BOARD', False)
+        turns = Turn.objects.bulk_create([
+            Turn(game_id=game_id,
+                 legal_orders=json.dumps(legal_orders(units, owns, turn['season']),
+                                         sort_keys=True),
+                 packed_board=pack(units, owns) if packed else '',
+                 **turn)
+            for game_id, (turn, orders, units, owns) in results.items()
+        ])
+        # The new primary keys are not returned by every database.
+        new_turns = {
+            t.game_id: t.pk
+            for t in Turn.objects.filter(
+                game__in=list(results),
+                number__in=set(turn['number'] for turn, o, u, w in results.values())
+            ).only('game', 'number')
+            if results[t.game_id][0]['number'] == t.number
+        }
+
+        # As in `Game.create_turn`.
+        if turns:
+            Game.objects.filter(pk__in=list(results)).update(
+                latest_turn=Case(
+                    *[When(pk=game_id, then=Value(pk)) for game_id, pk in new_turns.items()],
+                    output_field=IntegerField()
+                ),
+                last_generated=Case(
+                    *[When(pk=t.game_id, then=Value(t.generated)) for t in turns],
+                    output_field=DateTimeField()
+                ),
+            )
+
+        lookup = {
+            game_id: {gvt.power: gvt.pk for gvt in self.governments[game_id]}
+            for game_id in results
+        }
+
+        CanonicalOrder.objects.bulk_create([
+            CanonicalOrder(turn_id=self.turns[game_id].pk,
+                           government_id=lookup[game_id][o['government']],
+                           actor=o['actor'],
+                           action=o['action'],
+                           assist=o.get('assist', ''),
+                           target=o.get('target', ''),
+                           via_convoy=o['via_convoy'],
+                           user_issued=o.get('user_issued', False),
+                           result=o['result'],
+                           lineage=o.get('lineage', ''))
+            for game_id, (turn, orders, units, owns) in results.items()
+            for o in orders
+        ])
+        Unit.objects.bulk_create([
+            Unit(turn_id=new_turns[game_id],
+                 government_id=lookup[game_id][u['government']],
+                 u_type=u['u_type'],
+                 subregion=u['subregion'],
+                 previous=u.get('previous', ''),
+                 dislodged=u.get('dislodged', False),
+                 displaced_from=u.get('displaced_from', ''),
+                 standoff_from=u.get('standoff_from', ''),
+                 lineage=u['lineage'])
+            for game_id, (turn, orders, units, owns) in results.items()
+            for u in units
+        ])
+        Ownership.objects.bulk_create([
+            Ownership(turn_id=new_turns[game_id],
+                      government_id=lookup[game_id][o['government']],
+                      territory=o['territory'])
+            for game_id, (turn, orders, units, owns) in results.items()
+            for o in owns
+        ])
+        Standing.objects.bulk_create([
+            Standing(turn_id=new_turns[game_id],
+                     government_id=lookup[game_id][government],
+                     **standing)
+            for game_id, (turn, orders, units, owns) in results.items()
+            for government, standing in standings(turn, units, owns).items()
+        ])
+
+
+def turngeneration_readies(games):
+    """
+    The governments marked ready through django-turngeneration, by
+    game pk, if that app is installed.
+
+    """
+    if not apps.is_installed('turngeneration'):
+        return {}
+    from django.contrib.contenttypes.models import ContentType
+
+    Generator = apps.get_model('turngeneration', 'Generator')
+    generators = Generator.objects.filter(
+        content_type=ContentType.objects.get_for_model(Game),
+        object_id__in=[g.pk for g in games],
+    ).prefetch_related('readies__agent')
+    return {
+        int(generator.object_id): set(r.agent.pk for r in generator.readies.all())
+        for generator in generators
+    }
+
+
+class Command(BaseCommand):
+    help = ("Generates the next turn of every active game that is ready: all of "
+            "the governments with something to order have been marked ready "
+            "through django-turngeneration.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('slugs', nargs='*', metavar='slug',
+                            help="only consider the games with these slugs")
+        parser.add_argument('--force', action='store_true',
+                            help="generate the games even if they are not ready")
+        parser.add_argument('--workers', type=int, default=None,
+                            help="processes to adjudicate with (default: one per CPU)")
+
+    def handle(self, *args, **options):
+        start = time.time()
+
+        games = Game.objects.filter(state='A').order_by('pk')
+        if options['slugs']:
+            games = games.filter(slug__in=options['slugs'])
+        games = list(games)
+
+        batch = Batch(games)
+        readys = turngeneration_readies(games)
+        due = [
+            game_id for game_id in sorted(batch.turns)
+            if options['force'] or batch.ready(game_id, readys.get(game_id, ()))
+        ]
+        loaded = time.time()
+
+        generated = generate_many(
+            [batch.payload(game_id) for game_id in due],
+            adjudicator=getattr(settings, 'DIPLOMACY_ADJUDICATOR', 'search'),
+            workers=options['workers'],
+        )
+        adjudicated = time.time()
+
+        with transaction.atomic():
+            # Lock the games, then leave out any whose turn has been
+            # generated elsewhere while this batch was adjudicated.
+            latest = dict(Game.objects.select_for_update().filter(pk__in=due)
+                          .values_list('pk', 'latest_turn'))
+            results = {
+                game_id: result for game_id, result in zip(due, generated)
+                if latest.get(game_id) == batch.turns[game_id].pk
+            }
+            batch.save(results)
+        saved = time.time()
+
+        elapsed = saved - start
+        self.stdout.write(
+            "Generated {0} of {1} game(s) in {2:.2f}s ({3:.1f} turns/s): "
+            "loading {4:.2f}s, adjudicating {5:.2f}s, saving {6:.2f}s.".format(
+                len(results), len(games), elapsed, len(results) / elapsed if elapsed else 0.0,
+                loaded - start, adjudicated - loaded, saved - adjudicated))
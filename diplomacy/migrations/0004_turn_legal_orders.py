@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diplomacy', '0003_auto_20190615_1903'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='turn',
+            name='legal_orders',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diplomacy', '0004_turn_legal_orders'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='turn',
+            unique_together=set([('game', 'number')]),
+        ),
+    ]
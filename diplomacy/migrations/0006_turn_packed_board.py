@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diplomacy', '0005_turn_unique_number'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='turn',
+            name='packed_board',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
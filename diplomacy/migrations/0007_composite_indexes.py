@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diplomacy', '0006_turn_packed_board'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='turn',
+            index_together=set([('game', 'season', 'year'), ('game', 'generated')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='government',
+            index_together=set([('game', 'power')]),
+        ),
+    ]
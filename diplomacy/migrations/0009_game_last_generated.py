@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.db.models import Max
+import django.utils.timezone
+
+
+def set_last_generated(apps, schema_editor):
+    Game = apps.get_model('diplomacy', 'Game')
+    Turn = apps.get_model('diplomacy', 'Turn')
+
+    latest = dict(Turn.objects.order_by().values_list('game').annotate(Max('generated')))
+    for game in Game.objects.only('created'):
+        game.last_generated = latest.get(game.pk, game.created)
+        game.save(update_fields=['last_generated'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diplomacy', '0008_lineage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='last_generated',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+        migrations.AlterIndexTogether(
+            name='game',
+            index_together=set([('state', 'last_generated')]),
+        ),
+        migrations.RunPython(set_last_generated, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def set_latest_turn(apps, schema_editor):
+    Game = apps.get_model('diplomacy', 'Game')
+    Turn = apps.get_model('diplomacy', 'Turn')
+
+    for game in Game.objects.only('pk'):
+        turn = Turn.objects.filter(game=game).order_by('-generated').only('pk').first()
+        if turn is not None:
+            game.latest_turn = turn
+            game.save(update_fields=['latest_turn'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diplomacy', '0009_game_last_generated'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='latest_turn',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='diplomacy.Turn'),
+        ),
+        migrations.RunPython(set_latest_turn, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diplomacy', '0010_game_latest_turn'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Standing',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('supply_centers', models.IntegerField()),
+                ('units', models.IntegerField()),
+                ('builds', models.IntegerField()),
+                ('actionable', models.BooleanField(default=False)),
+                ('orders_submitted', models.BooleanField(default=False)),
+                ('government', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='diplomacy.Government')),
+                ('turn', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='diplomacy.Turn')),
+            ],
+            options={
+                'unique_together': set([('turn', 'government')]),
+            },
+        ),
+    ]
@@ -1,21 +1,26 @@
 from collections import defaultdict
 from functools import partial
 from random import shuffle
+import json
 
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.urls import reverse
+from django.utils import timezone
 
 from .engine import standard
-from .engine.check import (valid_hold, valid_move, valid_support, valid_convoy,
-                           valid_build, valid_disband)
-from .engine.digest import builds_available, actionable_subregions
+from .engine.board import derived, snapshot
+from .engine.check import legal_orders
+from .engine.digest import actionable_subregions, standings
 from .engine.main import generate, initialize_game
-from .engine.utils import is_supply, unit_display, subregion_display
+from .engine.packing import pack, unpack
+from .engine.utils import is_supply, lineage_token, unit_display, subregion_display
 
 
 convert = {'L': 'A', 'S': 'F'}
 
+
 SEASON_CHOICES = (
     ('S', 'Spring'),
     ('SR', 'Spring Retreat'),
@@ -47,6 +52,9 @@ class DiplomacyPrefs(models.Model):
 
 
 class Game(models.Model):
+    class Meta:
+        index_together = ('state', 'last_generated')
+
     STATE_CHOICES = (
         ('S', 'Setup'),
         ('A', 'Active'),
@@ -60,6 +68,11 @@ class Game(models.Model):
     created = models.DateTimeField(auto_now_add=True)
     state = models.CharField(max_length=1, choices=STATE_CHOICES, default='S')
     open_joins = models.BooleanField(default=True)
+    # The current turn, and when it was generated, or when the game was
+    # created if it has no turns yet.  Kept up to date by `create_turn`.
+    latest_turn = models.ForeignKey('Turn', null=True, blank=True,
+                                    on_delete=models.SET_NULL, related_name='+')
+    last_generated = models.DateTimeField(default=timezone.now, db_index=True)
 
     def __unicode__(self):
         return self.name
@@ -68,13 +81,23 @@ class Game(models.Model):
         return reverse('diplomacy_game_detail', kwargs={'slug': self.slug})
 
     def governments(self, turn=None):
+        if turn:
+            standings = list(turn.standing_set.select_related('government'))
+            if standings:
+                return sorted(
+                    ((s.government, s.supply_centers, s.units, s.ready) for s in standings),
+                    key=lambda x: (-x[1], -x[2], getattr(x[0].power, 'name', None))
+                )
+
+        # Turns from before standings were stored are worked out in full.
         gvts = self.government_set.all()
         units, owns, posts, actors = (), (), (), {}
         if turn:
             units = turn.get_units()
             owns = turn.get_ownership()
             posts = turn.posts.select_related('government')
-            actors = actionable_subregions(turn.as_data(), units, owns)
+            actors = actionable_subregions(turn.as_data(), units, owns,
+                                           board=turn.get_board(units, owns))
 
         return sorted(
             ((g,
@@ -88,11 +111,28 @@ class Game(models.Model):
         )
 
     def current_turn(self):
-        if self.turn_set.exists():
-            return self.turn_set.latest()
+        """
+        The latest turn, read through `latest_turn` and kept on the
+        instance, so that only the first call makes a query.  Turns
+        not made by `create_turn` are looked for directly.
+
+        """
+        if self.latest_turn_id is None and self.state != 'S':
+            try:
+                self.latest_turn = self.turn_set.latest()
+            except Turn.DoesNotExist:
+                return None
+
+        turn = self.latest_turn
+        if turn is not None and turn.game_id == self.pk:
+            turn.game = self
+        return turn
 
     def create_turn(self, turn_data):
-        return self.turn_set.create(**turn_data)
+        turn = self.turn_set.create(**turn_data)
+        Game.objects.filter(pk=self.pk).update(latest_turn=turn, last_generated=turn.generated)
+        self.latest_turn, self.last_generated = turn, turn.generated
+        return turn
 
     def activate(self):
         if self.state != 'S' or self.turn_set.exists():
@@ -111,25 +151,52 @@ class Game(models.Model):
         turn = self.create_turn(turn)
         turn.create_units(units)
         turn.create_ownership(owns)
+        turn.store_board(units, owns)
+        turn.create_standings(units, owns)
 
         self.state = 'A'
-        self.save()
+        self.save(update_fields=['state'])
         return True
 
     activate.alters_data = True
 
-    def generate(self):
-        turn = self.current_turn()
-        orders = turn.get_orders()
-        units = turn.get_units()
-        owns = turn.get_ownership()
-
-        turn, orders, units, owns = generate(turn.as_data(), orders, units, owns)
-
+    def save_generated(self, turn, orders, units, owns):
+        """Stores the result of generating the current turn."""
         turn = self.create_turn(turn)
         turn.create_canonical_orders(orders)
         turn.create_units(units)
         turn.create_ownership(owns)
+        turn.store_board(units, owns)
+        turn.create_standings(units, owns)
+        return turn
+
+    save_generated.alters_data = True
+
+    def generate(self, number=None):
+        """
+        Generates the next turn, in one transaction with the game's row
+        locked, so that concurrent calls cannot both generate the same
+        turn.  If `number` is given and the current turn is no longer
+        that one, because it was generated elsewhere in the meantime,
+        nothing is generated and False is returned.
+
+        """
+        try:
+            with transaction.atomic():
+                # The current turn is read from the locked row, not this
+                # instance, which may be out of date.
+                turn = Game.objects.select_for_update().get(pk=self.pk).current_turn()
+                if turn is None or (number is not None and turn.number != number):
+                    return False
+
+                self.save_generated(*generate(
+                    turn.as_data(), turn.get_orders(), turn.get_units(), turn.get_ownership(),
+                    adjudicator=getattr(settings, 'DIPLOMACY_ADJUDICATOR', 'search')))
+        except IntegrityError:
+            # Without row locks, as on SQLite, a concurrent call can get
+            # past the check above, and is stopped by the unique
+            # (game, number) of the new turn instead.
+            return False
 
         return True
 
@@ -140,12 +207,24 @@ class Turn(models.Model):
     class Meta:
         get_latest_by = 'generated'
         ordering = ('-generated',)
+        unique_together = ('game', 'number')
+        index_together = [
+            ('game', 'season', 'year'),
+            ('game', 'generated'),
+        ]
 
     game = models.ForeignKey(Game, on_delete=models.CASCADE)
     number = models.IntegerField()
     year = models.IntegerField()
     season = models.CharField(max_length=2, choices=SEASON_CHOICES)
     generated = models.DateTimeField(auto_now_add=True)
+    # The tree of legal orders for every government, as JSON.  The units
+    # and ownership of a turn never change, so neither does this.
+    legal_orders = models.TextField(blank=True, default='')
+    # The units and ownership, packed by `engine.packing`, if the
+    # DIPLOMACY_PACKED_BOARD setting is on.  When present, this is read
+    # in place of the Unit and Ownership rows.
+    packed_board = models.TextField(blank=True, default='')
 
     def __unicode__(self):
         return "{0} {1}".format(self.get_season_display(), self.year)
@@ -167,25 +246,32 @@ class Turn(models.Model):
             'season': self.season,
         }
 
+    def neighbours(self):
+        """
+        The previous and next turns of the game, either of which may be
+        None.  Both are fetched with one query, the first time either is
+        asked for, without their legal orders or packed board.
+
+        """
+        if not hasattr(self, '_neighbours'):
+            turns = {
+                t.number: t
+                for t in Turn.objects.filter(
+                    game_id=self.game_id,
+                    number__in=(self.number - 1, self.number + 1)
+                ).defer('legal_orders', 'packed_board')
+            }
+            self._neighbours = (turns.get(self.number - 1), turns.get(self.number + 1))
+
+        return self._neighbours
+
     @property
     def prev(self):
-        if getattr(self, '_prev', None):
-            return self._prev
-
-        earlier = self.game.turn_set.filter(number=self.number - 1)
-        if earlier:
-            self._prev = earlier.get()
-            return self._prev
+        return self.neighbours()[0]
 
     @property
     def next(self):
-        if getattr(self, '_next', None):
-            return self._next
-
-        later = self.game.turn_set.filter(number=self.number + 1)
-        if later:
-            self._next = later.get()
-            return self._next
+        return self.neighbours()[1]
 
     @property
     def government_lookup(self):
@@ -209,6 +295,7 @@ class Turn(models.Model):
                 'via_convoy': o['via_convoy'],
                 'user_issued': o.get('user_issued', False),
                 'result': o['result'],
+                'lineage': o.get('lineage', ''),
             })
             for o in orders
         ])
@@ -224,6 +311,7 @@ class Turn(models.Model):
                 'dislodged': u.get('dislodged', False),
                 'displaced_from': u.get('displaced_from', ''),
                 'standoff_from': u.get('standoff_from', ''),
+                'lineage': u.get('lineage') or lineage_token(self.number, u['subregion']),
             })
             for u in units
         ])
@@ -236,43 +324,159 @@ class Turn(models.Model):
             for o in owns
         ])
 
+    def create_standings(self, units, owns):
+        Standing.objects.bulk_create([
+            Standing(turn=self,
+                     government_id=self.government_lookup[government],
+                     **standing)
+            for government, standing in standings(self.as_data(), units, owns).items()
+        ])
+
+    # The units, ownership and orders of a turn are read once per Turn
+    # instance, and shared by everything holding that instance: views,
+    # forms and template tags.  The engine updates unit dicts in place,
+    # so each caller is given its own copies.
+
+    def unpack_board(self):
+        self._units, self._ownership = unpack(self.packed_board)
+
     def get_units(self):
-        return [
-            {'government': u.government.power,
-             'u_type': u.u_type,
-             'subregion': u.subregion,
-             'previous': u.previous,
-             'dislodged': u.dislodged,
-             'displaced_from': u.displaced_from,
-             'standoff_from': u.standoff_from}
-            for u in self.unit_set.select_related('government')
-        ]
+        if getattr(self, '_units', None) is None and self.packed_board:
+            self.unpack_board()
+        if getattr(self, '_units', None) is None:
+            self._units = [
+                {'government': u.government.power,
+                 'u_type': u.u_type,
+                 'subregion': u.subregion,
+                 'previous': u.previous,
+                 'dislodged': u.dislodged,
+                 'displaced_from': u.displaced_from,
+                 'standoff_from': u.standoff_from,
+                 'lineage': u.lineage}
+                for u in self.unit_set.select_related('government')
+            ]
+
+        return [dict(u) for u in self._units]
 
     def get_ownership(self):
-        return [
-            {'territory': o.territory,
-             'government': o.government.power,
-             'is_supply': is_supply(o.territory)}
-            for o in self.ownership_set.select_related('government')
-        ]
+        if getattr(self, '_ownership', None) is None and self.packed_board:
+            self.unpack_board()
+        if getattr(self, '_ownership', None) is None:
+            self._ownership = [
+                {'territory': o.territory,
+                 'government': o.government.power,
+                 'is_supply': is_supply(o.territory)}
+                for o in self.ownership_set.select_related('government')
+            ]
+
+        return [dict(o) for o in self._ownership]
+
+    def store_board(self, units, owns):
+        """
+        Stores what is worked out from the turn's units and ownership when
+        the turn is created: the legal orders and, if the
+        DIPLOMACY_PACKED_BOARD setting is on, the packed board.
+
+        """
+        self.legal_orders = json.dumps(legal_orders(units, owns, self.season), sort_keys=True)
+        fields = ['legal_orders']
+        if getattr(settings, 'DIPLOMACY_PACKED_BOARD', False):
+            self.packed_board = pack(units, owns)
+            fields.append('packed_board')
+        self.save(update_fields=fields)
+
+    def store_legal_orders(self):
+        tree = legal_orders(self.get_units(), self.get_ownership(), self.season)
+        self.legal_orders = json.dumps(tree, sort_keys=True)
+        self.save(update_fields=['legal_orders'])
+        return tree
+
+    def get_legal_orders(self):
+        if not self.legal_orders:
+            return self.store_legal_orders()
+        return json.loads(self.legal_orders)
+
+    def get_board(self, units=None, owns=None):
+        """
+        The engine's board for this turn, with the stored legal orders
+        filled in so that order checks read them instead of working
+        them out again.  Pass in the units and ownership if they have
+        already been fetched.
+
+        """
+        if getattr(self, '_board', None) is None:
+            if units is None:
+                units = self.get_units()
+            if owns is None:
+                owns = self.get_ownership()
+            board = snapshot(units, owns, self.season)
+            derived(board, 'legal_orders', self.get_legal_orders)
+            self._board = board
+
+        return self._board
 
     def get_orders(self):
-        posts = {}
-        for p in self.posts.prefetch_related('orders'):
-            posts[p.government_id] = p
+        if getattr(self, '_orders', None) is None:
+            posts = {}
+            for p in self.posts.select_related('government').prefetch_related('orders'):
+                posts[p.government_id] = p
 
-        return [o.as_data() for p in posts.values()
-                for o in p.orders.all()]
+            self._orders = [o.as_data() for p in posts.values()
+                            for o in p.orders.all()]
+
+        return [dict(o) for o in self._orders]
+
+    recent_seasons = {'S': ['F', 'FR', 'FA'],
+                      'SR': ['S'],
+                      'F': ['S', 'SR'],
+                      'FR': ['F'],
+                      'FA': ['F', 'FR']}
 
     def recent_orders(self):
-        seasons = {'S': ['F', 'FR', 'FA'],
-                   'SR': ['S'],
-                   'F': ['S', 'SR'],
-                   'FR': ['F'],
-                   'FA': ['F', 'FR']}
+        """
+        The orders given since the last turn of the same kind, grouped
+        by power and then by unit, each unit named by where it was when
+        the first of them was given.  Builds are grouped separately.
+
+        """
+        canonical = list(CanonicalOrder.objects.filter(
+            turn__game_id=self.game_id,
+            turn__season__in=self.recent_seasons[self.season],
+            turn__number__gt=self.number - 5,
+            turn__number__lt=self.number
+        ).select_related('turn', 'government').defer(
+            'turn__legal_orders', 'turn__packed_board'
+        ).order_by('turn__number', 'pk'))
+
+        # Waived builds have no actor, and so no unit to follow.
+        if not all(o.lineage for o in canonical if o.actor):
+            return self.recent_orders_by_previous()
+
+        # dict of dicts of lists; keys=power, the unit's first actor
+        orders = defaultdict(partial(defaultdict, list))
+        actors = {}
 
+        for o in canonical:
+            power = o.government.power_display
+            if o.action == 'B':
+                actor = 'b.{0}'.format(o.actor)
+            else:
+                actor = actors.setdefault((o.government_id, o.lineage), o.actor)
+
+            orders[power][actor].append(o)
+
+        return sorted((power, sorted(adict.items()))
+                      for power, adict in orders.items())
+
+    def recent_orders_by_previous(self):
+        """
+        As `recent_orders`, for orders from before lineages were
+        recorded: each unit is traced back through the `previous`
+        subregions of the units of each turn.
+
+        """
         turns = self.game.turn_set.filter(
-            season__in=seasons[self.season],
+            season__in=self.recent_seasons[self.season],
             number__gt=self.number - 5,
             number__lt=self.number
         ).prefetch_related(
@@ -307,6 +511,9 @@ class Turn(models.Model):
 
 
 class Government(models.Model):
+    class Meta:
+        index_together = ('game', 'power')
+
     name = models.CharField(max_length=100)
     user = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL)
     game = models.ForeignKey(Game, on_delete=models.CASCADE)
@@ -319,43 +526,22 @@ class Government(models.Model):
     def power_display(self):
         return standard.powers.get(self.power, u'')
 
-    def filter_orders(self):
-        turn = self.game.current_turn()
-        season = turn.season
-        units = turn.get_units()
-        owns = turn.get_ownership()
-        builds = builds_available(units, owns)
-
-        actions = {'S': ('H', 'M', 'S', 'C'),
-                   'F': ('H', 'M', 'S', 'C'),
-                   'SR': ('M', 'D'),
-                   'FR': ('M', 'D'),
-                   'FA': ('B',) if builds.get(self.power, 0) > 0 else ('D',)}
-        helper = {'H': valid_hold,
-                  'M': valid_move,
-                  'S': valid_support,
-                  'C': valid_convoy,
-                  'B': valid_build,
-                  'D': valid_disband}
-
-        tree = {}
-        for a in actionable_subregions(turn.as_data(), units, owns).get(self.power, ()):
-            for x in actions[turn.season]:
-                result = helper[x](a, units, owns, season)
-                if not result:
-                    continue
-                tree.setdefault(a, {})[x] = {
+    def filter_orders(self, turn=None):
+        tree = (turn or self.game.current_turn()).get_legal_orders()
+
+        return {
+            actor: {
+                action: {
                     (assist or u''): {
                         target or u'': v
                         for target, v in targets.items()
                     }
                     for assist, targets in result.items()
                 }
-
-        if season == 'FA' and builds.get(self.power, 0) > 0:
-            tree[u''] = {u'': {u'': {u'': False}}}
-
-        return tree
+                for action, result in actions.items()
+            }
+            for actor, actions in tree.get(self.power, {}).items()
+        }
 
 
 class Ownership(models.Model):
@@ -367,6 +553,31 @@ class Ownership(models.Model):
     territory = models.CharField(max_length=32, blank=True)
 
 
+class Standing(models.Model):
+    """
+    A government's position in a turn, worked out when the turn is
+    created so that the standings can be shown without the units and
+    ownership.
+
+    """
+    class Meta:
+        unique_together = ('turn', 'government')
+
+    turn = models.ForeignKey(Turn, on_delete=models.CASCADE)
+    government = models.ForeignKey(Government, on_delete=models.CASCADE)
+    supply_centers = models.IntegerField()
+    units = models.IntegerField()
+    # Supply centers less units: builds if positive, disbands if negative.
+    builds = models.IntegerField()
+    # Whether the government has anything to order this turn.
+    actionable = models.BooleanField(default=False)
+    orders_submitted = models.BooleanField(default=False)
+
+    @property
+    def ready(self):
+        return self.orders_submitted or not self.actionable
+
+
 class Unit(models.Model):
     class Meta:
         ordering = ('-turn', 'government', 'subregion')
@@ -379,6 +590,8 @@ class Unit(models.Model):
     dislodged = models.BooleanField(default=False)
     displaced_from = models.CharField(max_length=32, blank=True)
     standoff_from = models.CharField(max_length=32, blank=True)
+    # The same for a unit in every turn, from `lineage_token`.
+    lineage = models.CharField(max_length=80, blank=True)
 
     def __unicode__(self):
         return unit_display(self.subregion)
@@ -458,6 +671,8 @@ class CanonicalOrder(models.Model):
 
     user_issued = models.BooleanField(default=True)
     result = models.CharField(max_length=1, choices=RESULT_CHOICES)
+    # The lineage of the ordered unit, or of the unit to be built.
+    lineage = models.CharField(max_length=80, blank=True)
 
     def __unicode__(self):
         order = u"{actor} {action}".format(actor=unit_display(self.actor),
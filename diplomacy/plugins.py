@@ -2,6 +2,19 @@ from . import models
 from .engine.main import actionable_subregions
 
 
+def governments_ready(governments, actors, readys):
+    """
+    Whether a turn is ready to generate: every government has either
+    marked itself ready (its pk is in `readys`), or has nothing to
+    order, going by the `actors` from `actionable_subregions`.
+
+    """
+    return all(
+        empire.pk in readys or not actors.get(empire.power)
+        for empire in governments
+    )
+
+
 class TurnGeneration(object):
     realm_types = {
         'diplomacygame': 'diplomacy.game',
@@ -54,23 +67,31 @@ class TurnGeneration(object):
         )
 
     def is_ready(self, generator):
-        turn = models.Turn.objects.filter(
-            game_id=generator.object_id
-        ).latest()
+        game = models.Game.objects.select_related('latest_turn').get(
+            pk=generator.object_id
+        )
+        turn = game.current_turn()
         units = turn.get_units()
         owns = turn.get_ownership()
 
         actors = actionable_subregions(turn.as_data(), units, owns)
         readys = set(r.agent.pk for r in generator.readies.all())
-        return all(
-            empire.pk in readys or not actors.get(empire.power)
-            for empire in models.Government.objects.filter(
-                game_id=generator.object_id,
-            )
-        )
+        return governments_ready(game.government_set.all(), actors, readys)
+
+    def _generate(self, realm):
+        """
+        Generates the turn the realm was loaded with.  `Game.generate`
+        checks its number again with the game locked, and generates
+        nothing if the realm has already moved past it.
+
+        """
+        turn = realm.current_turn()
+        if turn is None:
+            return False
+        return realm.generate(number=turn.number)
 
     def auto_generate(self, realm):
-        realm.generate()
+        return self._generate(realm)
 
     def force_generate(self, realm):
-        realm.generate()
+        return self._generate(realm)
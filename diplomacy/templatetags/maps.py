@@ -20,7 +20,7 @@ colors = {'austria-hungary': '#a41a10',
 @register.inclusion_tag('diplomacy/map_card.html', takes_context=True)
 def map(context, width, height):
     game = context['game']
-    turn = context.get('turn', game.current_turn())
+    turn = context['turn'] if 'turn' in context else game.current_turn()
     data = {'width': width, 'height': height}
 
     data['colors'] = json.dumps(colors)
@@ -0,0 +1,2474 @@
+"""
+The DATC scenarios from `diplomacy/tests/test_datc_*.py` that generate
+a turn, as plain data, to be run against the engine alone, without a
+database, by the benchmarks and by the tests that compare parts of the
+engine across every DATC position.
+
+Each scenario starts from `turn`, with the starting ownership from
+`engine.main.initialize_game` if `ownership` is true and none
+otherwise, and then takes its `actions` in order:
+
+    ('units', {government: units})
+        adds units, in the notation of `diplomacy.tests.notation`;
+    ('orders', {government: orders})
+        posts orders, replacing any posted before by those governments;
+    ('ownership', filters, excludes, government)
+        hands to `government` the territories matching every one of
+        the (field, value) `filters` and none of the `excludes`;
+    ('initial_ownership',)
+        puts back the starting ownership;
+    ('generate',)
+        generates the turn, which is one step of the scenario.
+
+`Scenario` replays them, keeping the engine's input for every step.
+
+"""
+import copy
+
+from ..engine.main import generate, initialize_game
+from .notation import as_ownership, as_unit, government, parse_orders, parse_units
+
+
+class Scenario(object):
+    """The position built up by one DATC test, and the steps generated from it."""
+
+    def __init__(self, data):
+        self.name = '{0}.{1}'.format(data['case'], data['test'])
+        self.turn = dict(data['turn'])
+        self.units, self.owns = [], []
+        if data['ownership']:
+            self.initial_ownership()
+        self.posts = {}
+        self.steps = []
+
+        actions = {'units': self.add_units,
+                   'orders': self.add_orders,
+                   'ownership': self.update_ownership,
+                   'initial_ownership': self.initial_ownership,
+                   'generate': self.generate}
+        for action in data['actions']:
+            actions[action[0]](*action[1:])
+
+    def add_units(self, units):
+        self.units.extend(
+            as_unit({'government': government(gvt), 'u_type': u_type, 'subregion': sr})
+            for gvt, u_type, sr in parse_units(units)
+        )
+
+    def add_orders(self, orders):
+        # Each call makes a new post for each government mentioned,
+        # and only the latest post of a government counts.
+        posts = {government(gvt): [] for gvt in orders}
+        for gvt, order in parse_orders(orders, self.turn['season']):
+            order['government'] = government(gvt)
+            posts[order['government']].append(order)
+        self.posts.update(posts)
+
+    def update_ownership(self, filters, excludes, new_government):
+        def matches(o, conditions):
+            return all(o[field] == value for field, value in conditions)
+
+        for o in self.owns:
+            if matches(o, filters) and not any(matches(o, [e]) for e in excludes):
+                o['government'] = new_government
+
+    def initial_ownership(self):
+        self.owns = [as_ownership(o) for o in initialize_game()[2]]
+
+    def generate(self):
+        orders = [o for post in self.posts.values() for o in post]
+        step = (self.turn, orders, self.units, self.owns)
+        self.steps.append(copy.deepcopy(step))
+
+        turn, orders, units, owns = generate(*copy.deepcopy(step))
+        self.turn = turn
+        self.units = [as_unit(u) for u in units]
+        self.owns = [as_ownership(o) for o in owns]
+        self.posts = {}
+
+
+def scenarios():
+    """Yields every DATC scenario, as a `Scenario`."""
+    for data in SCENARIOS:
+        yield Scenario(data)
+
+
+SCENARIOS = [
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_supported_hold_prevents_dislodgement',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('F Adriatic Sea', 'A Trieste'), 'Italy': ('A Venice', 'A Tyrolia')}),
+            ('orders',
+             {'Austria': ('F Adriatic Sea S A Trieste - Venice', 'A Trieste M Venice'),
+              'Italy': ('A Venice H', 'A Tyrolia S A Venice')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_move_cuts_support_on_hold',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('F Adriatic Sea', 'A Trieste', 'A Vienna'),
+              'Italy': ('A Venice', 'A Tyrolia')}),
+            ('orders',
+             {'Austria': ('F Adriatic Sea S A Trieste - Venice',
+                          'A Trieste M Venice',
+                          'A Vienna M Tyrolia'),
+              'Italy': ('A Venice H', 'A Tyrolia S A Venice')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_move_cuts_support_on_move',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('F Adriatic Sea', 'A Trieste'), 'Italy': ('A Venice', 'F Ionian Sea')}),
+            ('orders',
+             {'Austria': ('F Adriatic Sea S A Trieste - Venice', 'A Trieste M Venice'),
+              'Italy': ('A Venice H', 'F Ionian Sea M Adriatic Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_support_to_hold_on_unit_supporting_a_hold',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Germany': ('A Berlin', 'F Kiel'), 'Russia': ('F Baltic Sea', 'A Prussia')}),
+            ('orders',
+             {'Germany': ('A Berlin S F Kiel', 'F Kiel S A Berlin'),
+              'Russia': ('F Baltic Sea S A Prussia - Berlin', 'A Prussia M Berlin')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_support_to_hold_on_unit_supporting_a_move',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Germany': ('A Berlin', 'F Kiel', 'A Munich'),
+              'Russia': ('F Baltic Sea', 'A Prussia')}),
+            ('orders',
+             {'Germany': ('A Berlin S A Munich - Silesia',
+                          'F Kiel S A Berlin',
+                          'A Munich M Silesia'),
+              'Russia': ('F Baltic Sea S A Prussia - Berlin', 'A Prussia M Berlin')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_support_to_hold_on_convoying_unit',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Germany': ('A Berlin', 'F Baltic Sea', 'F Prussia'),
+              'Russia': ('F Livonia', 'F Gulf of Bothnia')}),
+            ('orders',
+             {'Germany': ('A Berlin M Sweden',
+                          'F Baltic Sea C A Berlin - Sweden',
+                          'F Prussia S F Baltic Sea'),
+              'Russia': ('F Livonia M Baltic Sea', 'F Gulf of Bothnia S F Livonia - Baltic Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_support_to_hold_on_moving_unit',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Germany': ('F Baltic Sea', 'F Prussia'),
+              'Russia': ('F Livonia', 'F Gulf of Bothnia', 'A Finland')}),
+            ('orders',
+             {'Germany': ('F Baltic Sea M Sweden', 'F Prussia S F Baltic Sea'),
+              'Russia': ('F Livonia M Baltic Sea',
+                         'F Gulf of Bothnia S F Livonia - Baltic Sea',
+                         'A Finland M Sweden')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_failed_convoyed_army_cannot_receive_hold_support',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('F Ionian Sea', 'A Serbia', 'A Albania'),
+              'Turkey': ('A Greece', 'A Bulgaria')}),
+            ('orders',
+             {'Austria': ('F Ionian Sea H', 'A Serbia S A Albania - Greece', 'A Albania M Greece'),
+              'Turkey': ('A Greece M Naples', 'A Bulgaria S A Greece')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_support_to_move_on_holding_unit',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Austria': ('A Albania', 'A Trieste'), 'Italy': ('A Venice', 'A Tyrolia')}),
+            ('orders',
+             {'Austria': ('A Albania S A Trieste - Serbia', 'A Trieste H'),
+              'Italy': ('A Venice M Trieste', 'A Tyrolia S A Venice - Trieste')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_self_dislodgement_prohibited',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Germany': ('A Berlin', 'F Kiel', 'A Munich')}),
+            ('orders', {'Germany': ('A Berlin H', 'F Kiel M Berlin', 'A Munich S F Kiel - Berlin')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_no_self_dislodgement_of_returning_unit',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Germany': ('A Berlin', 'F Kiel', 'A Munich'), 'Russia': ('A Warsaw',)}),
+            ('orders',
+             {'Germany': ('A Berlin M Prussia', 'F Kiel M Berlin', 'A Munich S F Kiel - Berlin'),
+              'Russia': ('A Warsaw M Prussia',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_support_foreign_unit_to_dislodge_own_unit',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Austria': ('F Trieste', 'A Vienna'), 'Italy': ('A Venice',)}),
+            ('orders',
+             {'Austria': ('F Trieste H', 'A Vienna S A Venice - Trieste'),
+              'Italy': ('A Venice M Trieste',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_support_foreign_unit_to_dislodge_returning_own_unit',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Austria': ('F Trieste', 'A Vienna'), 'Italy': ('A Venice', 'F Apulia')}),
+            ('orders',
+             {'Austria': ('F Trieste M Adriatic Sea', 'A Vienna S A Venice - Trieste'),
+              'Italy': ('A Venice M Trieste', 'F Apulia M Adriatic Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_supporting_foreign_unit_insufficient_to_prevent_dislodge',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('F Trieste', 'A Vienna'),
+              'Italy': ('A Venice', 'A Tyrolia', 'F Adriatic Sea')}),
+            ('orders',
+             {'Austria': ('F Trieste H', 'A Vienna S A Venice - Trieste'),
+              'Italy': ('A Venice M Trieste',
+                        'A Tyrolia S A Venice - Trieste',
+                        'F Adriatic Sea S A Venice - Trieste')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_defender_cannot_cut_support_for_attack_on_itself',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Russia': ('F Constantinople', 'F Black Sea'), 'Turkey': ('F Ankara',)}),
+            ('orders',
+             {'Russia': ('F Constantinople S F Black Sea - Ankara', 'F Black Sea M Ankara'),
+              'Turkey': ('F Ankara M Constantinople',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_convoying_a_unit_dislodging_a_unit_of_same_power',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A London', 'F North Sea'), 'France': ('F English Channel', 'A Belgium')}),
+            ('orders',
+             {'England': ('A London H', 'F North Sea C A Belgium - London'),
+              'France': ('F English Channel S A Belgium - London', 'A Belgium M London')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_dislodgement_cuts_supports',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Russia': ('F Constantinople', 'F Black Sea'),
+              'Turkey': ('F Ankara', 'A Smyrna', 'A Armenia')}),
+            ('orders',
+             {'Russia': ('F Constantinople S F Black Sea - Ankara', 'F Black Sea M Ankara'),
+              'Turkey': ('F Ankara M Constantinople',
+                         'A Smyrna S F Ankara - Constantinople',
+                         'A Armenia M Ankara')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_surviving_unit_will_sustain_support',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Russia': ('F Constantinople', 'F Black Sea', 'A Bulgaria'),
+              'Turkey': ('F Ankara', 'A Smyrna', 'A Armenia')}),
+            ('orders',
+             {'Russia': ('F Constantinople S F Black Sea - Ankara',
+                         'F Black Sea M Ankara',
+                         'A Bulgaria S F Constantinople'),
+              'Turkey': ('F Ankara M Constantinople',
+                         'A Smyrna S F Ankara - Constantinople',
+                         'A Armenia M Ankara')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_even_when_surviving_is_in_alternative_way',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Russia': ('F Constantinople', 'F Black Sea', 'A Smyrna'), 'Turkey': ('F Ankara',)}),
+            ('orders',
+             {'Russia': ('F Constantinople S F Black Sea - Ankara',
+                         'F Black Sea M Ankara',
+                         'A Smyrna S F Ankara - Constantinople'),
+              'Turkey': ('F Ankara M Constantinople',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_unit_cannot_cut_support_of_its_own_country',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F London', 'F North Sea', 'A Yorkshire'),
+              'France': ('F English Channel',)}),
+            ('orders',
+             {'England': ('F London S F North Sea - English Channel',
+                          'F North Sea M English Channel',
+                          'A Yorkshire M London'),
+              'France': ('F English Channel H',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_dislodging_does_not_cancel_support_cut',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('F Trieste',),
+              'Germany': ('A Munich',),
+              'Italy': ('A Venice', 'A Tyrolia'),
+              'Russia': ('A Silesia', 'A Berlin')}),
+            ('orders',
+             {'Austria': ('F Trieste H',),
+              'Germany': ('A Munich M Tyrolia',),
+              'Italy': ('A Venice M Trieste', 'A Tyrolia S A Venice - Trieste'),
+              'Russia': ('A Silesia M Munich', 'A Berlin S A Silesia - Munich')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_impossible_fleet_move_cannot_be_supported',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Germany': ('F Kiel', 'A Burgundy'), 'Russia': ('A Munich', 'A Berlin')}),
+            ('orders',
+             {'Germany': ('F Kiel M Munich', 'A Burgundy S F Kiel - Munich'),
+              'Russia': ('A Munich M Kiel', 'A Berlin S A Munich - Kiel')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_impossible_coast_move_cannot_be_supported',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'France': ('F Spain (NC)', 'F Marseilles'),
+              'Italy': ('F Gulf of Lyon', 'F Western Mediterranean')}),
+            ('orders',
+             {'France': ('F Spain (NC) M Gulf of Lyon',
+                         'F Marseilles S F Spain (NC) - Gulf of Lyon'),
+              'Italy': ('F Gulf of Lyon M Spain (SC)',
+                        'F Western Mediterranean S F Gulf of Lyon - Spain (SC)')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_impossible_army_move_cannot_be_supported',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'France': ('A Marseilles', 'F Spain (SC)'),
+              'Italy': ('F Gulf of Lyon',),
+              'Turkey': ('F Tyrrhenian Sea', 'F Western Mediterranean')}),
+            ('orders',
+             {'France': ('A Marseilles M Gulf of Lyon',
+                         'F Spain (SC) S A Marseilles - Gulf of Lyon'),
+              'Italy': ('F Gulf of Lyon H',),
+              'Turkey': ('F Tyrrhenian Sea S F Western Mediterranean - Gulf of Lyon',
+                         'F Western Mediterranean M Gulf of Lyon')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_failing_hold_support_can_be_supported',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Germany': ('A Berlin', 'F Kiel'), 'Russia': ('F Baltic Sea', 'A Prussia')}),
+            ('orders',
+             {'Germany': ('A Berlin S A Prussia', 'F Kiel S A Berlin'),
+              'Russia': ('F Baltic Sea S A Prussia - Berlin', 'A Prussia M Berlin')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_failing_move_support_can_be_supported',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Germany': ('A Berlin', 'F Kiel'), 'Russia': ('F Baltic Sea', 'A Prussia')}),
+            ('orders',
+             {'Germany': ('A Berlin S A Prussia - Silesia', 'F Kiel S A Berlin'),
+              'Russia': ('F Baltic Sea S A Prussia - Berlin', 'A Prussia M Berlin')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_failing_convoy_can_be_supported',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Sweden', 'F Denmark'),
+              'Germany': ('A Berlin',),
+              'Russia': ('F Baltic Sea', 'F Prussia')}),
+            ('orders',
+             {'England': ('F Sweden M Baltic Sea', 'F Denmark S F Sweden - Baltic Sea'),
+              'Germany': ('A Berlin H',),
+              'Russia': ('F Baltic Sea C A Berlin - Livonia', 'F Prussia S F Baltic Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_impossible_move_and_support',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('A Budapest',),
+              'Russia': ('F Rumania',),
+              'Turkey': ('F Black Sea', 'A Bulgaria')}),
+            ('orders',
+             {'Austria': ('A Budapest S F Rumania',),
+              'Russia': ('F Rumania M Holland',),
+              'Turkey': ('F Black Sea M Rumania', 'A Bulgaria S F Black Sea - Rumania')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_move_to_impossible_coast_and_support',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('A Budapest',),
+              'Russia': ('F Rumania',),
+              'Turkey': ('F Black Sea', 'A Bulgaria')}),
+            ('orders',
+             {'Austria': ('A Budapest S F Rumania',),
+              'Russia': ('F Rumania M Bulgaria (SC)',),
+              'Turkey': ('F Black Sea M Rumania', 'A Bulgaria S F Black Sea - Rumania')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_move_without_coast_and_support',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Italy': ('F Aegean Sea',),
+              'Russia': ('F Constantinople',),
+              'Turkey': ('F Black Sea', 'A Bulgaria')}),
+            ('orders',
+             {'Italy': ('F Aegean Sea S F Constantinople',),
+              'Russia': ('F Constantinople M Bulgaria',),
+              'Turkey': ('F Black Sea M Constantinople',
+                         'A Bulgaria S F Black Sea - Constantinople')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_fleet_cant_support_and_convoy_simultaneously',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Austria': ('A Rumania',), 'Turkey': ('F Black Sea',)}),
+            ('orders',
+             {'Austria': ('A Rumania M Armenia',),
+              'Turkey': ('F Black Sea S A Rumania - Armenia',)}),
+            ('orders', {'Turkey': ('F Black Sea M Constantinople',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_missing_fleet_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Edinburgh', 'A Liverpool'),
+              'France': ('F London',),
+              'Germany': ('A Yorkshire',)}),
+            ('orders',
+             {'England': ('F Edinburgh S A Liverpool - Yorkshire', 'A Liverpool M Yorkshire'),
+              'France': ('F London S A Yorkshire',),
+              'Germany': ('A Yorkshire M Holland',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_unwanted_support_allowed',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('A Serbia', 'A Vienna'),
+              'Russia': ('A Galicia',),
+              'Turkey': ('A Bulgaria',)}),
+            ('orders',
+             {'Austria': ('A Serbia M Budapest', 'A Vienna M Budapest'),
+              'Russia': ('A Galicia S A Serbia - Budapest',),
+              'Turkey': ('A Bulgaria M Serbia',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.SupportsAndDislodges',
+        'test': 'test_support_targeting_own_area_not_allowed',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Germany': ('A Berlin', 'A Silesia', 'F Baltic Sea'),
+              'Italy': ('A Prussia',),
+              'Russia': ('A Warsaw', 'A Livonia')}),
+            ('orders',
+             {'Germany': ('A Berlin M Prussia',
+                          'A Silesia S A Berlin - Prussia',
+                          'F Baltic Sea S A Berlin - Prussia'),
+              'Italy': ('A Prussia S A Livonia - Prussia',),
+              'Russia': ('A Warsaw S A Livonia - Prussia', 'A Livonia M Prussia')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_dislodged_unit_has_no_effect_on_attackers_area',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Germany': ('A Berlin', 'F Kiel', 'A Silesia'), 'Russia': ('A Prussia',)}),
+            ('orders',
+             {'Germany': ('A Berlin M Prussia',
+                          'F Kiel M Berlin',
+                          'A Silesia S A Berlin - Prussia'),
+              'Russia': ('A Prussia M Berlin',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_no_self_dislodgement_in_head_to_head_battle',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Germany': ('A Berlin', 'F Kiel', 'A Munich')}),
+            ('orders',
+             {'Germany': ('A Berlin M Kiel', 'F Kiel M Berlin', 'A Munich S A Berlin - Kiel')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_no_help_dislodging_own_unit',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'England': ('F Kiel',), 'Germany': ('A Berlin', 'A Munich')}),
+            ('orders',
+             {'England': ('F Kiel M Berlin',),
+              'Germany': ('A Berlin M Kiel', 'A Munich S F Kiel - Berlin')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_non_dislodged_loser_still_has_effect',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('A Kiel', 'A Ruhr'),
+              'England': ('F Edinburgh', 'F Yorkshire', 'F Norwegian Sea'),
+              'France': ('F North Sea', 'F Belgium'),
+              'Germany': ('F Holland', 'F Helgoland Bight', 'F Skagerrak')}),
+            ('orders',
+             {'Austria': ('A Kiel S A Ruhr - Holland', 'A Ruhr M Holland'),
+              'England': ('F Edinburgh S F Norwegian Sea - North Sea',
+                          'F Yorkshire S F Norwegian Sea - North Sea',
+                          'F Norwegian Sea M North Sea'),
+              'France': ('F North Sea M Holland', 'F Belgium S F North Sea - Holland'),
+              'Germany': ('F Holland M North Sea',
+                          'F Helgoland Bight S F Holland - North Sea',
+                          'F Skagerrak S F Holland - North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_loser_dislodged_by_another_army_still_has_effect',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('A Kiel', 'A Ruhr'),
+              'England': ('F Edinburgh', 'F Yorkshire', 'F Norwegian Sea', 'F London'),
+              'France': ('F North Sea', 'F Belgium'),
+              'Germany': ('F Holland', 'F Helgoland Bight', 'F Skagerrak')}),
+            ('orders',
+             {'Austria': ('A Kiel S A Ruhr - Holland', 'A Ruhr M Holland'),
+              'England': ('F Edinburgh S F Norwegian Sea - North Sea',
+                          'F Yorkshire S F Norwegian Sea - North Sea',
+                          'F Norwegian Sea M North Sea',
+                          'F London S F Norwegian Sea - North Sea'),
+              'France': ('F North Sea M Holland', 'F Belgium S F North Sea - Holland'),
+              'Germany': ('F Holland M North Sea',
+                          'F Helgoland Bight S F Holland - North Sea',
+                          'F Skagerrak S F Holland - North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_not_dislodged_because_own_support_still_has_effect',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('A Kiel', 'A Ruhr'),
+              'France': ('F North Sea', 'F Belgium', 'F English Channel'),
+              'Germany': ('F Holland', 'F Helgoland Bight')}),
+            ('orders',
+             {'Austria': ('A Kiel S A Ruhr - Holland', 'A Ruhr M Holland'),
+              'France': ('F North Sea M Holland',
+                         'F Belgium S F North Sea - Holland',
+                         'F English Channel S F Holland - North Sea'),
+              'Germany': ('F Holland M North Sea', 'F Helgoland Bight S F Holland - North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_no_self_dislodgement_with_beleaguered_garrison',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'F Yorkshire'),
+              'Germany': ('F Holland', 'F Helgoland Bight'),
+              'Russia': ('F Skagerrak', 'F Norway')}),
+            ('orders',
+             {'England': ('F North Sea H', 'F Yorkshire S F Norway - North Sea'),
+              'Germany': ('F Holland S F Helgoland Bight - North Sea',
+                          'F Helgoland Bight M North Sea'),
+              'Russia': ('F Skagerrak S F Norway - North Sea', 'F Norway M North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_no_self_dislodgement_with_beleaguered_and_head_to_head',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'F Yorkshire'),
+              'Germany': ('F Holland', 'F Helgoland Bight'),
+              'Russia': ('F Skagerrak', 'F Norway')}),
+            ('orders',
+             {'England': ('F North Sea M Norway', 'F Yorkshire S F Norway - North Sea'),
+              'Germany': ('F Holland S F Helgoland Bight - North Sea',
+                          'F Helgoland Bight M North Sea'),
+              'Russia': ('F Skagerrak S F Norway - North Sea', 'F Norway M North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_almost_self_dislodgement_with_beleaguered_garrison',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'F Yorkshire'),
+              'Germany': ('F Holland', 'F Helgoland Bight'),
+              'Russia': ('F Skagerrak', 'F Norway')}),
+            ('orders',
+             {'England': ('F North Sea M Norwegian Sea', 'F Yorkshire S F Norway - North Sea'),
+              'Germany': ('F Holland S F Helgoland Bight - North Sea',
+                          'F Helgoland Bight M North Sea'),
+              'Russia': ('F Skagerrak S F Norway - North Sea', 'F Norway M North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_almost_circular_move_self_dislodgement_beleaguered_garrison',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'F Yorkshire'),
+              'Germany': ('F Holland', 'F Helgoland Bight', 'F Denmark'),
+              'Russia': ('F Skagerrak', 'F Norway')}),
+            ('orders',
+             {'England': ('F North Sea M Denmark', 'F Yorkshire S F Norway - North Sea'),
+              'Germany': ('F Holland S F Helgoland Bight - North Sea',
+                          'F Helgoland Bight M North Sea',
+                          'F Denmark M Helgoland Bight'),
+              'Russia': ('F Skagerrak S F Norway - North Sea', 'F Norway M North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_no_self_dislodgement_garrison_unit_swap',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'France': ('A Spain', 'F Mid-Atlantic Ocean', 'F Gulf of Lyon'),
+              'Germany': ('A Marseilles', 'A Gascony'),
+              'Italy': ('F Portugal', 'F Western Mediterranean')}),
+            ('orders',
+             {'France': ('A Spain M Portugal *',
+                         'F Mid-Atlantic Ocean C A Spain - Portugal',
+                         'F Gulf of Lyon S F Portugal - Spain (NC)'),
+              'Germany': ('A Marseilles S A Gascony - Spain', 'A Gascony M Spain'),
+              'Italy': ('F Portugal M Spain (NC)',
+                        'F Western Mediterranean S F Portugal - Spain (NC)')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_support_attack_on_own_unit_can_be_used_for_other_means',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('A Budapest', 'A Serbia'),
+              'Italy': ('A Vienna',),
+              'Russia': ('A Galicia', 'A Rumania')}),
+            ('orders',
+             {'Austria': ('A Budapest M Rumania', 'A Serbia S A Vienna - Budapest'),
+              'Italy': ('A Vienna M Budapest',),
+              'Russia': ('A Galicia M Budapest', 'A Rumania S A Galicia - Budapest')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_three_way_beleaguered_garrison',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Edinburgh', 'F Yorkshire'),
+              'France': ('F Belgium', 'F English Channel'),
+              'Germany': ('F North Sea',),
+              'Russia': ('F Norwegian Sea', 'F Norway')}),
+            ('orders',
+             {'England': ('F Edinburgh S F Yorkshire - North Sea', 'F Yorkshire M North Sea'),
+              'France': ('F Belgium M North Sea', 'F English Channel S F Belgium - North Sea'),
+              'Germany': ('F North Sea H',),
+              'Russia': ('F Norwegian Sea M North Sea', 'F Norway S F Norwegian Sea - North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_illegal_head_to_head_battle_can_still_defend',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'England': ('A Liverpool',), 'Russia': ('F Edinburgh',)}),
+            ('orders',
+             {'England': ('A Liverpool M Edinburgh',), 'Russia': ('F Edinburgh M Liverpool',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_battles.HeadToHeadAndBeleagueredGarrison',
+        'test': 'test_friendly_head_to_head_battle',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Holland', 'A Ruhr'),
+              'France': ('A Kiel', 'A Munich', 'A Silesia'),
+              'Germany': ('A Berlin', 'F Denmark', 'F Helgoland Bight'),
+              'Russia': ('F Baltic Sea', 'A Prussia')}),
+            ('orders',
+             {'England': ('F Holland S A Ruhr - Kiel', 'A Ruhr M Kiel'),
+              'France': ('A Kiel M Berlin',
+                         'A Munich S A Kiel - Berlin',
+                         'A Silesia S A Kiel - Berlin'),
+              'Germany': ('A Berlin M Kiel',
+                          'F Denmark S A Berlin - Kiel',
+                          'F Helgoland Bight S A Berlin - Kiel'),
+              'Russia': ('F Baltic Sea S A Prussia - Berlin', 'A Prussia M Berlin')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_no_convoy_in_coastal_areas',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Turkey': ('A Greece', 'F Aegean Sea', 'F Constantinople', 'F Black Sea')}),
+            ('orders',
+             {'Turkey': ('A Greece M Sevastopol',
+                         'F Aegean Sea C A Greece - Sevastopol',
+                         'F Constantinople C A Greece - Sevastopol',
+                         'F Black Sea C A Greece - Sevastopol')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_convoyed_army_can_bounce',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'England': ('F English Channel', 'A London'), 'France': ('A Paris',)}),
+            ('orders',
+             {'England': ('F English Channel C A London - Brest', 'A London M Brest'),
+              'France': ('A Paris M Brest',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_convoyed_army_can_receive_support',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F English Channel', 'A London', 'F Mid-Atlantic Ocean'),
+              'France': ('A Paris',)}),
+            ('orders',
+             {'England': ('F English Channel C A London - Brest',
+                          'A London M Brest',
+                          'F Mid-Atlantic Ocean S A London - Brest'),
+              'France': ('A Paris M Brest',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_attacked_convoy_is_not_disrupted',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'England': ('F North Sea', 'A London'), 'Germany': ('F Skagerrak',)}),
+            ('orders',
+             {'England': ('F North Sea C A London - Holland', 'A London M Holland'),
+              'Germany': ('F Skagerrak M North Sea',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_beleaguered_convoy_is_not_disrupted',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'A London'),
+              'France': ('F English Channel', 'F Belgium'),
+              'Germany': ('F Skagerrak', 'F Denmark')}),
+            ('orders',
+             {'England': ('F North Sea C A London - Holland', 'A London M Holland'),
+              'France': ('F English Channel M North Sea',
+                         'F Belgium S F English Channel - North Sea'),
+              'Germany': ('F Skagerrak M North Sea', 'F Denmark S F Skagerrak - North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_dislodged_convoy_does_not_cut_support',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'A London'),
+              'France': ('A Picardy', 'A Burgundy'),
+              'Germany': ('A Holland', 'A Belgium', 'F Helgoland Bight', 'F Skagerrak')}),
+            ('orders',
+             {'England': ('F North Sea C A London - Holland', 'A London M Holland'),
+              'France': ('A Picardy M Belgium', 'A Burgundy S A Picardy - Belgium'),
+              'Germany': ('A Holland S A Belgium',
+                          'A Belgium S A Holland',
+                          'F Helgoland Bight S F Skagerrak - North Sea',
+                          'F Skagerrak M North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_dislodged_convoy_does_not_cause_contested_area',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'A London'),
+              'Germany': ('F Helgoland Bight', 'F Skagerrak')}),
+            ('orders',
+             {'England': ('F North Sea C A London - Holland', 'A London M Holland'),
+              'Germany': ('F Helgoland Bight S F Skagerrak - North Sea',
+                          'F Skagerrak M North Sea')}),
+            ('generate',),
+            ('orders', {'England': ('F North Sea M Holland',)}),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_dislodged_convoy_does_not_cause_a_bounce',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'A London'),
+              'Germany': ('F Helgoland Bight', 'F Skagerrak', 'A Belgium')}),
+            ('orders',
+             {'England': ('F North Sea C A London - Holland', 'A London M Holland'),
+              'Germany': ('F Helgoland Bight S F Skagerrak - North Sea',
+                          'F Skagerrak M North Sea',
+                          'A Belgium M Holland')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_dislodge_of_multi_route_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F English Channel', 'F North Sea', 'A London'),
+              'France': ('F Brest', 'F Mid-Atlantic Ocean')}),
+            ('orders',
+             {'England': ('F English Channel C A London - Belgium',
+                          'F North Sea C A London - Belgium',
+                          'A London M Belgium'),
+              'France': ('F Brest S F Mid-Atlantic Ocean - English Channel',
+                         'F Mid-Atlantic Ocean M English Channel')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_dislodge_of_multi_route_convoy_with_foreign_fleet',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'A London'),
+              'France': ('F Brest', 'F Mid-Atlantic Ocean'),
+              'Germany': ('F English Channel',)}),
+            ('orders',
+             {'England': ('F North Sea C A London - Belgium', 'A London M Belgium'),
+              'France': ('F Brest S F Mid-Atlantic Ocean - English Channel',
+                         'F Mid-Atlantic Ocean M English Channel'),
+              'Germany': ('F English Channel C A London - Belgium',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_dislodge_of_multi_route_convoy_with_only_foreign_fleets',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A London',),
+              'France': ('F Brest', 'F Mid-Atlantic Ocean'),
+              'Germany': ('F English Channel',),
+              'Russia': ('F North Sea',)}),
+            ('orders',
+             {'England': ('A London M Belgium',),
+              'France': ('F Brest S F Mid-Atlantic Ocean - English Channel',
+                         'F Mid-Atlantic Ocean M English Channel'),
+              'Germany': ('F English Channel C A London - Belgium',),
+              'Russia': ('F North Sea C A London - Belgium',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_dislodged_convoying_fleet_not_on_route',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F English Channel', 'A London', 'F Irish Sea'),
+              'France': ('F North Atlantic Ocean', 'F Mid-Atlantic Ocean')}),
+            ('orders',
+             {'England': ('F English Channel C A London - Belgium',
+                          'A London M Belgium',
+                          'F Irish Sea C A London - Belgium'),
+              'France': ('F North Atlantic Ocean S F Mid-Atlantic Ocean - Irish Sea',
+                         'F Mid-Atlantic Ocean M Irish Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_the_unwanted_alternative',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A London', 'F North Sea'),
+              'France': ('F English Channel',),
+              'Germany': ('F Holland', 'F Denmark')}),
+            ('orders',
+             {'England': ('A London M Belgium', 'F North Sea C A London - Belgium'),
+              'France': ('F English Channel C A London - Belgium',),
+              'Germany': ('F Holland S F Denmark - North Sea', 'F Denmark M North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_simple_convoy_paradox',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F London', 'F Wales'), 'France': ('A Brest', 'F English Channel')}),
+            ('orders',
+             {'England': ('F London S F Wales - English Channel', 'F Wales M English Channel'),
+              'France': ('A Brest M London', 'F English Channel C A Brest - London')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_simple_convoy_paradox_with_additional_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F London', 'F Wales'),
+              'France': ('A Brest', 'F English Channel'),
+              'Italy': ('F Irish Sea', 'F Mid-Atlantic Ocean', 'A North Africa')}),
+            ('orders',
+             {'England': ('F London S F Wales - English Channel', 'F Wales M English Channel'),
+              'France': ('A Brest M London', 'F English Channel C A Brest - London'),
+              'Italy': ('F Irish Sea C A North Africa - Wales',
+                        'F Mid-Atlantic Ocean C A North Africa - Wales',
+                        'A North Africa M Wales')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_pandins_paradox',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F London', 'F Wales'),
+              'France': ('A Brest', 'F English Channel'),
+              'Germany': ('F North Sea', 'F Belgium')}),
+            ('orders',
+             {'England': ('F London S F Wales - English Channel', 'F Wales M English Channel'),
+              'France': ('A Brest M London', 'F English Channel C A Brest - London'),
+              'Germany': ('F North Sea S F Belgium - English Channel',
+                          'F Belgium M English Channel')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_pandins_extended_paradox',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F London', 'F Wales'),
+              'France': ('A Brest', 'F English Channel', 'F Yorkshire'),
+              'Germany': ('F North Sea', 'F Belgium')}),
+            ('orders',
+             {'England': ('F London S F Wales - English Channel', 'F Wales M English Channel'),
+              'France': ('A Brest M London',
+                         'F English Channel C A Brest - London',
+                         'F Yorkshire S A Brest - London'),
+              'Germany': ('F North Sea S F Belgium - English Channel',
+                          'F Belgium M English Channel')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_betrayal_paradox',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'A London', 'F English Channel'),
+              'France': ('F Belgium',),
+              'Germany': ('F Helgoland Bight', 'F Skagerrak')}),
+            ('orders',
+             {'England': ('F North Sea C A London - Belgium',
+                          'A London M Belgium',
+                          'F English Channel S A London - Belgium'),
+              'France': ('F Belgium S F North Sea',),
+              'Germany': ('F Helgoland Bight S F Skagerrak - North Sea',
+                          'F Skagerrak M North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_multi_route_convoy_disruption_paradox',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'France': ('A Tunisia', 'F Tyrrhenian Sea', 'F Ionian Sea'),
+              'Italy': ('F Naples', 'F Rome')}),
+            ('orders',
+             {'France': ('A Tunisia M Naples',
+                         'F Tyrrhenian Sea C A Tunisia - Naples',
+                         'F Ionian Sea C A Tunisia - Naples'),
+              'Italy': ('F Naples S F Rome - Tyrrhenian Sea', 'F Rome M Tyrrhenian Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_unwanted_multi_route_convoy_paradox',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'France': ('A Tunisia', 'F Tyrrhenian Sea'),
+              'Italy': ('F Naples', 'F Ionian Sea'),
+              'Turkey': ('F Aegean Sea', 'F Eastern Mediterranean')}),
+            ('orders',
+             {'France': ('A Tunisia M Naples', 'F Tyrrhenian Sea C A Tunisia - Naples'),
+              'Italy': ('F Naples S F Ionian Sea', 'F Ionian Sea C A Tunisia - Naples'),
+              'Turkey': ('F Aegean Sea S F Eastern Mediterranean - Ionian Sea',
+                         'F Eastern Mediterranean M Ionian Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_dads_army',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Liverpool', 'F North Atlantic Ocean', 'F Clyde'),
+              'France': ('F Irish Sea', 'F Mid-Atlantic Ocean'),
+              'Russia': ('A Edinburgh', 'F Norwegian Sea', 'A Norway')}),
+            ('orders',
+             {'England': ('A Liverpool M Clyde *',
+                          'F North Atlantic Ocean C A Liverpool - Clyde',
+                          'F Clyde S F North Atlantic Ocean'),
+              'France': ('F Irish Sea S F Mid-Atlantic Ocean - North Atlantic Ocean',
+                         'F Mid-Atlantic Ocean M North Atlantic Ocean'),
+              'Russia': ('A Edinburgh S A Norway - Clyde',
+                         'F Norwegian Sea C A Norway - Clyde',
+                         'A Norway M Clyde')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_second_order_paradox_with_two_solutions',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Edinburgh', 'F London'),
+              'France': ('A Brest', 'F English Channel'),
+              'Germany': ('F Belgium', 'F Picardy'),
+              'Russia': ('A Norway', 'F North Sea')}),
+            ('orders',
+             {'England': ('F Edinburgh M North Sea', 'F London S F Edinburgh - North Sea'),
+              'France': ('A Brest M London', 'F English Channel C A Brest - London'),
+              'Germany': ('F Belgium S F Picardy - English Channel', 'F Picardy M English Channel'),
+              'Russia': ('A Norway M Belgium', 'F North Sea C A Norway - Belgium')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_second_order_paradox_with_two_exclusive_convoys',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Edinburgh', 'F Yorkshire'),
+              'France': ('A Brest', 'F English Channel'),
+              'Germany': ('F Belgium', 'F London'),
+              'Italy': ('F Mid-Atlantic Ocean', 'F Irish Sea'),
+              'Russia': ('A Norway', 'F North Sea')}),
+            ('orders',
+             {'England': ('F Edinburgh M North Sea', 'F Yorkshire S F Edinburgh - North Sea'),
+              'France': ('A Brest M London', 'F English Channel C A Brest - London'),
+              'Germany': ('F Belgium S F English Channel', 'F London S F North Sea'),
+              'Italy': ('F Mid-Atlantic Ocean M English Channel',
+                        'F Irish Sea S F Mid-Atlantic Ocean - English Channel'),
+              'Russia': ('A Norway M Belgium', 'F North Sea C A Norway - Belgium')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.Convoys',
+        'test': 'test_second_order_paradox_with_no_resolution',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Edinburgh', 'F London', 'F Irish Sea', 'F Mid-Atlantic Ocean'),
+              'France': ('A Brest', 'F English Channel', 'F Belgium'),
+              'Russia': ('A Norway', 'F North Sea')}),
+            ('orders',
+             {'England': ('F Edinburgh M North Sea',
+                          'F London S F Edinburgh - North Sea',
+                          'F Irish Sea M English Channel',
+                          'F Mid-Atlantic Ocean S F Irish Sea - English Channel'),
+              'France': ('A Brest M London',
+                         'F English Channel C A Brest - London',
+                         'F Belgium S F English Channel'),
+              'Russia': ('A Norway M Belgium', 'F North Sea C A Norway - Belgium')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_two_units_can_swap_by_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'England': ('A Norway', 'F Skagerrak'), 'Russia': ('A Sweden',)}),
+            ('orders',
+             {'England': ('A Norway M Sweden', 'F Skagerrak C A Norway - Sweden'),
+              'Russia': ('A Sweden M Norway',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_kidnapping_an_army',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Norway',), 'Germany': ('F Skagerrak',), 'Russia': ('F Sweden',)}),
+            ('orders',
+             {'England': ('A Norway M Sweden',),
+              'Germany': ('F Skagerrak C A Norway - Sweden',),
+              'Russia': ('F Sweden M Norway',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_kidnapping_with_disrupted_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F English Channel',),
+              'France': ('F Brest', 'A Picardy', 'A Burgundy', 'F Mid-Atlantic Ocean')}),
+            ('orders',
+             {'England': ('F English Channel C A Picardy - Belgium',),
+              'France': ('F Brest M English Channel',
+                         'A Picardy M Belgium',
+                         'A Burgundy S A Picardy - Belgium',
+                         'F Mid-Atlantic Ocean S F Brest - English Channel')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_kidnapping_with_disrupted_convoy_and_opposite_move',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F English Channel', 'A Belgium'),
+              'France': ('F Brest', 'A Picardy', 'A Burgundy', 'F Mid-Atlantic Ocean')}),
+            ('orders',
+             {'England': ('F English Channel C A Picardy - Belgium', 'A Belgium M Picardy'),
+              'France': ('F Brest M English Channel',
+                         'A Picardy M Belgium',
+                         'A Burgundy S A Picardy - Belgium',
+                         'F Mid-Atlantic Ocean S F Brest - English Channel')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_swapping_with_intent',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Italy': ('A Rome', 'F Tyrrhenian Sea'), 'Turkey': ('A Apulia', 'F Ionian Sea')}),
+            ('orders',
+             {'Italy': ('A Rome M Apulia', 'F Tyrrhenian Sea C A Apulia - Rome'),
+              'Turkey': ('A Apulia M Rome', 'F Ionian Sea C A Apulia - Rome')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_swapping_with_unintended_intent',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Liverpool', 'F English Channel'),
+              'France': ('F Irish Sea', 'F North Sea'),
+              'Germany': ('A Edinburgh',),
+              'Russia': ('F Norwegian Sea', 'F North Atlantic Ocean')}),
+            ('orders',
+             {'England': ('A Liverpool M Edinburgh', 'F English Channel C A Liverpool - Edinburgh'),
+              'France': ('F Irish Sea H', 'F North Sea H'),
+              'Germany': ('A Edinburgh M Liverpool',),
+              'Russia': ('F Norwegian Sea C A Liverpool - Edinburgh',
+                         'F North Atlantic Ocean C A Liverpool - Edinburgh')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_swapping_with_illegal_intent',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Skagerrak', 'F Norway'), 'Russia': ('A Sweden', 'F Gulf of Bothnia')}),
+            ('orders',
+             {'England': ('F Skagerrak C A Sweden - Norway', 'F Norway M Sweden'),
+              'Russia': ('A Sweden M Norway', 'F Gulf of Bothnia C A Sweden - Norway')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_explicit_convoy_that_isnt_there',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'England': ('F North Sea', 'A Holland'), 'France': ('A Belgium',)}),
+            ('orders',
+             {'England': ('F North Sea M Helgoland Bight', 'A Holland M Kiel'),
+              'France': ('A Belgium M Holland *',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_swapped_or_dislodged',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Norway', 'F Skagerrak', 'F Finland'), 'Russia': ('A Sweden',)}),
+            ('orders',
+             {'England': ('A Norway M Sweden',
+                          'F Skagerrak C A Norway - Sweden',
+                          'F Finland S A Norway - Sweden'),
+              'Russia': ('A Sweden M Norway',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_swapped_or_head_to_head',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Norway', 'F Denmark', 'F Finland'),
+              'France': ('F Norwegian Sea', 'F North Sea'),
+              'Germany': ('F Skagerrak',),
+              'Russia': ('A Sweden', 'F Barents Sea')}),
+            ('orders',
+             {'England': ('A Norway M Sweden *',
+                          'F Denmark S A Norway - Sweden',
+                          'F Finland S A Norway - Sweden'),
+              'France': ('F Norwegian Sea M Norway', 'F North Sea S F Norwegian Sea - Norway'),
+              'Germany': ('F Skagerrak C A Norway - Sweden',),
+              'Russia': ('A Sweden M Norway', 'F Barents Sea S A Sweden - Norway')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_convoy_to_adjacent_place_with_paradox',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Norway', 'F North Sea'),
+              'Russia': ('A Sweden', 'F Skagerrak', 'F Barents Sea')}),
+            ('orders',
+             {'England': ('F Norway S F North Sea - Skagerrak', 'F North Sea M Skagerrak'),
+              'Russia': ('A Sweden M Norway',
+                         'F Skagerrak C A Sweden - Norway',
+                         'F Barents Sea S A Sweden - Norway')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_swapping_two_units_with_two_convoys',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Liverpool', 'F North Atlantic Ocean', 'F Norwegian Sea'),
+              'Germany': ('A Edinburgh', 'F North Sea', 'F English Channel', 'F Irish Sea')}),
+            ('orders',
+             {'England': ('A Liverpool M Edinburgh *',
+                          'F North Atlantic Ocean C A Liverpool - Edinburgh',
+                          'F Norwegian Sea C A Liverpool - Edinburgh'),
+              'Germany': ('A Edinburgh M Liverpool *',
+                          'F North Sea C A Edinburgh - Liverpool',
+                          'F English Channel C A Edinburgh - Liverpool',
+                          'F Irish Sea C A Edinburgh - Liverpool')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_support_cut_on_attack_on_itself_via_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('F Adriatic Sea', 'A Trieste'), 'Italy': ('A Venice', 'F Albania')}),
+            ('orders',
+             {'Austria': ('F Adriatic Sea C A Trieste - Venice', 'A Trieste M Venice *'),
+              'Italy': ('A Venice S F Albania - Trieste', 'F Albania M Trieste')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_bounce_by_convoy_to_adjacent_place',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Norway', 'F Denmark', 'F Finland'),
+              'France': ('F Norwegian Sea', 'F North Sea'),
+              'Germany': ('F Skagerrak',),
+              'Russia': ('A Sweden', 'F Barents Sea')}),
+            ('orders',
+             {'England': ('A Norway M Sweden',
+                          'F Denmark S A Norway - Sweden',
+                          'F Finland S A Norway - Sweden'),
+              'France': ('F Norwegian Sea M Norway', 'F North Sea S F Norwegian Sea - Norway'),
+              'Germany': ('F Skagerrak C A Sweden - Norway',),
+              'Russia': ('A Sweden M Norway *', 'F Barents Sea S A Sweden - Norway')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_bounce_and_dislodge_with_double_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'A Holland', 'A Yorkshire', 'A London'),
+              'France': ('F English Channel', 'A Belgium')}),
+            ('orders',
+             {'England': ('F North Sea C A London - Belgium',
+                          'A Holland S A London - Belgium',
+                          'A Yorkshire M London',
+                          'A London M Belgium *'),
+              'France': ('F English Channel C A Belgium - London', 'A Belgium M London *')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_two_units_in_one_area_bug_by_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Norway', 'A Denmark', 'F Baltic Sea', 'F North Sea'),
+              'Russia': ('A Sweden', 'F Skagerrak', 'F Norwegian Sea')}),
+            ('orders',
+             {'England': ('A Norway M Sweden',
+                          'A Denmark S A Norway - Sweden',
+                          'F Baltic Sea S A Norway - Sweden',
+                          'F North Sea M Norway'),
+              'Russia': ('A Sweden M Norway *',
+                         'F Skagerrak C A Sweden - Norway',
+                         'F Norwegian Sea S A Sweden - Norway')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_two_units_in_one_area_bug_moving_over_land',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Norway', 'A Denmark', 'F Baltic Sea', 'F Skagerrak', 'F North Sea'),
+              'Russia': ('A Sweden', 'F Norwegian Sea')}),
+            ('orders',
+             {'England': ('A Norway M Sweden *',
+                          'A Denmark S A Norway - Sweden',
+                          'F Baltic Sea S A Norway - Sweden',
+                          'F Skagerrak C A Norway - Sweden',
+                          'F North Sea M Norway'),
+              'Russia': ('A Sweden M Norway', 'F Norwegian Sea S A Sweden - Norway')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_convoys.ConvoyingToAdjacent',
+        'test': 'test_two_units_in_one_area_bug_with_double_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'A Holland', 'A Yorkshire', 'A London', 'A Ruhr'),
+              'France': ('F English Channel', 'A Belgium', 'A Wales')}),
+            ('orders',
+             {'England': ('F North Sea C A London - Belgium',
+                          'A Holland S A London - Belgium',
+                          'A Yorkshire M London',
+                          'A London M Belgium',
+                          'A Ruhr S A London - Belgium'),
+              'France': ('F English Channel C A Belgium - London',
+                         'A Belgium M London',
+                         'A Wales S A Belgium - London')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.BasicChecks',
+        'test': 'test_move_to_own_sector_with_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'A Yorkshire', 'A Liverpool'),
+              'Germany': ('F London', 'A Wales')}),
+            ('orders',
+             {'England': ('F North Sea C A Yorkshire - Yorkshire',
+                          'A Yorkshire M Yorkshire',
+                          'A Liverpool S A Yorkshire - Yorkshire'),
+              'Germany': ('F London M Yorkshire', 'A Wales S F London - Yorkshire')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.BasicChecks',
+        'test': 'test_support_to_hold_yourself',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Austria': ('F Trieste',), 'Italy': ('A Venice', 'A Tyrolia')}),
+            ('orders',
+             {'Austria': ('F Trieste S F Trieste',),
+              'Italy': ('A Venice M Trieste', 'A Tyrolia S A Venice - Trieste')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.BasicChecks',
+        'test': 'test_support_on_unreachable_destination',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Austria': ('A Venice',), 'Italy': ('F Rome', 'A Apulia')}),
+            ('orders',
+             {'Austria': ('A Venice H',),
+              'Italy': ('F Rome S A Apulia - Venice', 'A Apulia M Venice')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.BasicChecks',
+        'test': 'test_simple_bounce',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Austria': ('A Vienna',), 'Italy': ('A Venice',)}),
+            ('orders', {'Austria': ('A Vienna M Tyrolia',), 'Italy': ('A Venice M Tyrolia',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.BasicChecks',
+        'test': 'test_bounce_of_three_units',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Austria': ('A Vienna',), 'Germany': ('A Munich',), 'Italy': ('A Venice',)}),
+            ('orders',
+             {'Austria': ('A Vienna M Tyrolia',),
+              'Germany': ('A Munich M Tyrolia',),
+              'Italy': ('A Venice M Tyrolia',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CoastalIssues',
+        'test': 'test_support_to_unreachable_coast_allowed',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'France': ('F Gascony', 'F Marseilles'), 'Italy': ('F Western Mediterranean',)}),
+            ('orders',
+             {'France': ('F Gascony M Spain (NC)', 'F Marseilles S F Gascony - Spain (NC)'),
+              'Italy': ('F Western Mediterranean M Spain (SC)',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CoastalIssues',
+        'test': 'test_support_from_unreachable_coast_not_allowed',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'France': ('F Marseilles', 'F Spain (NC)'), 'Italy': ('F Gulf of Lyon',)}),
+            ('orders',
+             {'France': ('F Marseilles M Gulf of Lyon',
+                         'F Spain (NC) S F Marseilles - Gulf of Lyon'),
+              'Italy': ('F Gulf of Lyon H',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CoastalIssues',
+        'test': 'test_support_can_be_cut_from_other_coast',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Irish Sea', 'F North Atlantic Ocean'),
+              'France': ('F Spain (NC)', 'F Mid-Atlantic Ocean'),
+              'Italy': ('F Gulf of Lyon',)}),
+            ('orders',
+             {'England': ('F Irish Sea S F North Atlantic Ocean - Mid-Atlantic Ocean',
+                          'F North Atlantic Ocean M Mid-Atlantic Ocean'),
+              'France': ('F Spain (NC) S F Mid-Atlantic Ocean', 'F Mid-Atlantic Ocean H'),
+              'Italy': ('F Gulf of Lyon M Spain (SC)',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CoastalIssues',
+        'test': 'test_supporting_with_unspecified_coast',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'France': ('F Portugal', 'F Mid-Atlantic Ocean'),
+              'Italy': ('F Gulf of Lyon', 'F Western Mediterranean')}),
+            ('orders',
+             {'France': ('F Portugal S F Mid-Atlantic Ocean - Spain',
+                         'F Mid-Atlantic Ocean M Spain (NC)'),
+              'Italy': ('F Gulf of Lyon S F Western Mediterranean - Spain (SC)',
+                        'F Western Mediterranean M Spain (SC)')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CoastalIssues',
+        'test': 'test_supporting_with_unspecified_coast_when_only_one_possible',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'France': ('F Portugal', 'F Gascony'),
+              'Italy': ('F Gulf of Lyon', 'F Western Mediterranean')}),
+            ('orders',
+             {'France': ('F Portugal S F Gascony - Spain', 'F Gascony M Spain (NC)'),
+              'Italy': ('F Gulf of Lyon S F Western Mediterranean - Spain (SC)',
+                        'F Western Mediterranean M Spain (SC)')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CoastalIssues',
+        'test': 'test_supporting_with_wrong_coast',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'France': ('F Portugal', 'F Mid-Atlantic Ocean'),
+              'Italy': ('F Gulf of Lyon', 'F Western Mediterranean')}),
+            ('orders',
+             {'France': ('F Portugal S F Mid-Atlantic Ocean - Spain (NC)',
+                         'F Mid-Atlantic Ocean M Spain (SC)'),
+              'Italy': ('F Gulf of Lyon S F Western Mediterranean - Spain (SC)',
+                        'F Western Mediterranean M Spain (SC)')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CoastalIssues',
+        'test': 'test_coastal_crawl_not_allowed',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Turkey': ('F Bulgaria (SC)', 'F Constantinople')}),
+            ('orders',
+             {'Turkey': ('F Bulgaria (SC) M Constantinople', 'F Constantinople M Bulgaria (EC)')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CoastalIssues',
+        'test': 'test_build_with_unspecified_coast',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('initial_ownership',),
+            ('generate',),
+            ('generate',),
+            ('generate',),
+            ('generate',),
+            ('orders', {'Russia': ('F St. Petersburg B',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CircularMovement',
+        'test': 'test_three_unit_circular_move',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Turkey': ('F Ankara', 'A Constantinople', 'A Smyrna')}),
+            ('orders',
+             {'Turkey': ('F Ankara M Constantinople',
+                         'A Constantinople M Smyrna',
+                         'A Smyrna M Ankara')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CircularMovement',
+        'test': 'test_three_unit_circular_move_with_support',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Turkey': ('F Ankara', 'A Constantinople', 'A Smyrna', 'A Bulgaria')}),
+            ('orders',
+             {'Turkey': ('F Ankara M Constantinople',
+                         'A Constantinople M Smyrna',
+                         'A Smyrna M Ankara',
+                         'A Bulgaria S F Ankara - Constantinople')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CircularMovement',
+        'test': 'test_disrupted_three_unit_circular_move',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Turkey': ('F Ankara', 'A Constantinople', 'A Smyrna', 'A Bulgaria')}),
+            ('orders',
+             {'Turkey': ('F Ankara M Constantinople',
+                         'A Constantinople M Smyrna',
+                         'A Smyrna M Ankara',
+                         'A Bulgaria M Constantinople')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CircularMovement',
+        'test': 'test_circular_move_with_attacked_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('A Trieste', 'A Serbia'),
+              'Italy': ('F Naples',),
+              'Turkey': ('A Bulgaria', 'F Aegean Sea', 'F Ionian Sea', 'F Adriatic Sea')}),
+            ('orders',
+             {'Austria': ('A Trieste M Serbia', 'A Serbia M Bulgaria'),
+              'Italy': ('F Naples M Ionian Sea',),
+              'Turkey': ('A Bulgaria M Trieste',
+                         'F Aegean Sea C A Bulgaria - Trieste',
+                         'F Ionian Sea C A Bulgaria - Trieste',
+                         'F Adriatic Sea C A Bulgaria - Trieste')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CircularMovement',
+        'test': 'test_circular_move_with_disrupted_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('A Trieste', 'A Serbia'),
+              'Italy': ('F Naples', 'F Tunisia'),
+              'Turkey': ('A Bulgaria', 'F Aegean Sea', 'F Ionian Sea', 'F Adriatic Sea')}),
+            ('orders',
+             {'Austria': ('A Trieste M Serbia', 'A Serbia M Bulgaria'),
+              'Italy': ('F Naples M Ionian Sea', 'F Tunisia S F Naples - Ionian Sea'),
+              'Turkey': ('A Bulgaria M Trieste',
+                         'F Aegean Sea C A Bulgaria - Trieste',
+                         'F Ionian Sea C A Bulgaria - Trieste',
+                         'F Adriatic Sea C A Bulgaria - Trieste')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CircularMovement',
+        'test': 'test_two_armies_with_two_convoys',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'A London'), 'France': ('F English Channel', 'A Belgium')}),
+            ('orders',
+             {'England': ('F North Sea C A London - Belgium', 'A London M Belgium'),
+              'France': ('F English Channel C A Belgium - London', 'A Belgium M London')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_main.CircularMovement',
+        'test': 'test_bounced_unit_swap',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F North Sea', 'A London'),
+              'France': ('F English Channel', 'A Belgium', 'A Burgundy')}),
+            ('orders',
+             {'England': ('F North Sea C A London - Belgium', 'A London M Belgium'),
+              'France': ('F English Channel C A Belgium - London',
+                         'A Belgium M London',
+                         'A Burgundy M Belgium')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_no_supports_during_retreat',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('F Trieste', 'A Serbia'),
+              'Italy': ('A Venice', 'A Tyrolia', 'F Ionian Sea', 'F Aegean Sea'),
+              'Turkey': ('F Greece',)}),
+            ('orders',
+             {'Austria': ('F Trieste H', 'A Serbia H'),
+              'Italy': ('A Venice S A Tyrolia - Trieste',
+                        'A Tyrolia M Trieste',
+                        'F Ionian Sea M Greece',
+                        'F Aegean Sea S F Ionian Sea - Greece'),
+              'Turkey': ('F Greece H',)}),
+            ('generate',),
+            ('orders',
+             {'Austria': ('F Trieste M Albania', 'A Serbia S F Trieste - Albania'),
+              'Turkey': ('F Greece M Albania',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_no_supports_from_retreating_unit',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Liverpool', 'F Yorkshire', 'F Norway'),
+              'Germany': ('A Kiel', 'A Ruhr'),
+              'Russia': ('F Edinburgh', 'A Sweden', 'A Finland', 'F Holland')}),
+            ('orders',
+             {'England': ('A Liverpool M Edinburgh',
+                          'F Yorkshire S A Liverpool - Edinburgh',
+                          'F Norway H'),
+              'Germany': ('A Kiel S A Ruhr - Holland', 'A Ruhr M Holland'),
+              'Russia': ('F Edinburgh H',
+                         'A Sweden S A Finland - Norway',
+                         'A Finland M Norway',
+                         'F Holland H')}),
+            ('generate',),
+            ('orders',
+             {'England': ('F Norway M North Sea',),
+              'Russia': ('F Edinburgh M North Sea', 'F Holland S F Edinburgh - North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_no_convoy_during_retreat',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'England': ('F North Sea', 'A Holland'), 'Germany': ('F Kiel', 'A Ruhr')}),
+            ('orders',
+             {'England': ('F North Sea H', 'A Holland H'),
+              'Germany': ('F Kiel S A Ruhr - Holland', 'A Ruhr M Holland')}),
+            ('generate',),
+            ('orders',
+             {'England': ('A Holland M Yorkshire', 'F North Sea C A Holland - Yorkshire')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_no_other_moves_during_retreat',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'England': ('F North Sea', 'A Holland'), 'Germany': ('F Kiel', 'A Ruhr')}),
+            ('orders',
+             {'England': ('F North Sea H', 'A Holland H'),
+              'Germany': ('F Kiel S A Ruhr - Holland', 'A Ruhr M Holland')}),
+            ('generate',),
+            ('orders', {'England': ('A Holland M Belgium', 'F North Sea M Norwegian Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_unit_may_not_retreat_to_area_it_was_attacked_from',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units', {'Russia': ('F Constantinople', 'F Black Sea'), 'Turkey': ('F Ankara',)}),
+            ('orders',
+             {'Russia': ('F Constantinople S F Black Sea - Ankara', 'F Black Sea M Ankara'),
+              'Turkey': ('F Ankara H',)}),
+            ('generate',),
+            ('orders', {'Turkey': ('F Ankara M Black Sea',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_unit_may_not_retreat_to_contested_area',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('A Budapest', 'A Trieste'),
+              'Germany': ('A Munich', 'A Silesia'),
+              'Italy': ('A Vienna',)}),
+            ('orders',
+             {'Austria': ('A Budapest S A Trieste - Vienna', 'A Trieste M Vienna'),
+              'Germany': ('A Munich M Bohemia', 'A Silesia M Bohemia'),
+              'Italy': ('A Vienna H',)}),
+            ('generate',),
+            ('orders', {'Italy': ('A Vienna M Bohemia',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_two_retreats_to_same_area_disbands_units',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'Austria': ('A Budapest', 'A Trieste'),
+              'Germany': ('A Munich', 'A Silesia'),
+              'Italy': ('A Vienna', 'A Bohemia')}),
+            ('orders',
+             {'Austria': ('A Budapest S A Trieste - Vienna', 'A Trieste M Vienna'),
+              'Germany': ('A Munich S A Silesia - Bohemia', 'A Silesia M Bohemia'),
+              'Italy': ('A Vienna H', 'A Bohemia H')}),
+            ('generate',),
+            ('orders', {'Italy': ('A Bohemia M Tyrolia', 'A Vienna M Tyrolia')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_three_retreats_to_same_area_disbands_units',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Liverpool', 'F Yorkshire', 'F Norway'),
+              'Germany': ('A Kiel', 'A Ruhr'),
+              'Russia': ('F Edinburgh', 'A Sweden', 'A Finland', 'F Holland')}),
+            ('orders',
+             {'England': ('A Liverpool M Edinburgh',
+                          'F Yorkshire S A Liverpool - Edinburgh',
+                          'F Norway H'),
+              'Germany': ('A Kiel S A Ruhr - Holland', 'A Ruhr M Holland'),
+              'Russia': ('F Edinburgh H',
+                         'A Sweden S A Finland - Norway',
+                         'A Finland M Norway',
+                         'F Holland H')}),
+            ('generate',),
+            ('orders',
+             {'England': ('F Norway M North Sea',),
+              'Russia': ('F Edinburgh M North Sea', 'F Holland M North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_dislodged_unit_will_not_make_attackers_area_contested',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Helgoland Bight', 'F Denmark'),
+              'Germany': ('A Berlin', 'F Kiel', 'A Silesia'),
+              'Russia': ('A Prussia',)}),
+            ('orders',
+             {'England': ('F Helgoland Bight M Kiel', 'F Denmark S F Helgoland Bight - Kiel'),
+              'Germany': ('A Berlin M Prussia', 'F Kiel H', 'A Silesia S A Berlin - Prussia'),
+              'Russia': ('A Prussia M Berlin',)}),
+            ('generate',),
+            ('orders', {'Germany': ('F Kiel M Berlin',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_attackers_area_not_contested_for_other_retreats',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Kiel',),
+              'Germany': ('A Berlin', 'A Munich', 'A Prussia'),
+              'Russia': ('A Warsaw', 'A Silesia')}),
+            ('orders',
+             {'England': ('A Kiel H',),
+              'Germany': ('A Berlin M Kiel', 'A Munich S A Berlin - Kiel', 'A Prussia H'),
+              'Russia': ('A Warsaw M Prussia', 'A Silesia S A Warsaw - Prussia')}),
+            ('generate',),
+            ('orders', {'England': ('A Kiel M Berlin',), 'Germany': ('A Prussia M Berlin',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_retreat_when_dislodged_by_adjacent_convoy',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'France': ('A Gascony',
+                         'A Burgundy',
+                         'F Mid-Atlantic Ocean',
+                         'F Western Mediterranean',
+                         'F Gulf of Lyon'),
+              'Italy': ('A Marseilles',)}),
+            ('orders',
+             {'France': ('A Gascony M Marseilles *',
+                         'A Burgundy S A Gascony - Marseilles',
+                         'F Mid-Atlantic Ocean C A Gascony - Marseilles',
+                         'F Western Mediterranean C A Gascony - Marseilles',
+                         'F Gulf of Lyon C A Gascony - Marseilles'),
+              'Italy': ('A Marseilles H',)}),
+            ('generate',),
+            ('orders', {'Italy': ('A Marseilles M Gascony',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_retreat_when_dislodged_by_adjacent_convoy_while_convoying',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Liverpool', 'F Irish Sea', 'F English Channel', 'F North Sea'),
+              'France': ('F Brest', 'F Mid-Atlantic Ocean'),
+              'Russia': ('A Edinburgh', 'F Norwegian Sea', 'F North Atlantic Ocean', 'A Clyde')}),
+            ('orders',
+             {'England': ('A Liverpool M Edinburgh *',
+                          'F Irish Sea C A Liverpool - Edinburgh',
+                          'F English Channel C A Liverpool - Edinburgh',
+                          'F North Sea C A Liverpool - Edinburgh'),
+              'France': ('F Brest M English Channel',
+                         'F Mid-Atlantic Ocean S F Brest - English Channel'),
+              'Russia': ('A Edinburgh M Liverpool *',
+                         'F Norwegian Sea C A Edinburgh - Liverpool',
+                         'F North Atlantic Ocean C A Edinburgh - Liverpool',
+                         'A Clyde S A Edinburgh - Liverpool')}),
+            ('generate',),
+            ('orders', {'England': ('A Liverpool M Edinburgh',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_no_retreat_with_convoy_in_main_phase',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Picardy', 'F English Channel'), 'France': ('A Paris', 'A Brest')}),
+            ('orders',
+             {'England': ('A Picardy H', 'F English Channel C A Picardy - London'),
+              'France': ('A Paris M Picardy', 'A Brest S A Paris - Picardy')}),
+            ('generate',),
+            ('orders', {'England': ('A Picardy M London',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_no_retreat_with_support_in_main_phase',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('A Picardy', 'F English Channel'),
+              'France': ('A Paris', 'A Brest', 'A Burgundy'),
+              'Germany': ('A Munich', 'A Marseilles')}),
+            ('orders',
+             {'England': ('A Picardy H', 'F English Channel S A Picardy - Belgium'),
+              'France': ('A Paris M Picardy', 'A Brest S A Paris - Picardy', 'A Burgundy H'),
+              'Germany': ('A Munich S A Marseilles - Burgundy', 'A Marseilles M Burgundy')}),
+            ('generate',),
+            ('orders', {'England': ('A Picardy M Belgium',), 'France': ('A Burgundy M Belgium',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_no_coastal_crawl_in_retreat',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'England': ('F Portugal',), 'France': ('F Spain (SC)', 'F Mid-Atlantic Ocean')}),
+            ('orders',
+             {'England': ('F Portugal H',),
+              'France': ('F Spain (SC) M Portugal',
+                         'F Mid-Atlantic Ocean S F Spain (SC) - Portugal')}),
+            ('generate',),
+            ('orders', {'England': ('F Portugal M Spain (NC)',)}),
+            ('orders', {'England': ('F Portugal M Mid-Atlantic Ocean',)}),
+            ('orders', {'England': ('F Portugal M Spain (SC)',)}),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Retreating',
+        'test': 'test_contested_for_both_coasts',
+        'turn': {'number': 0, 'season': 'S', 'year': 1900},
+        'ownership': False,
+        'actions': [
+            ('units',
+             {'France': ('F Mid-Atlantic Ocean', 'F Gascony', 'F Western Mediterranean'),
+              'Italy': ('F Tunisia', 'F Tyrrhenian Sea')}),
+            ('orders',
+             {'France': ('F Mid-Atlantic Ocean M Spain (NC)',
+                         'F Gascony M Spain (NC)',
+                         'F Western Mediterranean H'),
+              'Italy': ('F Tunisia S F Tyrrhenian Sea - Western Mediterranean',
+                        'F Tyrrhenian Sea M Western Mediterranean')}),
+            ('generate',),
+            ('orders', {'France': ('F Western Mediterranean M Spain (SC)',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Building',
+        'test': 'test_too_many_build_orders',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('units', {'Germany': ('F North Sea', 'F English Channel')}),
+            ('orders', {'Germany': ('A Warsaw B', 'A Kiel B', 'A Munich B')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Building',
+        'test': 'test_fleets_cannot_be_built_in_land_areas',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('units', {'Russia': ('F St. Petersburg (SC)', 'A Warsaw', 'F Sevastopol')}),
+            ('orders', {'Russia': ('F Moscow B',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Building',
+        'test': 'test_supply_center_must_be_empty_for_building',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('units', {'Germany': ('A Berlin', 'F English Channel')}),
+            ('orders', {'Germany': ('A Berlin B',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Building',
+        'test': 'test_both_coasts_must_be_empty_for_building',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('units', {'Russia': ('F St. Petersburg (SC)',)}),
+            ('orders', {'Russia': ('F St. Petersburg (NC) B',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Building',
+        'test': 'test_building_in_home_supply_center_that_is_not_owned',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership', [('territory', 'berlin')], [], 'russia'),
+            ('orders', {'Germany': ('A Berlin B',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Building',
+        'test': 'test_building_in_owned_supply_center_that_is_not_a_home_center',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership', [('territory', 'warsaw')], [], 'germany'),
+            ('orders', {'Germany': ('A Warsaw B',)}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.Building',
+        'test': 'test_only_one_build_in_a_home_supply_center',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('orders', {'Russia': ('A Moscow B', 'A Moscow B')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.CivilDisorderAndDisbands',
+        'test': 'test_too_many_remove_orders',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership', [('government', 'france')], [('territory', 'marseilles')], 'germany'),
+            ('units', {'France': ('A Paris', 'A Picardy')}),
+            ('orders', {'France': ('F Gulf of Lyon D', 'A Picardy D', 'A Paris D')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.CivilDisorderAndDisbands',
+        'test': 'test_removing_the_same_unit_twice',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership', [('government', 'france')], [('territory', 'marseilles')], 'germany'),
+            ('units', {'France': ('A Paris', 'F English Channel', 'F North Sea')}),
+            ('orders', {'France': ('A Paris D', 'A Paris D')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.CivilDisorderAndDisbands',
+        'test': 'test_civil_disorder_two_armies_with_different_distance',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership', [('government', 'russia')], [('territory', 'moscow')], 'germany'),
+            ('units', {'Russia': ('A Livonia', 'A Sweden')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.CivilDisorderAndDisbands',
+        'test': 'test_civil_disorder_two_armies_with_equal_distance',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership', [('government', 'russia')], [('territory', 'moscow')], 'germany'),
+            ('units', {'Russia': ('A Livonia', 'A Ukraine')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.CivilDisorderAndDisbands',
+        'test': 'test_civil_disorder_two_fleets_with_different_distance',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership', [('government', 'russia')], [('territory', 'moscow')], 'germany'),
+            ('units', {'Russia': ('F Skagerrak', 'F Berlin')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.CivilDisorderAndDisbands',
+        'test': 'test_civil_disorder_two_fleets_with_equal_distance',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership', [('government', 'russia')], [('territory', 'moscow')], 'germany'),
+            ('units', {'Russia': ('F Berlin', 'F Helgoland Bight')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.CivilDisorderAndDisbands',
+        'test': 'test_civil_disorder_two_fleets_and_army_with_equal_distance',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership',
+             [('government', 'russia')],
+             [('territory', 'moscow'), ('territory', 'warsaw')],
+             'germany'),
+            ('units', {'Russia': ('A Bohemia', 'F Skagerrak', 'F North Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.CivilDisorderAndDisbands',
+        'test': 'test_civil_disorder_fleet_with_shorter_distance_than_army',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership', [('government', 'russia')], [('territory', 'moscow')], 'germany'),
+            ('units', {'Russia': ('A Tyrolia', 'F Baltic Sea')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.CivilDisorderAndDisbands',
+        'test': 'test_civil_disorder_must_be_counted_from_both_coasts',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership', [('government', 'russia')], [('territory', 'moscow')], 'germany'),
+            ('units', {'Russia': ('A Tyrolia', 'F Skagerrak')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.CivilDisorderAndDisbands',
+        'test': 'test_civil_disorder_counting_convoying_distance',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership',
+             [('government', 'italy')],
+             [('territory', 'rome'), ('territory', 'venice')],
+             'france'),
+            ('units', {'Italy': ('F Ionian Sea', 'A Greece', 'A Silesia')}),
+            ('generate',),
+        ]
+    },
+    {
+        'case': 'test_datc_retreats_adjusts.CivilDisorderAndDisbands',
+        'test': 'test_civil_disorder_counting_distance_without_convoying_fleet',
+        'turn': {'number': 4, 'season': 'FA', 'year': 1900},
+        'ownership': True,
+        'actions': [
+            ('ownership', [('government', 'italy')], [('territory', 'rome')], 'france'),
+            ('units', {'Italy': ('A Greece', 'A Silesia')}),
+            ('generate',),
+        ]
+    },
+]
@@ -73,3 +73,21 @@ class CanonicalOrderFactory(factory.DjangoModelFactory):
 
     via_convoy = False
     user_issued = True
+
+
+def active_game(**kwargs):
+    """A game with seven governments, activated and so in its first turn."""
+    game = GameFactory(state='S', **kwargs)
+    for x in range(7):
+        GovernmentFactory(game=game)
+    game.activate()
+    return game
+
+
+class ActiveGameMixin(object):
+    """Sets up an active game, as `self.game`, for each test."""
+
+    def setUp(self):
+        super(ActiveGameMixin, self).setUp()
+        self.game = active_game()
+        self.assertEqual(self.game.state, 'A')
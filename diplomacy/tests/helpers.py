@@ -1,84 +1,67 @@
-from collections import defaultdict
-import re
+from django.test import TestCase, override_settings
 
 from .. import models
-from ..engine import standard
-
-
-convert = {u'F': u'S', u'A': u'L'}
-other = {'L': 'S', 'S': 'L', 'F': 'A', 'A': 'F'}
-
-location = (r"(?{territory}[-\w.]{{2,}}(?: [-\w.]{{2,}})*)"
-            r"(?: \((?{subname}\w+)\))?")
-unit = r"(?{u_type}F|A) " + location
-locRE = re.compile(location.format(territory="P<territory>",
-                                   subname="P<subname>"))
-unitRE = re.compile(unit.format(u_type="P<sr_type>",
-                                territory="P<territory>",
-                                subname="P<subname>"))
-opts = {'u_type': ':', 'territory': ':', 'subname': ':'}
-U, L = unit.format(**opts), location.format(**opts)
-order_patterns = {'H': re.compile(r"(?P<actor>{0}) H$".format(U)),
-                  'M': re.compile(r"(?P<actor>{0}) M"
-                                  r" (?P<target>{1})"
-                                  r"(?: (?P<via_convoy>[*]))?$".format(U, L)),
-                  'S': re.compile(r"(?P<actor>{0}) S (?P<assist>{0})"
-                                  r"(?: - (?P<target>{1}))?$".format(U, L)),
-                  'C': re.compile(r"(?P<actor>{0}) C (?P<assist>{0})"
-                                  r" - (?P<target>{1})$".format(U, L)),
-                  'B': re.compile(r"(?P<actor>{0}) B$".format(U)),
-                  'D': re.compile(r"(?P<actor>{0}) D$".format(U))}
-
-
-subregion_index = defaultdict(list)
-for sr_token, (territory, subname, sr_type) in standard.subregions.items():
-    subregion_index[(territory,)].append(sr_token)
-    subregion_index[(territory, subname)].append(sr_token)
-    subregion_index[(territory, subname, sr_type)].append(sr_token)
-
-
-def get_subregion(territory, subname, sr_type, strict=False, **kwargs):
-    sr_type = convert.get(sr_type, sr_type)
-    subname = subname or u''
-    if not subregion_index[(territory,)]:
-        return u''
-    if subname and not subregion_index[(territory, subname)]:
-        subname = u''
-
-    result = subregion_index[(territory, subname, sr_type)]
-    if not result and not strict:
-        result = subregion_index[(territory, subname, other[sr_type])]
-    if len(result) == 1:
-        return result[0]
-    return u''
-
-
-def parse(unitstr):
-    unit = {}
-    match = unitRE.match(unitstr)
-    if match:
-        unit.update(**match.groupdict(''))
-    else:
-        match = locRE.match(unitstr)
-        if match:
-            unit.update(**match.groupdict(''))
-    return unit
+from .notation import parse_units, parse_orders
+
+
+# The sample project's settings only have MIDDLEWARE_CLASSES, which
+# newer versions of Django ignore, so the tests that log in or submit
+# forms install the middleware themselves.
+with_middleware = override_settings(MIDDLEWARE=[
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+])
+
+
+def order_form_data(response):
+    """The POST data for the orders a rendered orders page started with."""
+    initial = response.context['form'].initial
+    data = {'form-TOTAL_FORMS': len(initial), 'form-INITIAL_FORMS': len(initial)}
+    for i, order in enumerate(initial):
+        for field, value in order.items():
+            if field != 'via_convoy':
+                data['form-{0}-{1}'.format(i, field)] = value or ''
+            elif value:
+                data['form-{0}-{1}'.format(i, field)] = 'on'
+    return data
+
+
+class DATCTestCase(TestCase):
+    """
+    The base of the DATC test cases, which generate their turns with
+    the adjudicator named by `adjudicator`.
+
+    """
+    adjudicator = 'search'
+
+    @classmethod
+    def setUpClass(cls):
+        cls._adjudicator_settings = override_settings(DIPLOMACY_ADJUDICATOR=cls.adjudicator)
+        cls._adjudicator_settings.enable()
+        try:
+            super(DATCTestCase, cls).setUpClass()
+        except Exception:
+            cls._adjudicator_settings.disable()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        super(DATCTestCase, cls).tearDownClass()
+        cls._adjudicator_settings.disable()
 
 
 def create_units(units, turn, governments):
-    parsed = (
-        (gvt, unitstr[0], parse(unitstr))
-        for gvt, uset in units.items()
-        for unitstr in uset
-    )
     return models.Unit.objects.bulk_create([
         models.Unit(turn=turn,
                     government=governments[gvt],
                     u_type=u_type,
-                    subregion=get_subregion(udict.get('territory', ''),
-                                            udict.get('subname', ''),
-                                            udict.get('sr_type', '')))
-        for gvt, u_type, udict in parsed
+                    subregion=subregion)
+        for gvt, u_type, subregion in parse_units(units)
     ])
 
 
@@ -88,36 +71,20 @@ def create_orders(orders, turn, governments):
         for gvt in orders
     }
 
-    parsed = (
-        (gvt, action, regexp.match(orderstr))
-        for gvt, oset in orders.items()
-        for orderstr in oset
-        for action, regexp in order_patterns.items()
-    )
-    parsed = (
-        (gvt, action, omatch.groupdict(''))
-        for gvt, action, omatch in parsed
-        if omatch is not None
-    )
-    parsed = (
-        (gvt, action,
-         parse(odict.get('actor', '')),
-         parse(odict.get('assist', '')),
-         parse(odict.get('target', '')),
-         bool(odict.get('via_convoy')))
-        for gvt, action, odict in parsed
-    )
-
     final_orders = [
-        models.Order(post=order_posts[gvt],
-                     actor=get_subregion(strict=(turn.season == 'FA'), **actor),
-                     action=action,
-                     assist=get_subregion(**assist) if assist else '',
-                     target=get_subregion(
-                         sr_type=assist.get('sr_type', '') if assist else actor.get('sr_type', ''),
-                         **target
-                     ) if target else '',
-                     via_convoy=via_convoy)
-        for gvt, action, actor, assist, target, via_convoy in parsed
+        models.Order(post=order_posts[gvt], **order)
+        for gvt, order in parse_orders(orders, turn.season)
     ]
     return models.Order.objects.bulk_create(final_orders)
+
+
+def datc_cases():
+    """Yields the name and class of each of the DATC test cases."""
+    from . import test_datc_battles, test_datc_convoys, test_datc_main, test_datc_retreats_adjusts
+
+    for module in (test_datc_main, test_datc_battles, test_datc_convoys,
+                   test_datc_retreats_adjusts):
+        for name, case in sorted(vars(module).items()):
+            if (isinstance(case, type) and issubclass(case, DATCTestCase)
+                    and case.__module__ == module.__name__):
+                yield name, case
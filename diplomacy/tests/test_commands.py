@@ -0,0 +1,140 @@
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.six import StringIO
+
+from .. import models
+from ..management.commands import generate_turns
+from . import factories
+
+
+class GenerateTurnsTest(TestCase):
+    def setUp(self):
+        self.games = [factories.active_game(slug=slug) for slug in ('first', 'second')]
+
+    def post_all(self, game):
+        turn = game.current_turn()
+        for gvt in game.government_set.all():
+            models.OrderPost.objects.create(turn=turn, government=gvt)
+
+    def mark_ready(self, game):
+        """Marks every government of `game` ready, as django-turngeneration would."""
+        readies = {game.pk: set(game.government_set.values_list('pk', flat=True))}
+        original = generate_turns.turngeneration_readies
+        generate_turns.turngeneration_readies = lambda games: readies
+        self.addCleanup(setattr, generate_turns, 'turngeneration_readies', original)
+
+    def generate_turns(self, *args, **kwargs):
+        kwargs.setdefault('workers', 1)
+        call_command('generate_turns', *args, stdout=StringIO(), **kwargs)
+        # The current turn is kept on each instance.
+        for game in self.games:
+            game.refresh_from_db()
+        return [game.current_turn().season for game in self.games]
+
+    def test_waits_for_readies(self):
+        self.assertEqual(self.generate_turns(), ['S', 'S'])
+
+        # Posting orders does not by itself make a government ready.
+        self.post_all(self.games[1])
+        self.assertEqual(self.generate_turns(), ['S', 'S'])
+
+        self.mark_ready(self.games[1])
+        self.assertEqual(self.generate_turns(), ['S', 'SR'])
+
+    def test_force(self):
+        self.assertEqual(self.generate_turns(force=True), ['SR', 'SR'])
+
+    def test_slugs(self):
+        self.assertEqual(self.generate_turns('second', force=True), ['S', 'SR'])
+
+    def test_results_stored(self):
+        game = self.games[0]
+        turn = game.current_turn()
+        gvt = game.government_set.get(power='france')
+        post = models.OrderPost.objects.create(turn=turn, government=gvt)
+        post.orders.create(actor='paris.l', action='M', target='burgundy.l')
+
+        self.generate_turns('first', force=True, workers=2)
+
+        turn = game.current_turn()
+        self.assertEqual(turn.number, 1)
+        self.assertTrue(turn.legal_orders)
+        self.assertIn({'government': 'france', 'u_type': 'A', 'subregion': 'burgundy.l',
+                       'previous': 'paris.l', 'dislodged': False,
+                       'displaced_from': '', 'standoff_from': '', 'lineage': '0:paris.l'},
+                      turn.get_units())
+        self.assertEqual(turn.prev.canonicalorder_set.count(), 22)
+        stored = models.Game.objects.get(pk=game.pk)
+        self.assertEqual((stored.latest_turn_id, stored.last_generated), (turn.pk, turn.generated))
+
+    def test_matches_game_generate(self):
+        for game in self.games:
+            turn = game.current_turn()
+            gvt = game.government_set.get(power='france')
+            post = models.OrderPost.objects.create(turn=turn, government=gvt)
+            post.orders.create(actor='paris.l', action='M', target='burgundy.l')
+            # An earlier post, which is replaced by the later one.
+            post = models.OrderPost.objects.create(turn=turn, government=gvt)
+            post.orders.create(actor='paris.l', action='M', target='picardy.l')
+            post = models.OrderPost.objects.create(turn=turn, government=gvt)
+            post.orders.create(actor='paris.l', action='M', target='burgundy.l')
+
+        self.games[0].generate()
+        self.generate_turns('second', force=True)
+
+        first, second = [game.current_turn() for game in self.games]
+        self.assertEqual(first.as_data(), second.as_data())
+        self.assertCountEqual(first.get_units(), second.get_units())
+        self.assertCountEqual(first.get_ownership(), second.get_ownership())
+        self.assertEqual(first.get_legal_orders(), second.get_legal_orders())
+
+        def canonical(turn):
+            return sorted(
+                (o.government.power, o.actor, o.action, o.assist, o.target,
+                 o.via_convoy, o.user_issued, o.result, o.lineage)
+                for o in turn.prev.canonicalorder_set.all()
+            )
+        self.assertEqual(canonical(first), canonical(second))
+
+        def lineages(turn):
+            return sorted((u.government.power, u.subregion, u.lineage)
+                          for u in turn.unit_set.all())
+        self.assertEqual(lineages(first), lineages(second))
+
+        def standings(turn):
+            return sorted((s.government.power, s.supply_centers, s.units, s.builds, s.actionable)
+                          for s in turn.standing_set.all())
+        self.assertEqual(standings(first), standings(second))
+        self.assertEqual(len(standings(first)), 7)
+        self.assertIn(('france', 'burgundy.l', '0:paris.l'), lineages(first))
+
+    def test_constant_queries(self):
+        def count_queries():
+            with CaptureQueriesContext(connection) as context:
+                call_command('generate_turns', force=True, workers=1, stdout=StringIO())
+            return len(context.captured_queries)
+
+        small = count_queries()
+        for slug in ('third', 'fourth', 'fifth'):
+            self.games.append(factories.active_game(slug=slug))
+        large = count_queries()
+
+        self.assertEqual(small, large)
+        # With no dislodged units, nobody has anything to order in the
+        # spring retreats, so those games are ready to generate.
+        self.assertEqual(self.generate_turns(), ['F'] * 5)
+
+    @override_settings(DIPLOMACY_PACKED_BOARD=True)
+    def test_packed_board(self):
+        self.generate_turns('first', force=True)
+        turn = self.games[0].current_turn()
+        self.assertTrue(turn.packed_board)
+        self.assertEqual(len(turn.get_units()), 22)
+
+        # A packed board is read in place of the rows.
+        turn.unit_set.all().delete()
+        turn.ownership_set.all().delete()
+        self.assertEqual(self.generate_turns('first', force=True), ['F', 'S'])
+        self.assertEqual(len(self.games[0].current_turn().get_units()), 22)
@@ -0,0 +1,45 @@
+from collections import defaultdict
+from itertools import permutations
+
+from django.test import TestCase
+
+from ..engine import main
+from ..engine.compare import DEPENDENCIES
+from ..engine.utils import get_territory
+from .datc_scenarios import scenarios
+
+
+def pairwise_dependencies(orders):
+    """The original construction, examining every pair of orders."""
+    dep = defaultdict(list)
+    for (T1, o1), (T2, o2) in permutations(orders.items(), 2):
+        depend = False
+        act1, act2 = o1['action'], o2['action']
+        if (act1, act2) in DEPENDENCIES:
+            depend = any(f(T1, o1, T2, o2) for f in DEPENDENCIES[(act1, act2)])
+
+        if depend:
+            dep[T1].append(T2)
+
+    return dep
+
+
+class DependencyEquivalenceTest(TestCase):
+    def test_datc(self):
+        # Every movement turn in the DATC scenarios gets the same
+        # dependency graph from both constructions.
+        steps = 0
+        for scenario in scenarios():
+            for turn, orders, units, owns in scenario.steps:
+                if turn['season'] not in ('S', 'F'):
+                    continue
+                orders_index = {
+                    get_territory(o['actor']): o
+                    for o in main.normalize_orders(turn, orders, units, owns)
+                    if o['actor'] is not None
+                }
+                self.assertEqual(dict(main.construct_dependencies(orders_index)),
+                                 dict(pairwise_dependencies(orders_index)),
+                                 scenario.name)
+                steps += 1
+        self.assertTrue(steps)
@@ -1,14 +1,12 @@
-from django.test import TestCase
-
 from . import factories
-from .helpers import create_units, create_orders
+from .helpers import DATCTestCase, create_units, create_orders
 from .. import models
 from ..engine import standard
 from ..engine.check import is_legal
 from ..engine.utils import get_territory
 
 
-class SupportsAndDislodges(TestCase):
+class SupportsAndDislodges(DATCTestCase):
     """
     Based on section 6.D from the Diplomacy Adjudicator Test Cases
     website.
@@ -1281,7 +1279,7 @@ class SupportsAndDislodges(TestCase):
                 for u in units))
 
 
-class HeadToHeadAndBeleagueredGarrison(TestCase):
+class HeadToHeadAndBeleagueredGarrison(DATCTestCase):
     """
     Based on section 6.E from the Diplomacy Adjudicator Test Cases
     website.
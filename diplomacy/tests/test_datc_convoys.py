@@ -1,14 +1,12 @@
-from django.test import TestCase
-
 from . import factories
-from .helpers import create_units, create_orders
+from .helpers import DATCTestCase, create_units, create_orders
 from .. import models
 from ..engine import standard
 from ..engine.check import is_legal
 from ..engine.utils import get_territory
 
 
-class Convoys(TestCase):
+class Convoys(DATCTestCase):
     """
     Based on section 6.F from the Diplomacy Adjudicator Test Cases
     website.
@@ -1109,7 +1107,7 @@ class Convoys(TestCase):
                 for u in units))
 
 
-class ConvoyingToAdjacent(TestCase):
+class ConvoyingToAdjacent(DATCTestCase):
     """
     Based on section 6.G from the Diplomacy Adjudicator Test Cases
     website.
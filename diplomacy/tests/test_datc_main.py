@@ -1,7 +1,5 @@
-from django.test import TestCase
-
 from . import factories
-from .helpers import create_units, create_orders
+from .helpers import DATCTestCase, create_units, create_orders
 from .. import models
 from ..engine import standard
 from ..engine.check import is_legal
@@ -10,7 +8,7 @@ from ..engine.main import initialize_game
 from ..engine.utils import get_territory
 
 
-class BasicChecks(TestCase):
+class BasicChecks(DATCTestCase):
     """
     Based on section 6.A from the Diplomacy Adjudicator Test Cases
     website.
@@ -288,7 +286,7 @@ class BasicChecks(TestCase):
             sum(1 for u in units if u['standoff_from'] == 'tyrolia'), 3)
 
 
-class CoastalIssues(TestCase):
+class CoastalIssues(DATCTestCase):
     """
     Based on section 6.B from the Diplomacy Adjudicator Test Cases
     website.
@@ -677,7 +675,7 @@ class CoastalIssues(TestCase):
         self.assertFalse(units)
 
 
-class CircularMovement(TestCase):
+class CircularMovement(DATCTestCase):
     """
     Based on section 6.C from the Diplomacy Adjudicator Test Cases
     website.
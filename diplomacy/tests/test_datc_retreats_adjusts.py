@@ -1,9 +1,7 @@
 from collections import Counter
 
-from django.test import TestCase
-
 from . import factories
-from .helpers import create_units, create_orders
+from .helpers import DATCTestCase, create_units, create_orders
 from .. import models
 from ..engine import standard
 from ..engine.check import is_legal
@@ -12,7 +10,7 @@ from ..engine.main import initialize_game
 from ..engine.utils import get_territory
 
 
-class Retreating(TestCase):
+class Retreating(DATCTestCase):
     """
     Based on section 6.H from the Diplomacy Adjudicator Test Cases
     website.
@@ -888,7 +886,7 @@ class Retreating(TestCase):
             sum(1 for u in units if u['government'] == 'france'), 2)
 
 
-class Building(TestCase):
+class Building(DATCTestCase):
     """
     Based on section 6.I from the Diplomacy Adjudicator Test Cases
     website.
@@ -1082,7 +1080,7 @@ class Building(TestCase):
             sum(1 for u in units if u['government'] == 'russia'), 1)
 
 
-class CivilDisorderAndDisbands(TestCase):
+class CivilDisorderAndDisbands(DATCTestCase):
     """
     Based on section 6.J from the Diplomacy Adjudicator Test Cases
     website.
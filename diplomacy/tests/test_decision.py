@@ -0,0 +1,8 @@
+from .helpers import datc_cases
+
+
+# Run the full DATC suite again, with the decision propagation
+# adjudicator in place of the default guess-and-check search.
+for name, case in datc_cases():
+    globals()['Decision' + name] = type(
+        'Decision' + name, (case,), {'__module__': __name__, 'adjudicator': 'decision'})
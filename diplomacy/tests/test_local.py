@@ -3,7 +3,13 @@ import re
 from django.test import TestCase
 from django.utils import six
 
-from ..engine.digest import find_convoys
+from ..engine import standard
+from ..engine.board import BoardState, fingerprint
+from ..engine.check import is_legal, legal_orders, valid_move
+from ..engine.digest import builds_available, find_convoys, find_convoys_cached
+from ..engine.main import initialize_game
+from ..engine.packing import pack, unpack
+from ..engine.topology import standard_map
 from ..engine.utils import (get_territory, territory_display, unit_display, subregion_token,
                             power_token)
 
@@ -80,3 +86,201 @@ class CorrectnessHelperTest(TestCase):
             ['Prussia', 'Berlin', 'Kiel', 'Denmark', 'Sweden',
              'Finland', 'St. Petersburg', 'Livonia']
         )
+
+    def test_find_convoys_cached(self):
+        units = {'England': ('F North Sea',
+                             'F English Channel',
+                             'F Irish Sea',
+                             'A London')}
+
+        parsed = self.parse_units(units)
+        fleets = [u['subregion'] for u in parsed if u['u_type'] == 'F']
+        expected = find_convoys(parsed, fleets)
+
+        legal = find_convoys_cached(parsed, fleets)
+        self.assertEqual(legal, expected)
+
+        # Mutating the result must not leak into later calls.
+        legal[0][0].clear()
+        self.assertEqual(find_convoys_cached(parsed, fleets), expected)
+
+
+class TopologyTest(TestCase):
+    def test_ids(self):
+        self.assertEqual(len(standard_map.territories), len(standard.territories))
+        self.assertEqual(len(standard_map.subregions), len(standard.subregions))
+
+        for sr, i in standard_map.subregion_id.items():
+            self.assertEqual(standard_map.subregions[i], sr)
+            self.assertEqual(standard_map.territories[standard_map.territory_of[i]],
+                             get_territory(sr))
+
+    def test_adjacency(self):
+        for sr, borders in standard.connectivity.items():
+            i = standard_map.subregion_id[sr]
+            self.assertCountEqual(
+                [standard_map.subregions[b] for b in standard_map.borders[i]], borders)
+            for b in standard_map.subregions:
+                self.assertEqual(standard_map.adjacent(i, standard_map.subregion_id[b]),
+                                 b in borders)
+
+    def test_territories(self):
+        bulgaria = standard_map.territory_id['bulgaria']
+        self.assertCountEqual(
+            [standard_map.subregions[sr] for sr in standard_map.coasts[bulgaria]],
+            ['bulgaria.ec.s', 'bulgaria.sc.s'])
+        self.assertTrue(standard_map.has_land[bulgaria])
+        self.assertTrue(standard_map.supply[bulgaria])
+
+        bohemia = standard_map.territory_id['bohemia']
+        self.assertEqual(standard_map.coasts[bohemia], ())
+        self.assertFalse(standard_map.has_sea[bohemia])
+        self.assertFalse(standard_map.supply[bohemia])
+
+        north_sea = standard_map.territory_id['north-sea']
+        self.assertFalse(standard_map.has_land[north_sea])
+
+        self.assertEqual(sum(standard_map.supply), 34)
+        self.assertEqual(standard_map.home[standard_map.territory_id['paris']], 'france')
+
+
+class BoardStateTest(TestCase):
+    def setUp(self):
+        turn, self.units, self.owns = initialize_game()
+        self.board = BoardState(self.units, self.owns, turn['season'])
+
+    def test_indexes(self):
+        self.assertEqual(self.board.units_at('paris.l'), (
+            {'government': 'france', 'u_type': 'A', 'subregion': 'paris.l',
+             'lineage': '0:paris.l'},))
+        self.assertEqual(self.board.units_in('st-petersburg'), (
+            {'government': 'russia', 'u_type': 'F', 'subregion': 'st-petersburg.sc.s',
+             'lineage': '0:st-petersburg.sc.s'},))
+        self.assertEqual(self.board.units_at('st-petersburg.l'), ())
+        self.assertEqual(len(self.board.units_of('russia')), 4)
+        self.assertIn('vienna', self.board.occupied)
+        self.assertNotIn('tyrolia', self.board.occupied)
+        self.assertFalse(self.board.convoy_fleets)
+        self.assertEqual(dict(self.board.builds), dict(builds_available(self.units, self.owns)))
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.board.season = 'F'
+        with self.assertRaises(TypeError):
+            self.board.units_at('paris.l')[0]['subregion'] = 'burgundy.l'
+        with self.assertRaises(TypeError):
+            self.board.builds['france'] = 1
+
+        # The board does not follow changes to the lists it was built from.
+        self.units[0]['subregion'] = 'nowhere.l'
+        self.assertNotIn('nowhere.l', self.board.by_subregion)
+
+    def test_fingerprint(self):
+        turn, units, owns = initialize_game()
+        self.assertEqual(fingerprint(units, owns, 'S'),
+                         fingerprint(units[::-1], owns[::-1], 'S'))
+        self.assertEqual(self.board.key, fingerprint(units, owns, 'S'))
+        self.assertNotEqual(fingerprint(units, owns, 'S'), fingerprint(units[1:], owns, 'S'))
+
+    def test_is_legal(self):
+        orders = [
+            {'government': 'france', 'actor': 'paris.l', 'action': 'M',
+             'assist': '', 'target': 'burgundy.l'},
+            {'government': 'france', 'actor': 'paris.l', 'action': 'M',
+             'assist': '', 'target': 'munich.l'},
+            {'government': 'germany', 'actor': 'munich.l', 'action': 'S',
+             'assist': 'paris.l', 'target': 'burgundy.l'},
+            {'government': 'germany', 'actor': 'paris.l', 'action': 'H',
+             'assist': '', 'target': ''},
+        ]
+        for order in orders:
+            self.assertEqual(
+                is_legal(order, self.units, self.owns, 'S', board=self.board),
+                is_legal(order, self.units, self.owns, 'S')
+            )
+        self.assertEqual(
+            [is_legal(o, self.units, self.owns, 'S', board=self.board) for o in orders],
+            [True, False, True, False]
+        )
+
+
+class LegalOrdersTest(TestCase):
+    def setUp(self):
+        turn, self.units, self.owns = initialize_game()
+
+    def test_all_powers(self):
+        legal = legal_orders(self.units, self.owns, 'S')
+
+        self.assertEqual(set(legal), set(standard.powers))
+        self.assertEqual(len(legal['russia']), 4)
+        self.assertEqual(set(legal['france']['paris.l']), {'H', 'M', 'S'})
+        self.assertEqual(legal['france']['paris.l']['M'],
+                         valid_move('paris.l', BoardState(self.units, self.owns, 'S')))
+        self.assertEqual(set(legal['england']), {'london.s', 'edinburgh.s', 'liverpool.l'})
+        # Coastal fleets cannot convoy.
+        self.assertEqual(set(legal['england']['london.s']), {'H', 'M', 'S'})
+
+    def test_cached(self):
+        board = BoardState(self.units, self.owns, 'S')
+        legal = legal_orders(self.units, self.owns, 'S', board=board)
+        self.assertIs(legal_orders(self.units, self.owns, 'S', board=board), legal)
+
+        # Equal positions share the tree, even from different lists.
+        turn, units, owns = initialize_game()
+        self.assertIs(legal_orders(units, owns, 'S'), legal_orders(self.units, self.owns, 'S'))
+
+    def test_builds(self):
+        units = [u for u in self.units if u['government'] != 'austria-hungary']
+        legal = legal_orders(units, self.owns, 'FA')
+
+        self.assertEqual(set(legal['austria-hungary']),
+                         {'', 'vienna.l', 'budapest.l', 'trieste.l', 'trieste.s'})
+        self.assertEqual(legal['austria-hungary']['trieste.s'], {'B': {'': {'': False}}})
+        self.assertEqual(legal['france'], {})
+
+
+class PackingTest(TestCase):
+    def test_round_trip(self):
+        turn, units, owns = initialize_game()
+        units = [dict(u, previous='', dislodged=False, displaced_from='', standoff_from='')
+                 for u in units]
+        owns = [dict(o, is_supply=bool(o['is_supply'])) for o in owns]
+
+        new_units, new_owns = unpack(pack(units, owns))
+        self.assertCountEqual(new_units, units)
+        self.assertCountEqual(new_owns, owns)
+
+    def test_retreat_details(self):
+        units = [
+            {'government': 'france', 'u_type': 'A', 'subregion': 'burgundy.l',
+             'previous': 'paris.l', 'dislodged': False,
+             'displaced_from': '', 'standoff_from': '', 'lineage': '0:paris.l'},
+            {'government': 'germany', 'u_type': 'A', 'subregion': 'burgundy.l',
+             'previous': 'burgundy.l', 'dislodged': True,
+             'displaced_from': 'paris', 'standoff_from': '', 'lineage': '0:munich.l'},
+            {'government': 'russia', 'u_type': 'F', 'subregion': 'st-petersburg.sc.s',
+             'previous': 'st-petersburg.sc.s', 'dislodged': False,
+             'displaced_from': '', 'standoff_from': 'norway', 'lineage': '6:st-petersburg.nc.s'},
+        ]
+        owns = [{'territory': 'paris', 'government': 'france', 'is_supply': True},
+                {'territory': 'burgundy', 'government': 'germany', 'is_supply': False}]
+
+        new_units, new_owns = unpack(pack(units, owns))
+        self.assertCountEqual(new_units, units)
+        self.assertCountEqual(new_owns, owns)
+
+    def test_missing_fields(self):
+        # As from `initialize_game` and `update_ownership`.
+        packed = pack([{'government': 'italy', 'u_type': 'F', 'subregion': 'naples.s'}],
+                      [{'territory': 'naples', 'government': 'italy'}])
+
+        self.assertEqual(unpack(packed), (
+            [{'government': 'italy', 'u_type': 'F', 'subregion': 'naples.s',
+              'previous': '', 'dislodged': False,
+              'displaced_from': '', 'standoff_from': '', 'lineage': ''}],
+            [{'territory': 'naples', 'government': 'italy', 'is_supply': True}]
+        ))
+
+    def test_unknown_version(self):
+        with self.assertRaises(ValueError):
+            unpack('{"v":2,"u":[],"o":[]}')
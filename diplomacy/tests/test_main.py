@@ -1,7 +1,10 @@
+import sys
+
 from django.test import TestCase
 from django.utils import six
 
-from ..engine import main
+from ..engine import main, resolver
+from ..engine.utils import get_territory
 
 
 if six.PY2:
@@ -148,3 +151,209 @@ class IncrementTurnTest(TestCase):
             'year': 1901,
             'season': 'S'
         })
+
+
+class AdjudicationTest(TestCase):
+    def setUp(self):
+        self.units = [
+            {'government': 'england', 'u_type': 'F', 'subregion': 'english-channel.s'},
+            {'government': 'england', 'u_type': 'A', 'subregion': 'london.l'},
+            {'government': 'france', 'u_type': 'A', 'subregion': 'brest.l'},
+            {'government': 'france', 'u_type': 'A', 'subregion': 'paris.l'},
+        ]
+        self.orders = {
+            'english-channel': {
+                'government': 'england', 'actor': 'english-channel.s', 'action': 'C',
+                'assist': 'london.l', 'target': 'brest.l', 'convoy': False},
+            'london': {
+                'government': 'england', 'actor': 'london.l', 'action': 'M',
+                'assist': '', 'target': 'brest.l', 'convoy': True},
+            'brest': {
+                'government': 'france', 'actor': 'brest.l', 'action': 'H',
+                'assist': '', 'target': '', 'convoy': False},
+            'paris': {
+                'government': 'france', 'actor': 'paris.l', 'action': 'S',
+                'assist': 'brest.l', 'target': '', 'convoy': False},
+        }
+
+    def assertMatchesBatch(self, adjudication):
+        state = adjudication.state
+        path, convoy = resolver.calculate_paths(state, self.orders, set(), self.units)
+        strengths = resolver.calculate_base_strengths(
+            state, self.orders, adjudication.unit_index, path, convoy)
+        resolver.calculate_supports(state, self.orders, adjudication.unit_index,
+                                    *(strengths + (convoy,)))
+
+        for T in self.orders:
+            self.assertEqual(adjudication.path[T], path.get(T, False))
+            self.assertEqual(adjudication.convoy[T], convoy[T])
+            self.assertEqual(
+                (adjudication.hold_str[T], adjudication.attack_str[T],
+                 adjudication.defend_str[T], adjudication.prevent_str[T]),
+                tuple(S[T] for S in strengths)
+            )
+
+    def test_assume_and_undo(self):
+        adjudication = resolver.Adjudication(self.orders, set(), set(), self.units)
+        self.assertMatchesBatch(adjudication)
+
+        assumptions = [('english-channel', True), ('paris', True),
+                       ('brest', True), ('london', False)]
+        for T, d in assumptions:
+            adjudication.assume(T, d)
+            self.assertMatchesBatch(adjudication)
+        self.assertEqual(adjudication.decisions, tuple(assumptions))
+        self.assertEqual(adjudication.path['london'], True)
+        self.assertEqual(adjudication.hold_str['brest'], 2)
+
+        for T, d in reversed(assumptions):
+            adjudication.undo()
+            self.assertMatchesBatch(adjudication)
+        self.assertEqual(adjudication.state, {})
+        self.assertEqual(adjudication.path['london'], False)
+
+
+class ConvoyIndexTest(TestCase):
+    def setUp(self):
+        self.turn = {'number': 0, 'year': 1901, 'season': 'S'}
+        self.units = [
+            {'government': 'england', 'u_type': 'F', 'subregion': 'english-channel.s'},
+            {'government': 'england', 'u_type': 'F', 'subregion': 'north-sea.s'},
+            {'government': 'england', 'u_type': 'A', 'subregion': 'london.l'},
+            {'government': 'france', 'u_type': 'A', 'subregion': 'brest.l'},
+        ]
+        self.owns = []
+
+    def test_normalized_moves(self):
+        orders = [
+            {'government': 'england', 'actor': 'english-channel.s', 'action': 'C',
+             'assist': 'london.l', 'target': 'brest.l', 'via_convoy': False},
+            {'government': 'england', 'actor': 'london.l', 'action': 'M',
+             'assist': '', 'target': 'brest.l', 'via_convoy': False},
+            {'government': 'france', 'actor': 'brest.l', 'action': 'M',
+             'assist': '', 'target': 'picardy.l', 'via_convoy': False},
+        ]
+        normalized = {
+            o['actor']: o
+            for o in main.normalize_orders(self.turn, orders, self.units, self.owns)
+        }
+
+        self.assertTrue(normalized['london.l']['convoy'])
+        self.assertFalse(normalized['brest.l']['convoy'])
+
+        orders_index = {get_territory(sr): o for sr, o in normalized.items()}
+        self.assertEqual(dict(resolver.index_assists(orders_index, 'C')),
+                         {'london': ['english-channel']})
+
+    def test_orders_unchanged(self):
+        orders = [
+            {'government': 'england', 'actor': 'english-channel.s', 'action': 'C',
+             'assist': 'london.l', 'target': 'brest.l', 'via_convoy': False},
+            {'government': 'england', 'actor': 'london.l', 'action': 'M',
+             'assist': '', 'target': 'brest.l', 'via_convoy': False},
+        ]
+        owns = [{'territory': 'london', 'government': 'england', 'is_supply': True}]
+        units = [dict(u, previous='', dislodged=False, displaced_from='', standoff_from='')
+                 for u in self.units]
+
+        turn, orders, units, owns = main.generate(self.turn, orders, units, owns)
+        keys = set(['government', 'actor', 'action', 'assist', 'target', 'via_convoy',
+                    'convoy', 'user_issued', 'result', 'lineage'])
+        for o in orders:
+            self.assertLessEqual(set(o), keys)
+
+    def test_unnormalized_orders(self):
+        orders = {
+            'english-channel': {
+                'government': 'england', 'actor': 'english-channel.s', 'action': 'C',
+                'assist': 'london.l', 'target': 'brest.l', 'convoy': False},
+            'london': {
+                'government': 'england', 'actor': 'london.l', 'action': 'M',
+                'assist': '', 'target': 'brest.l', 'convoy': True},
+        }
+
+        self.assertEqual(dict(resolver.index_assists(orders, 'C')),
+                         {'london': ['english-channel']})
+        self.assertEqual(resolver.immediate_fails(orders, self.units), set())
+
+
+class DetectParadoxTest(TestCase):
+    def test_deeper_than_recursion_limit(self):
+        size = 3 * sys.getrecursionlimit()
+        orders = {i: {'action': 'C' if i % 2 else 'S'} for i in range(size)}
+        # one long cycle, plus a chain hanging off of it
+        dep = {i: [(i + 1) % size] for i in range(size)}
+        orders.update((size + i, {'action': 'C'}) for i in range(size))
+        dep.update((size + i, [size + i + 1]) for i in range(size - 1))
+        dep[2 * size - 1] = [0]
+
+        self.assertEqual(resolver.detect_paradox(orders, dep),
+                         {i for i in range(size) if i % 2})
+
+
+class LineageTest(TestCase):
+    def test_carried(self):
+        turn, units, owns = main.initialize_game()
+        for u in units:
+            u.update(previous='', dislodged=False, displaced_from='', standoff_from='')
+        orders = [{'government': 'france', 'actor': 'paris.l', 'action': 'M',
+                   'assist': '', 'target': 'burgundy.l', 'via_convoy': False}]
+
+        turn, orders, units, owns = main.generate(turn, orders, units, owns)
+        self.assertIn(('burgundy.l', '0:paris.l'),
+                      [(u['subregion'], u['lineage']) for u in units])
+        self.assertIn(('paris.l', '0:paris.l'),
+                      [(o['actor'], o['lineage']) for o in orders])
+
+    def test_missing(self):
+        turn = {'number': 3, 'year': 1901, 'season': 'F'}
+        units = [{'government': 'france', 'u_type': 'A', 'subregion': 'paris.l',
+                  'previous': '', 'dislodged': False,
+                  'displaced_from': '', 'standoff_from': ''}]
+
+        turn, orders, units, owns = main.generate(turn, [], units, [])
+        self.assertEqual([u['lineage'] for u in units], ['3:paris.l'])
+
+    def test_builds(self):
+        orders = {
+            'paris': {'government': 'france', 'actor': 'paris.l', 'action': 'B',
+                      'result': 'S'},
+            'brest': {'government': 'france', 'actor': 'brest.s', 'action': 'B',
+                      'result': 'F'},
+        }
+
+        units = main.update_adjusts(orders, [], 5)
+        self.assertEqual([u['lineage'] for u in units], ['5:paris.l'])
+        self.assertEqual(orders['paris']['lineage'], '5:paris.l')
+        self.assertEqual(orders['brest']['lineage'], '5:brest.s')
+
+
+class GenerateManyTest(TestCase):
+    def payload(self, orders):
+        turn, units, owns = main.initialize_game()
+        for u in units:
+            u.update(previous='', dislodged=False, displaced_from='', standoff_from='')
+        return turn, orders, units, owns
+
+    def test_matches_generate(self):
+        orders = [
+            [],
+            [{'government': 'france', 'actor': 'paris.l', 'action': 'M',
+              'assist': '', 'target': 'burgundy.l', 'via_convoy': False}],
+            [{'government': 'germany', 'actor': 'munich.l', 'action': 'M',
+              'assist': '', 'target': 'burgundy.l', 'via_convoy': False},
+             {'government': 'france', 'actor': 'paris.l', 'action': 'M',
+              'assist': '', 'target': 'burgundy.l', 'via_convoy': False}],
+        ]
+
+        expected = []
+        for o in orders:
+            turn, new_orders, units, owns = main.generate(*self.payload(o))
+            expected.append((turn, list(new_orders), units, owns))
+
+        for workers in (1, 2):
+            results = main.generate_many([self.payload(o) for o in orders], workers=workers)
+            self.assertEqual(results, expected)
+
+    def test_empty(self):
+        self.assertEqual(main.generate_many([]), [])
@@ -1,7 +1,11 @@
-from django.test import TestCase
+import json
+
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
 from django.utils import six
 
 from .. import models
+from ..engine.check import legal_orders
 from . import factories
 
 
@@ -9,13 +13,7 @@ if six.PY2:
     TestCase.assertCountEqual = six.assertCountEqual
 
 
-class TurnTest(TestCase):
-    def setUp(self):
-        self.game = factories.GameFactory(state='S')
-        for x in range(7):
-            factories.GovernmentFactory(game=self.game)
-        self.assertTrue(self.game.activate())
-
+class TurnTest(factories.ActiveGameMixin, TestCase):
     def test_recent_orders_spring(self):
         gvt = models.Government.objects.all()[0]
 
@@ -304,3 +302,286 @@ class TurnTest(TestCase):
                          [('F', 1901)])
         self.assertEqual([(o.turn.season, o.turn.year) for o in orders['tuscany.l']],
                          [('F', 1901), ('FR', 1901)])
+
+
+class LineageTest(factories.ActiveGameMixin, TestCase):
+    def order(self, power, actor, action, target=''):
+        turn = self.game.current_turn()
+        gvt = self.game.government_set.get(power=power)
+        post = models.OrderPost.objects.create(turn=turn, government=gvt)
+        post.orders.create(actor=actor, action=action, target=target)
+
+    def lineage(self, turn, subregion):
+        return turn.unit_set.get(subregion=subregion).lineage
+
+    def test_carried_through_turns(self):
+        turn = self.game.current_turn()
+        self.assertEqual(self.lineage(turn, 'paris.l'), '0:paris.l')
+
+        self.order('france', 'paris.l', 'M', 'burgundy.l')
+        self.game.generate()
+        self.game.generate()
+        turn = self.game.current_turn()
+        self.assertEqual(turn.season, 'F')
+        self.assertEqual(self.lineage(turn, 'burgundy.l'), '0:paris.l')
+        self.assertEqual(self.lineage(turn, 'marseilles.l'), '0:marseilles.l')
+
+        self.order('france', 'burgundy.l', 'M', 'munich.l')
+        self.order('germany', 'munich.l', 'M', 'ruhr.l')
+        self.game.generate()
+        self.game.generate()
+        turn = self.game.current_turn()
+        self.assertEqual(turn.season, 'FA')
+        self.assertEqual(self.lineage(turn, 'munich.l'), '0:paris.l')
+        self.assertEqual(
+            turn.prev.prev.canonicalorder_set.get(actor='burgundy.l').lineage, '0:paris.l')
+
+        self.order('france', 'paris.l', 'B')
+        self.game.generate()
+        turn = self.game.current_turn()
+        self.assertEqual(self.lineage(turn, 'paris.l'), '5:paris.l')
+        self.assertEqual(turn.prev.canonicalorder_set.get(actor='paris.l').lineage,
+                         '5:paris.l')
+
+    def test_recent_orders(self):
+        self.order('france', 'paris.l', 'M', 'burgundy.l')
+        self.game.generate()
+        self.game.generate()
+        self.order('france', 'burgundy.l', 'M', 'munich.l')
+        self.order('germany', 'munich.l', 'M', 'ruhr.l')
+        self.game.generate()
+        self.game.generate()
+        self.order('france', 'paris.l', 'B')
+        self.game.generate()
+
+        for turn in self.game.turn_set.all():
+            turn = models.Turn.objects.get(pk=turn.pk)
+            with self.assertNumQueries(1):
+                recent = turn.recent_orders()
+            self.assertEqual(recent, turn.recent_orders_by_previous())
+
+        recent = dict(self.game.current_turn().recent_orders())
+        self.assertEqual([o.target for o in dict(recent['France'])['burgundy.l']],
+                         ['munich.l'])
+        self.assertEqual([o.action for o in dict(recent['France'])['b.paris.l']], ['B'])
+
+    def test_without_lineage(self):
+        self.order('france', 'paris.l', 'M', 'burgundy.l')
+        self.game.generate()
+        models.Unit.objects.update(lineage='')
+        models.CanonicalOrder.objects.update(lineage='')
+        self.game.generate()
+
+        turn = self.game.current_turn()
+        self.assertEqual(self.lineage(turn, 'burgundy.l'), '1:burgundy.l')
+        self.assertEqual(turn.recent_orders(), turn.recent_orders_by_previous())
+
+
+class LegalOrdersTest(factories.ActiveGameMixin, TestCase):
+    def test_stored_on_creation(self):
+        turn = self.game.current_turn()
+        self.assertTrue(turn.legal_orders)
+        self.assertEqual(
+            turn.get_legal_orders(),
+            legal_orders(turn.get_units(), turn.get_ownership(), turn.season)
+        )
+
+        self.game.generate()
+        turn = self.game.current_turn()
+        self.assertEqual(turn.season, 'SR')
+        self.assertTrue(turn.legal_orders)
+
+    def test_filter_orders_reads_stored(self):
+        turn = self.game.current_turn()
+        # Fetched apart from self.game, whose current turn is now out of date.
+        gvt = models.Government.objects.get(game=self.game, power='france')
+
+        tree = turn.get_legal_orders()
+        del tree['france']['paris.l']['S']
+        models.Turn.objects.filter(pk=turn.pk).update(legal_orders=json.dumps(tree))
+
+        self.assertEqual(set(gvt.filter_orders()['paris.l']), {'H', 'M'})
+
+    def test_memoized(self):
+        turn = self.game.current_turn()
+        with self.assertNumQueries(3):
+            units = turn.get_units()
+            owns = turn.get_ownership()
+            orders = turn.get_orders()
+        with self.assertNumQueries(0):
+            self.assertEqual(turn.get_units(), units)
+            self.assertEqual(turn.get_ownership(), owns)
+            self.assertEqual(turn.get_orders(), orders)
+            turn.get_board()
+
+        # Callers are given copies, which they may change freely.
+        units[0]['subregion'] = 'nowhere.l'
+        self.assertNotIn('nowhere.l', [u['subregion'] for u in turn.get_units()])
+
+    def test_missing_is_filled_in(self):
+        turn = self.game.current_turn()
+        models.Turn.objects.filter(pk=turn.pk).update(legal_orders='')
+
+        turn = models.Game.objects.get(pk=self.game.pk).current_turn()
+        self.assertEqual(set(turn.get_legal_orders()['france']['paris.l']), {'H', 'M', 'S'})
+        self.assertTrue(models.Turn.objects.get(pk=turn.pk).legal_orders)
+
+
+class GenerateTest(factories.ActiveGameMixin, TestCase):
+    def test_generate(self):
+        self.assertTrue(self.game.generate())
+        self.assertTrue(self.game.generate(number=1))
+        self.assertEqual(self.game.current_turn().number, 2)
+
+    def test_current_turn(self):
+        self.game.generate()
+        game = models.Game.objects.get(pk=self.game.pk)
+        with self.assertNumQueries(1):
+            turn = game.current_turn()
+            self.assertIs(game.current_turn(), turn)
+            self.assertIs(turn.game, game)
+        self.assertEqual(turn.number, 1)
+
+    def test_current_turn_fallback(self):
+        models.Game.objects.filter(pk=self.game.pk).update(latest_turn=None)
+        game = models.Game.objects.get(pk=self.game.pk)
+        self.assertEqual(game.current_turn().number, 0)
+
+        self.assertIsNone(factories.GameFactory(slug='setup', state='S').current_turn())
+
+    def test_last_generated(self):
+        self.game.generate()
+        turn = self.game.current_turn()
+        self.assertEqual(self.game.last_generated, turn.generated)
+        self.assertEqual(models.Game.objects.get(pk=self.game.pk).last_generated,
+                         turn.generated)
+
+    def test_stale_number(self):
+        self.assertTrue(self.game.generate(number=0))
+        self.assertFalse(self.game.generate(number=0))
+        self.assertEqual(self.game.turn_set.count(), 2)
+
+    def test_concurrent_turn(self):
+        # As left by a concurrent call that the lock did not hold back.
+        turn = self.game.current_turn()
+        models.Turn.objects.create(game=self.game, number=turn.number + 1,
+                                   year=turn.year, season='SR')
+
+        self.assertFalse(self.game.generate())
+        self.assertEqual(self.game.turn_set.count(), 2)
+        self.assertEqual(models.Game.objects.get(pk=self.game.pk).latest_turn_id, turn.pk)
+
+    def test_unique_number(self):
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                self.game.create_turn({'number': 0, 'year': 1900, 'season': 'S'})
+        self.assertEqual(self.game.turn_set.count(), 1)
+
+    def test_failure_rolls_back(self):
+        def create_ownership(turn, owns):
+            raise RuntimeError
+
+        original = models.Turn.create_ownership
+        models.Turn.create_ownership = create_ownership
+        try:
+            with self.assertRaises(RuntimeError):
+                self.game.generate()
+        finally:
+            models.Turn.create_ownership = original
+
+        self.assertEqual(self.game.turn_set.count(), 1)
+        self.assertFalse(models.Unit.objects.filter(turn__number=1).exists())
+
+
+@override_settings(DIPLOMACY_PACKED_BOARD=True)
+class PackedBoardTest(factories.ActiveGameMixin, TestCase):
+    def assertMatchesRows(self, turn):
+        rows = models.Turn.objects.get(pk=turn.pk)
+        rows.packed_board = ''
+        self.assertCountEqual(turn.get_units(), rows.get_units())
+        self.assertCountEqual(turn.get_ownership(), rows.get_ownership())
+
+    def test_stored(self):
+        turn = self.game.current_turn()
+        self.assertTrue(turn.packed_board)
+        self.assertMatchesRows(turn)
+
+        turn = models.Turn.objects.get(pk=turn.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(len(turn.get_units()), 22)
+            self.assertEqual(len(turn.get_ownership()), 42)
+
+    def test_generated(self):
+        turn = self.game.current_turn()
+        gvt = self.game.government_set.get(power='france')
+        post = models.OrderPost.objects.create(turn=turn, government=gvt)
+        post.orders.create(actor='paris.l', action='M', target='burgundy.l')
+
+        self.game.generate()
+        turn = self.game.current_turn()
+        self.assertTrue(turn.packed_board)
+        self.assertMatchesRows(turn)
+
+    @override_settings(DIPLOMACY_PACKED_BOARD=False)
+    def test_off(self):
+        self.game.generate()
+        turn = self.game.current_turn()
+        self.assertEqual(turn.packed_board, '')
+        self.assertEqual(len(turn.get_units()), 22)
+
+
+class StandingTest(factories.ActiveGameMixin, TestCase):
+    def computed(self, turn):
+        """The standings as worked out from the units and ownership."""
+        models.Standing.objects.filter(turn=turn).delete()
+        return self.game.governments(models.Turn.objects.get(pk=turn.pk))
+
+    def test_stored(self):
+        turn = self.game.current_turn()
+        standing = models.Standing.objects.get(turn=turn, government__power='russia')
+        self.assertEqual((standing.supply_centers, standing.units, standing.builds),
+                         (4, 4, 0))
+        self.assertTrue(standing.actionable)
+        self.assertFalse(standing.ready)
+
+        turn = models.Turn.objects.get(pk=turn.pk)
+        with self.assertNumQueries(1):
+            governments = self.game.governments(turn)
+        self.assertCountEqual(governments, self.computed(turn))
+
+    def test_generated(self):
+        gvt = self.game.government_set.get(power='france')
+        post = models.OrderPost.objects.create(turn=self.game.current_turn(), government=gvt)
+        post.orders.create(actor='paris.l', action='M', target='burgundy.l')
+        self.game.generate()
+        self.game.generate()
+
+        turn = self.game.current_turn()
+        self.assertEqual(turn.season, 'F')
+        self.assertEqual(turn.standing_set.count(), 7)
+        self.assertCountEqual(self.game.governments(turn), self.computed(turn))
+
+
+class NeighboursTest(factories.ActiveGameMixin, TestCase):
+    def setUp(self):
+        super(NeighboursTest, self).setUp()
+        self.game.generate()
+        self.game.generate()
+
+    def test_middle(self):
+        turn = models.Turn.objects.get(game=self.game, number=1)
+        with self.assertNumQueries(1):
+            self.assertEqual(turn.prev.number, 0)
+            self.assertEqual(turn.next.number, 2)
+            self.assertEqual((turn.prev.season, turn.next.season), ('S', 'F'))
+        self.assertEqual(turn.prev.get_deferred_fields(), {'legal_orders', 'packed_board'})
+
+    def test_ends(self):
+        first = models.Turn.objects.get(game=self.game, number=0)
+        last = models.Turn.objects.get(game=self.game, number=2)
+        with self.assertNumQueries(2):
+            for i in range(3):
+                self.assertIsNone(first.prev)
+                self.assertEqual(first.next.number, 1)
+                self.assertEqual(last.prev.number, 1)
+                self.assertIsNone(last.next)
@@ -0,0 +1,70 @@
+from django.test import TestCase
+
+from .. import models, plugins
+from . import factories
+
+
+class Ready(object):
+    def __init__(self, agent):
+        self.agent = agent
+
+
+class Readies(object):
+    def __init__(self, agents):
+        self.agents = agents
+
+    def all(self):
+        return [Ready(agent) for agent in self.agents]
+
+
+class Generator(object):
+    """Stands in for a turngeneration generator, with `agents` marked ready."""
+    def __init__(self, game, agents=()):
+        self.object_id = game.pk
+        self.readies = Readies(agents)
+
+
+class TurnGenerationTest(factories.ActiveGameMixin, TestCase):
+    def setUp(self):
+        super(TurnGenerationTest, self).setUp()
+        self.plugin = plugins.TurnGeneration()
+        # Nobody has anything to order in the spring retreats.
+        self.game.generate()
+        self.game.refresh_from_db()
+
+    def test_is_ready(self):
+        self.game.generate()
+        self.game.refresh_from_db()
+        turn = self.game.current_turn()
+        self.assertEqual(turn.season, 'F')
+        self.assertFalse(self.plugin.is_ready(Generator(self.game)))
+
+        # Posting orders does not by itself make a government ready.
+        governments = list(self.game.government_set.all())
+        for gvt in governments:
+            models.OrderPost.objects.create(turn=turn, government=gvt)
+        self.assertFalse(self.plugin.is_ready(Generator(self.game)))
+
+        self.assertTrue(self.plugin.is_ready(Generator(self.game, governments)))
+
+    def test_auto_generate(self):
+        self.assertTrue(self.plugin.is_ready(Generator(self.game)))
+        self.assertTrue(self.plugin.auto_generate(self.game))
+        self.assertEqual(self.game.current_turn().season, 'F')
+
+    def test_auto_generate_stale(self):
+        self.assertTrue(self.plugin.is_ready(Generator(self.game)))
+        self.game.current_turn()
+        models.Game.objects.get(pk=self.game.pk).generate()
+
+        # The turn the game was loaded with has already been generated.
+        self.assertFalse(self.plugin.auto_generate(self.game))
+        game = models.Game.objects.get(pk=self.game.pk)
+        self.assertEqual(game.current_turn().season, 'F')
+
+    def test_force_generate_stale(self):
+        models.Game.objects.get(pk=self.game.pk).generate()
+
+        self.assertFalse(self.plugin.force_generate(self.game))
+        game = models.Game.objects.get(pk=self.game.pk)
+        self.assertEqual(game.current_turn().season, 'F')
@@ -0,0 +1,108 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from . import factories
+from .helpers import order_form_data, with_middleware
+
+
+# No page, or submission of orders, should need more queries than this,
+# however long the game.
+MAX_QUERIES = 12
+
+
+@with_middleware
+class QueryCountTest(TestCase):
+    """
+    Renders every page against games of increasing length, to check
+    that the number of queries made does not grow with the game's
+    history.
+
+    """
+    sizes = (1, 10, 50)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.games = {}
+        for size in cls.sizes:
+            game = factories.active_game(slug='game-{0}'.format(size))
+            for n in range(size - 1):
+                game.generate()
+            cls.games[size] = game
+
+    def pages(self, game):
+        """The url of each page for this game, and who to view it as."""
+        turn, first = game.current_turn(), game.turn_set.get(number=0)
+        owner = game.owner
+        player = game.government_set.get(power='russia').user
+
+        def turn_kwargs(t):
+            return {'slug': game.slug, 'season': t.season, 'year': t.year}
+
+        return {
+            'game_list': (reverse('diplomacy_game_list'), None),
+            'game_detail': (reverse('diplomacy_game_detail', kwargs={'slug': game.slug}), None),
+            'game_master': (reverse('diplomacy_game_master', kwargs={'slug': game.slug}), owner),
+            'game_map': (reverse('diplomacy_game_map', kwargs={'slug': game.slug}), None),
+            'turn_detail': (reverse('diplomacy_turn_detail', kwargs=turn_kwargs(turn)), None),
+            'first_turn_detail': (reverse('diplomacy_turn_detail', kwargs=turn_kwargs(first)), None),
+            'turn_map': (reverse('diplomacy_turn_map', kwargs=turn_kwargs(turn)), None),
+            'first_turn_map': (reverse('diplomacy_turn_map', kwargs=turn_kwargs(first)), None),
+            'orders': (reverse('diplomacy_orders',
+                               kwargs={'gameslug': game.slug, 'slug': 'russia'}), player),
+        }
+
+    def count_queries(self, url, user):
+        if user is None:
+            self.client.logout()
+        else:
+            self.client.force_login(user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return len(context.captured_queries)
+
+    def count_submit_queries(self, game):
+        """The queries made by submitting Russia's orders in `game`."""
+        url, user = self.pages(game)['orders']
+        self.client.force_login(user)
+        data = order_form_data(self.client.get(url))
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 302, url)
+        return len(context.captured_queries)
+
+    def test_every_page_covered(self):
+        from ..urls import urlpatterns
+
+        self.assertEqual(
+            set(pattern.name for pattern in urlpatterns),
+            set('diplomacy_' + name for name in self.pages(self.games[1])
+                if not name.startswith('first_'))
+        )
+
+    def test_independent_of_history(self):
+        counts = {}
+        for size, game in self.games.items():
+            for name, (url, user) in self.pages(game).items():
+                counts.setdefault(name, {})[size] = self.count_queries(url, user)
+
+        for name, by_size in sorted(counts.items()):
+            message = "{0}: {1}".format(name, sorted(by_size.items()))
+            # The first turn of a game has no history to show, so it
+            # may take fewer queries; past that, the count is fixed.
+            self.assertLessEqual(by_size[1], by_size[10], message)
+            self.assertEqual(by_size[10], by_size[50], message)
+            self.assertLessEqual(by_size[50], MAX_QUERIES, message)
+
+    def test_submit_independent_of_history(self):
+        counts = {size: self.count_submit_queries(game) for size, game in self.games.items()}
+
+        # The 10 and 50 turn games are both in a fall adjustment, but
+        # the first turn is a movement turn, with other orders to save.
+        message = "orders submitted: {0}".format(sorted(counts.items()))
+        self.assertEqual(counts[10], counts[50], message)
+        self.assertLessEqual(max(counts.values()), MAX_QUERIES, message)
@@ -0,0 +1,147 @@
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import six
+
+from .. import forms, models, views
+from . import factories
+from .helpers import order_form_data, with_middleware
+
+
+if six.PY2:
+    TestCase.assertCountEqual = six.assertCountEqual
+
+
+@with_middleware
+class OrdersViewTest(factories.ActiveGameMixin, TestCase):
+    def url(self, power):
+        return reverse('diplomacy_orders', kwargs={'gameslug': self.game.slug, 'slug': power})
+
+    def submit(self, power):
+        """Posts the orders the page was rendered with, returning the queries made."""
+        self.client.force_login(self.game.government_set.get(power=power).user)
+        response = self.client.get(self.url(power))
+        self.assertEqual(response.status_code, 200)
+
+        data = order_form_data(response)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url(power), data)
+        self.assertEqual(response.status_code, 302)
+        return context.captured_queries
+
+    def test_submit(self):
+        self.submit('russia')
+
+        post = models.OrderPost.objects.get()
+        self.assertEqual(post.government.power, 'russia')
+        self.assertCountEqual(
+            [(o.actor, o.action) for o in post.orders.all()],
+            [('moscow.l', 'H'), ('sevastopol.s', 'H'),
+             ('st-petersburg.sc.s', 'H'), ('warsaw.l', 'H')]
+        )
+
+    def test_submit_marks_standing(self):
+        self.submit('russia')
+
+        standing = models.Standing.objects.get(government__power='russia')
+        self.assertTrue(standing.orders_submitted)
+        self.assertTrue(standing.ready)
+        self.assertFalse(models.Standing.objects.get(government__power='italy').ready)
+
+    def test_constant_queries(self):
+        # Russia starts with four units, Italy with three.
+        russia = self.submit('russia')
+        models.OrderPost.objects.all().delete()
+        italy = self.submit('italy')
+
+        self.assertEqual(len(russia), len(italy))
+
+    def test_power_case_insensitive(self):
+        self.client.force_login(self.game.government_set.get(power='russia').user)
+        response = self.client.get(self.url('Russia'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['object'].power, 'russia')
+
+
+class GameListViewTest(TestCase):
+    def setUp(self):
+        # The game still in setup is created first, so that it is listed
+        # last by when it was created.
+        third = factories.GameFactory(slug='third', state='S')
+        self.games = [factories.active_game(slug='first'), factories.active_game(slug='second'),
+                      third]
+
+    def slugs(self, response):
+        return [game.slug for game in response.context['game_list']]
+
+    def test_latest_first(self):
+        response = self.client.get(reverse('diplomacy_game_list'))
+        self.assertEqual(self.slugs(response), ['second', 'first', 'third'])
+
+        self.games[0].generate()
+        response = self.client.get(reverse('diplomacy_game_list'))
+        self.assertEqual(self.slugs(response), ['first', 'second', 'third'])
+
+    def test_constant_queries(self):
+        def count_queries():
+            with CaptureQueriesContext(connection) as context:
+                self.client.get(reverse('diplomacy_game_list'))
+            return len(context.captured_queries)
+
+        small = count_queries()
+        factories.active_game(slug='fourth')
+        self.games[0].generate()
+        self.assertEqual(count_queries(), small)
+
+    def test_paginated(self):
+        for n in range(30):
+            factories.GameFactory(slug='extra-{0}'.format(n), state='S')
+
+        response = self.client.get(reverse('diplomacy_game_list'))
+        self.assertTrue(response.context['is_paginated'])
+        self.assertEqual(len(response.context['game_list']), 25)
+        self.assertContains(response, '?page=2')
+
+        response = self.client.get(reverse('diplomacy_game_list'), {'page': 2})
+        self.assertEqual(len(response.context['game_list']), 8)
+
+
+class GameMasterViewTest(factories.ActiveGameMixin, TestCase):
+    def form_valid(self, game, action):
+        """Handles a valid `action` submission for a `game` loaded earlier."""
+        view = views.GameMasterView()
+        view.request = RequestFactory().post('/', {action: '1'})
+        view.request.user = game.owner
+        view.kwargs = {'slug': game.slug}
+        view.object = game
+
+        form = forms.GameMasterForm(data={})
+        self.assertTrue(form.is_valid())
+        view.form_valid(form)
+
+    def test_pause_stale_instance(self):
+        stale = models.Game.objects.get(pk=self.game.pk)
+        stale.current_turn()
+        self.assertTrue(models.Game.objects.get(pk=self.game.pk).generate())
+
+        self.form_valid(stale, 'pause')
+        self.form_valid(stale, 'unpause')
+
+        game = models.Game.objects.get(pk=self.game.pk)
+        self.assertEqual(game.state, 'A')
+        self.assertEqual(game.current_turn().number, 1)
+        self.assertTrue(game.generate())
+        self.assertEqual(game.current_turn().number, 2)
+
+    def test_close_stale_instance(self):
+        stale = models.Game.objects.get(pk=self.game.pk)
+        self.assertTrue(models.Game.objects.get(pk=self.game.pk).generate())
+        generated = models.Game.objects.get(pk=self.game.pk).last_generated
+        self.assertGreater(generated, stale.last_generated)
+
+        self.form_valid(stale, 'close')
+
+        game = models.Game.objects.get(pk=self.game.pk)
+        self.assertEqual(game.state, 'F')
+        self.assertEqual(game.last_generated, generated)
@@ -3,7 +3,6 @@ import json
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
-from django.db.models import Max
 from django.forms.formsets import formset_factory
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
@@ -12,17 +11,20 @@ from django.views.generic import ListView, DetailView
 from django.views.generic.edit import BaseFormView
 
 from . import models, forms
-from .engine.digest import builds_available, actionable_subregions
+from .engine.digest import actionable_subregions
 from .engine.main import normalize_orders
 
 
 class GameListView(ListView):
-    queryset = models.Game.objects.annotate(
-        t=Max('turn__generated')).order_by('-t')
+    paginate_by = 25
+
+    queryset = models.Game.objects.select_related('latest_turn').defer(
+        'latest_turn__legal_orders', 'latest_turn__packed_board'
+    ).order_by('-last_generated')
 
 
 class GameDetailView(DetailView):
-    model = models.Game
+    queryset = models.Game.objects.select_related('latest_turn')
 
     def get_context_data(self, **kwargs):
         season, year = self.kwargs.get('season'), self.kwargs.get('year')
@@ -42,7 +44,7 @@ class GameDetailView(DetailView):
 
 
 class GameMasterView(DetailView, BaseFormView):
-    model = models.Game
+    queryset = models.Game.objects.select_related('latest_turn')
     form_class = forms.GameMasterForm
     template_name = 'diplomacy/game_master.html'
 
@@ -65,45 +67,44 @@ class GameMasterView(DetailView, BaseFormView):
 
     def get_object(self, queryset=None):
         obj = super(GameMasterView, self).get_object(queryset)
-        if self.request.user != obj.owner:
+        if self.request.user.pk != obj.owner_id:
             raise PermissionDenied
         return obj
 
     def get_context_data(self, **kwargs):
         turn = self.object.current_turn()
-        context = {'actors': 0}
+        context = {'turn': turn, 'actors': 0}
 
         if turn:
-            units = turn.get_units()
-            owns = turn.get_ownership()
-
-            builds = builds_available(units, owns)
-            actors = actionable_subregions(turn.as_data(), units, owns)
-            context = {
-                'actors': sum(
-                    len(actorset) if turn.season != 'FA' else abs(builds.get(g, 0))
-                    for g, actorset in actors.items()
-                )
-            }
+            board = turn.get_board()
+            builds = board.builds
+            actors = actionable_subregions(turn.as_data(), board.units, board.owns,
+                                           board=board)
+            context['actors'] = sum(
+                len(actorset) if turn.season != 'FA' else abs(builds.get(g, 0))
+                for g, actorset in actors.items()
+            )
 
         context.update(**kwargs)
         return super(GameMasterView, self).get_context_data(**context)
 
     def form_valid(self, form):
-        # FIXME: We should validate the input plus state.
+        # FIXME: We should validate the input plus state.  Only the state
+        # is saved, since the current turn held by self.object may have
+        # been generated past since it was loaded.
         if self.request.POST.get('activate') and self.object.state == 'S':
             self.object.activate()
         if self.request.POST.get('generate') and self.object.state == 'A':
-            self.object.generate()
+            self.object.generate(number=form.cleaned_data['turn'])
         if self.request.POST.get('pause') and self.object.state == 'A':
             self.object.state = 'P'
-            self.object.save()
+            self.object.save(update_fields=['state'])
         if self.request.POST.get('close') and self.object.state == 'A':
             self.object.state = 'F'
-            self.object.save()
+            self.object.save(update_fields=['state'])
         if self.request.POST.get('unpause') and self.object.state == 'P':
             self.object.state = 'A'
-            self.object.save()
+            self.object.save(update_fields=['state'])
         return super(GameMasterView, self).form_valid(form)
 
     def get_success_url(self):
@@ -113,7 +114,7 @@ class GameMasterView(DetailView, BaseFormView):
 
 class OrdersView(DetailView, BaseFormView):
     model = models.Government
-    slug_field = 'power__iexact'
+    slug_field = 'power'
 
     form_class = formset_factory(form=forms.OrderForm,
                                  formset=forms.OrderFormSet,
@@ -127,6 +128,7 @@ class OrdersView(DetailView, BaseFormView):
 
     def get(self, request, **kwargs):
         self.object = self.get_object()
+        self.turn = self.object.game.current_turn()
         form_class = self.get_form_class()
         form = self.get_form(form_class)
         return self.render_to_response(
@@ -136,27 +138,31 @@ class OrdersView(DetailView, BaseFormView):
 
     def post(self, request, *args, **kwargs):
         self.object = self.get_object()
+        self.turn = self.object.game.current_turn()
         return super(OrdersView, self).post(request, *args, **kwargs)
 
     def get_queryset(self):
         return self.model.objects.filter(
-            game__slug=self.kwargs.get('gameslug', ''))
+            game__slug=self.kwargs.get('gameslug', '')).select_related('game__latest_turn')
 
     def get_object(self, queryset=None):
+        # Power tokens are all lower case.  Matching them exactly, rather
+        # than with iexact, lets the (game, power) index be used.
+        self.kwargs[self.slug_url_kwarg] = self.kwargs.get(self.slug_url_kwarg, '').lower()
         obj = super(OrdersView, self).get_object(queryset)
 
-        if self.request.user != obj.user:
+        if self.request.user.pk != obj.user_id:
             raise PermissionDenied
         return obj
 
     def get_context_data(self, **kwargs):
         order_filter = {
-            'unit_fixed': (self.object.game.current_turn().season != 'FA'),
-            'tree': self.object.filter_orders()
+            'unit_fixed': (self.turn.season != 'FA'),
+            'tree': self.object.filter_orders(self.turn)
         }
         context = {
             'game': self.object.game,
-            'turn': self.object.game.current_turn(),
+            'turn': self.turn,
             'current': True,
             'order_filter': json.dumps(order_filter),
         }
@@ -164,12 +170,11 @@ class OrdersView(DetailView, BaseFormView):
         return super(OrdersView, self).get_context_data(**context)
 
     def get_initial(self):
-        turn = self.object.game.current_turn()
-        orders = turn.get_orders()
-        units = turn.get_units()
-        owns = turn.get_ownership()
+        turn = self.turn
+        board = turn.get_board()
 
-        normalized = normalize_orders(turn.as_data(), orders, units, owns)
+        normalized = normalize_orders(turn.as_data(), turn.get_orders(),
+                                      board.units, board.owns, board=board)
         return [
             {'actor': o['actor'],
              'action': o['action'],
@@ -184,6 +189,7 @@ class OrdersView(DetailView, BaseFormView):
         kwargs = super(OrdersView, self).get_form_kwargs()
         kwargs.update(
             government=self.object,
+            turn=self.turn,
         )
         return kwargs
 
@@ -191,11 +197,13 @@ class OrdersView(DetailView, BaseFormView):
         orders = form.save(commit=False)
         post = models.OrderPost.objects.create(
             government=self.object,
-            turn=self.object.game.current_turn()
+            turn=self.turn
         )
         for order in orders:
             order.post = post
-            order.save()
+        models.Order.objects.bulk_create(orders)
+        models.Standing.objects.filter(
+            turn=self.turn, government=self.object).update(orders_submitted=True)
 
         messages.success(self.request, "Your orders have been submitted.",
                          fail_silently=True)
@@ -212,7 +220,7 @@ class OrdersView(DetailView, BaseFormView):
 
 
 class MapView(DetailView):
-    model = models.Game
+    queryset = models.Game.objects.select_related('latest_turn')
     template_name = 'diplomacy/map.html'
 
     def get_context_data(self, **kwargs):